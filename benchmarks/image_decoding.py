@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Benchmark of image decoding for ``ImageReader``:
+full resolution decoding vs reduced resolution decoding
+(``target_size``), both followed by resize to the target size.
+
+Example:
+
+    .. code:: bash
+
+        $ python benchmarks/image_decoding.py \\
+            --in-csv=./data/input.csv \\
+            --img-datapath=./data/images \\
+            --img-col="filename" \\
+            --target-size=224
+
+    Without ``--in-csv``, synthetic JPEG images are generated.
+"""
+
+import os
+import time
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+import cv2
+
+from catalyst.data.reader import ImageReader
+
+cv2.setNumThreads(0)
+
+
+def build_args(parser):
+    parser.add_argument("--in-csv", type=str, default=None)
+    parser.add_argument("--img-datapath", type=str, default=None)
+    parser.add_argument("--img-col", type=str, default="filename")
+    parser.add_argument("--target-size", type=int, default=224)
+    parser.add_argument(
+        "--num-images",
+        type=int,
+        default=200,
+        help="Number of images to decode"
+    )
+    parser.add_argument(
+        "--synthetic-size",
+        type=int,
+        default=1024,
+        help="Size of synthetic images, if no csv specified"
+    )
+    return parser
+
+
+def prepare_synthetic(dirname, num_images, image_size):
+    rng = np.random.RandomState(42)
+    # smooth images are closer to photos than pure noise
+    base = rng.randint(0, 256, (image_size // 16, image_size // 16, 3))
+    rows = []
+    for i in range(num_images):
+        img = cv2.resize(
+            np.uint8((base + i) % 256), (image_size, image_size),
+            interpolation=cv2.INTER_CUBIC
+        )
+        filename = f"{i:05d}.jpg"
+        cv2.imwrite(os.path.join(dirname, filename), img)
+        rows.append({"filename": filename})
+    return rows
+
+
+def benchmark(reader, rows, target_size):
+    start = time.perf_counter()
+    for row in rows:
+        img = reader(row)["image"]
+        cv2.resize(img, (target_size, target_size))
+    elapsed = time.perf_counter() - start
+    return len(rows) / elapsed
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if args.in_csv is not None:
+            rows = pd.read_csv(args.in_csv).to_dict("records")
+            rows = rows[:args.num_images]
+            datapath, img_col = args.img_datapath, args.img_col
+        else:
+            rows = prepare_synthetic(
+                tmpdir, args.num_images, args.synthetic_size
+            )
+            datapath, img_col = tmpdir, "filename"
+
+        readers = {
+            "full": ImageReader(
+                input_key=img_col, output_key="image", datapath=datapath
+            ),
+            "reduced": ImageReader(
+                input_key=img_col,
+                output_key="image",
+                datapath=datapath,
+                target_size=args.target_size
+            ),
+        }
+
+        results = {}
+        for name, reader in readers.items():
+            benchmark(reader, rows[:10], args.target_size)  # warmup
+            results[name] = benchmark(reader, rows, args.target_size)
+            print(f"{name:>10}: {results[name]:8.1f} images/sec")
+        print(f"   speedup: {results['reduced'] / results['full']:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    main(parser.parse_args())
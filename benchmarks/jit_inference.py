@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Benchmark of the inference throughput
+of the eager model vs the TorchScript compiled model
+(``SupervisedRunner.infer(..., jit="trace")``).
+
+Example:
+
+    .. code:: bash
+
+        $ python benchmarks/jit_inference.py \\
+            --mode=trace \\
+            --batch-size=64 \\
+            --device=cpu
+"""
+
+import time
+import argparse
+
+import torch
+import torch.nn as nn
+
+from catalyst.dl.utils import UtilsFactory
+
+
+def build_args(parser):
+    parser.add_argument(
+        "--mode", type=str, default="trace", choices=["trace", "script"]
+    )
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--num-batches", type=int, default=20)
+    parser.add_argument("--device", type=str, default="cpu")
+    return parser
+
+
+def get_model():
+    return nn.Sequential(
+        nn.Conv2d(3, 64, 3, padding=1), nn.BatchNorm2d(64), nn.ReLU(),
+        nn.Conv2d(64, 128, 3, stride=2, padding=1),
+        nn.BatchNorm2d(128), nn.ReLU(),
+        nn.Conv2d(128, 256, 3, stride=2, padding=1),
+        nn.BatchNorm2d(256), nn.ReLU(),
+        nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(256, 10)
+    )
+
+
+def benchmark(model, features, args):
+    device = torch.device(args.device)
+    with torch.no_grad():
+        for _ in range(3):  # warmup
+            model(features)
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        for _ in range(args.num_batches):
+            model(features)
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+    elapsed = time.perf_counter() - start
+    return args.num_batches / elapsed
+
+
+def main(args):
+    device = torch.device(args.device)
+    torch.manual_seed(42)
+    model = get_model().to(device).eval()
+    features = torch.randn(args.batch_size, 3, 64, 64, device=device)
+    jit_model = UtilsFactory.get_jit_model(
+        model, example_input=features, mode=args.mode
+    )
+    with torch.no_grad():
+        diff = (model(features) - jit_model(features)).abs().max().item()
+
+    results = {
+        "eager": benchmark(model, features, args),
+        args.mode: benchmark(jit_model, features, args),
+    }
+    for name, value in results.items():
+        print(f"{name:>10}: {value:8.1f} batches/sec")
+    print(f"   speedup: {results[args.mode] / results['eager']:8.2f}x")
+    print(f"  max diff: {diff:.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    main(parser.parse_args())
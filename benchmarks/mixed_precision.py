@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmark of the training step throughput
+in full precision vs mixed precision (``state_params.mixed_precision``):
+bfloat16 autocast on CPU, float16 autocast with loss scaling on CUDA.
+
+Example:
+
+    .. code:: bash
+
+        $ python benchmarks/mixed_precision.py \\
+            --model=conv \\
+            --batch-size=64 \\
+            --device=cpu
+"""
+
+import time
+import argparse
+
+import torch
+import torch.nn as nn
+
+from catalyst.dl.callbacks import OptimizerCallback
+from catalyst.dl.fp16 import autocast, create_grad_scaler, get_autocast_dtype
+
+
+def build_args(parser):
+    parser.add_argument(
+        "--model", type=str, default="conv", choices=["conv", "mlp"]
+    )
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--num-steps", type=int, default=20)
+    parser.add_argument("--device", type=str, default="cpu")
+    return parser
+
+
+def get_model(name):
+    if name == "mlp":
+        model = nn.Sequential(
+            nn.Linear(1024, 4096), nn.ReLU(),
+            nn.Linear(4096, 4096), nn.ReLU(),
+            nn.Linear(4096, 10)
+        )
+        input_shape = (1024, )
+    else:
+        model = nn.Sequential(
+            nn.Conv2d(3, 64, 3, padding=1), nn.BatchNorm2d(64), nn.ReLU(),
+            nn.Conv2d(64, 128, 3, stride=2, padding=1),
+            nn.BatchNorm2d(128), nn.ReLU(),
+            nn.Conv2d(128, 256, 3, stride=2, padding=1),
+            nn.BatchNorm2d(256), nn.ReLU(),
+            nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(256, 10)
+        )
+        input_shape = (3, 64, 64)
+    return model, input_shape
+
+
+def benchmark(args, mixed_precision):
+    device = torch.device(args.device)
+    torch.manual_seed(42)
+    model, input_shape = get_model(args.model)
+    model = model.to(device)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.01, momentum=0.9)
+    criterion = nn.CrossEntropyLoss()
+    dtype = get_autocast_dtype(mixed_precision, device)
+    grad_scaler = create_grad_scaler(device, dtype)
+
+    features = torch.randn(args.batch_size, *input_shape, device=device)
+    targets = torch.randint(0, 10, (args.batch_size, ), device=device)
+
+    def step():
+        with autocast(device, dtype):
+            loss = criterion(model(features), targets)
+        if grad_scaler is not None:
+            loss = grad_scaler.scale(loss)
+        loss.backward()
+        OptimizerCallback.grad_step(
+            optimizer=optimizer, grad_scaler=grad_scaler
+        )
+        model.zero_grad()
+
+    for _ in range(3):  # warmup
+        step()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(args.num_steps):
+        step()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    elapsed = time.perf_counter() - start
+    return args.num_steps * args.batch_size / elapsed
+
+
+def main(args):
+    results = {}
+    for name, mixed_precision in [("fp32", False), ("mixed", True)]:
+        results[name] = benchmark(args, mixed_precision)
+        print(f"{name:>10}: {results[name]:8.1f} samples/sec")
+    print(f"   speedup: {results['mixed'] / results['fp32']:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    main(parser.parse_args())
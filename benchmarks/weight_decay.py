@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Benchmark of decoupled weight decay in ``OptimizerCallback.grad_step``:
+previous per-parameter out-of-place update vs in-place multi-tensor update.
+
+Example:
+
+    .. code:: bash
+
+        $ python benchmarks/weight_decay.py \\
+            --num-params=300 \\
+            --param-size=16384 \\
+            --device=cuda
+"""
+
+import time
+import argparse
+
+import torch
+
+from catalyst.dl.callbacks import OptimizerCallback
+
+
+def build_args(parser):
+    parser.add_argument(
+        "--num-params",
+        type=int,
+        default=300,
+        help="Number of parameter tensors"
+    )
+    parser.add_argument(
+        "--param-size",
+        type=int,
+        default=16384,
+        help="Number of elements in every parameter tensor"
+    )
+    parser.add_argument("--num-steps", type=int, default=200)
+    parser.add_argument("--device", type=str, default="cpu")
+    return parser
+
+
+def previous_weight_decay(param_groups, weight_decay):
+    for group in param_groups:
+        for param in group["params"]:
+            param.data = param.data.add(
+                param.data, alpha=-weight_decay * group["lr"]
+            )
+
+
+def fused_weight_decay(param_groups, weight_decay):
+    for group in param_groups:
+        OptimizerCallback.decay_weights(
+            group["params"], weight_decay, group["lr"]
+        )
+
+
+def benchmark(fn, param_groups, num_steps, device):
+    fn(param_groups, 1e-4)  # warmup
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_steps):
+        fn(param_groups, 1e-4)
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / num_steps * 1e3
+
+
+def main(args):
+    device = torch.device(args.device)
+    params = [
+        torch.nn.Parameter(torch.randn(args.param_size, device=device))
+        for _ in range(args.num_params)
+    ]
+    param_groups = [{"params": params, "lr": 1e-3}]
+
+    results = {}
+    for name, fn in [
+        ("previous", previous_weight_decay),
+        ("fused", fused_weight_decay),
+    ]:
+        results[name] = benchmark(fn, param_groups, args.num_steps, device)
+        print(f"{name:>10}: {results[name]:8.3f} ms/step")
+    print(f"   speedup: {results['previous'] / results['fused']:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    main(parser.parse_args())
@@ -122,7 +122,10 @@ def main(args, _=None):
     images_df = list(images_df.to_dict("index").values())
 
     open_fn = ImageReader(
-        input_key=args.img_col, output_key="image", datapath=args.datapath
+        input_key=args.img_col,
+        output_key="image",
+        datapath=args.datapath,
+        target_size=IMG_SIZE
     )
 
     dataloader = UtilsFactory.create_loader(
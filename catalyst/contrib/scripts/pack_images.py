@@ -0,0 +1,86 @@
+import os
+import csv
+import argparse
+import pandas as pd
+from tqdm import tqdm
+
+
+def build_args(parser):
+    parser.add_argument(
+        "--in-csv",
+        type=str,
+        required=True,
+        help="Path to data in `.csv`."
+    )
+    parser.add_argument(
+        "--img-datapath",
+        type=str,
+        default=None,
+        help="Path to image data folder"
+    )
+    parser.add_argument(
+        "--img-col",
+        type=str,
+        required=True,
+        help="Column in csv which represents relative path to image "
+             "in image data folder"
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=str,
+        required=True,
+        help="Path to output directory with shards and `index.csv`"
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=1024,
+        help="Maximum size of one shard file in MB"
+    )
+
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    args = parser.parse_args()
+    return args
+
+
+def main(args, _=None):
+    datapath = args.img_datapath or ""
+    max_shard_bytes = args.shard_size * 2 ** 20
+
+    df = pd.read_csv(args.in_csv)
+    images = df[args.img_col].dropna().astype(str).unique()
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    shard, offset = 0, 0
+    fout = open(os.path.join(args.out_dir, f"{shard:05d}.shard"), "wb")
+    with open(os.path.join(args.out_dir, "index.csv"), "w") as index_file:
+        index = csv.writer(index_file)
+        index.writerow(["key", "shard", "offset", "length"])
+
+        for image_name in tqdm(images):
+            with open(os.path.join(datapath, image_name), "rb") as fin:
+                content = fin.read()
+
+            if offset > 0 and offset + len(content) > max_shard_bytes:
+                fout.close()
+                shard, offset = shard + 1, 0
+                fout = open(
+                    os.path.join(args.out_dir, f"{shard:05d}.shard"), "wb"
+                )
+
+            fout.write(content)
+            index.writerow([image_name, shard, offset, len(content)])
+            offset += len(content)
+    fout.close()
+
+    print(f"Packed {len(images)} images into {shard + 1} shards")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
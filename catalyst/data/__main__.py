@@ -42,19 +42,33 @@ Examples:
             --num-workers=16 \\
             --verbose
 
+    4. **pack-images** packs images from your csv into large shard files
+    with an offset index, to read them with
+    :class:`catalyst.data.reader.ShardImageReader`
+
+    .. code:: bash
+
+        $ catalyst-data pack-images \\
+            --in-csv=./data/input.csv \\
+            --img-datapath=./data/images \\
+            --img-col="filename" \\
+            --out-dir=./data/shards \\
+            --shard-size=1024
+
 """
 
 from collections import OrderedDict
 from argparse import ArgumentParser, RawTextHelpFormatter
 
 from catalyst.contrib.scripts import check_images, \
-    image2embedding, tag2label, split_dataframe
+    image2embedding, tag2label, split_dataframe, pack_images
 
 COMMANDS = OrderedDict(
     [
         ("tag2label", tag2label), ("check-images", check_images),
         ("image2embedding", image2embedding),
-        ("split-dataframe", split_dataframe)
+        ("split-dataframe", split_dataframe),
+        ("pack-images", pack_images)
     ]
 )
 
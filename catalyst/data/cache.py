@@ -0,0 +1,462 @@
+import os
+import sys
+import mmap
+import pickle
+import multiprocessing as mp
+from collections import OrderedDict
+from typing import Any, Dict
+
+import numpy as np
+
+
+def get_nbytes(value: Any) -> int:
+    """
+    Estimates memory used by a sample
+
+    Args:
+        value: sample, usually a dict with numpy arrays
+
+    Returns:
+        int: approximate size in bytes
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            get_nbytes(item) for item in value.values()
+        )
+    elif isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(get_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class SharedMemoryCache:
+    """
+    Sample cache backed by an anonymous shared memory segment.
+
+    The segment is allocated in the parent process,
+    so it is inherited (not copied) by every forked ``DataLoader`` worker.
+    Samples cached by any worker become visible to all other workers
+    and survive between epochs.
+
+    Samples are pickled into an append-only buffer
+    limited by ``max_bytes``. When the budget is exhausted,
+    new samples are not cached anymore.
+
+    Note:
+        Works with ``fork`` multiprocessing start method only
+        (the default one on Linux).
+    """
+
+    def __init__(self, length: int, max_bytes: int):
+        """
+        Args:
+            length (int): number of samples in the dataset
+            max_bytes (int): memory budget for serialized samples, in bytes
+        """
+        self.length = length
+        self.max_bytes = max_bytes
+
+        # header: [allocated bytes, index offsets, index sizes],
+        # size is 0 for missing samples and -1 for samples being written
+        header_bytes = (1 + 2 * length) * 8
+        self._memory = mmap.mmap(-1, header_bytes + max_bytes)
+        header = np.frombuffer(
+            self._memory, dtype=np.int64, count=1 + 2 * length
+        )
+        self._allocated = header[:1]
+        self._offsets = header[1:1 + length]
+        self._sizes = header[1 + length:]
+        self._data = np.frombuffer(
+            self._memory, dtype=np.uint8, offset=header_bytes
+        )
+        self._lock = mp.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: number of bytes used by cached samples
+        """
+        return int(self._allocated[0])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._sizes > 0))
+
+    def __contains__(self, index: int) -> bool:
+        return self._sizes[index] > 0
+
+    def get(self, index: int, default: Any = None) -> Any:
+        """Gets sample from the cache
+
+        Args:
+            index (int): index of the sample in the dataset
+            default: value to return if sample was not cached
+
+        Returns:
+            cached sample or ``default``
+        """
+        size = int(self._sizes[index])
+        if size <= 0:
+            return default
+        offset = int(self._offsets[index])
+        return pickle.loads(self._data[offset:offset + size])
+
+    def __setitem__(self, index: int, value: Any):
+        """Saves sample to the cache if there is enough free memory
+
+        Args:
+            index (int): index of the sample in the dataset
+            value: sample to cache
+        """
+        if self._sizes[index] != 0:
+            return
+        buffer = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(buffer)
+
+        with self._lock:
+            offset = int(self._allocated[0])
+            # other worker has already stored or reserved the sample
+            if self._sizes[index] != 0 or offset + size > self.max_bytes:
+                return
+            self._allocated[0] = offset + size
+            self._sizes[index] = -1
+
+        self._data[offset:offset + size] = np.frombuffer(
+            buffer, dtype=np.uint8
+        )
+        self._offsets[index] = offset
+        # size is published last, so readers never see a partial sample
+        self._sizes[index] = size
+
+
+class MemmapSpill:
+    """
+    Second cache tier, that keeps numpy arrays of evicted samples
+    in a local memory-mapped file.
+
+    The file is used as a ring buffer: when it is full,
+    the oldest samples are overwritten.
+    Samples without numpy arrays are not spilled.
+
+    Note:
+        The file is created lazily, so every ``DataLoader`` worker
+        gets its own file (process id is appended to ``path``).
+        The file is unlinked right after mapping, so it is removed
+        when the process exits.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Args:
+            path (str): path prefix of the memory-mapped file
+            max_bytes (int): file size, in bytes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._pid = None
+        self._memmap = None
+        self._position = 0
+        # key -> (start, end, arrays meta, other fields)
+        self._entries: Dict[Any, tuple] = OrderedDict()
+
+    def _open(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            filename = f"{self.path}.{pid}"
+            os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+            self._memmap = np.memmap(
+                filename, dtype=np.uint8, mode="w+", shape=(self.max_bytes, )
+            )
+            # the mapping keeps the data, the name is not needed anymore
+            os.remove(filename)
+            self._position = 0
+            self._entries = OrderedDict()
+            self._pid = pid
+        return self._memmap
+
+    def _allocate(self, size: int) -> int:
+        start = self._position
+        if start + size > self.max_bytes:
+            # samples at the tail of the file are the oldest ones
+            while len(self._entries) > 0 \
+                    and next(iter(self._entries.values()))[0] >= start:
+                self._entries.popitem(last=False)
+            start = 0
+        end = start + size
+        # drop the oldest samples overwritten by the new one
+        while len(self._entries) > 0:
+            start_, end_, _, _ = next(iter(self._entries.values()))
+            if start_ < end and start < end_:
+                self._entries.popitem(last=False)
+            else:
+                break
+        self._position = end
+        return start
+
+    def __contains__(self, key) -> bool:
+        return self._pid == os.getpid() and key in self._entries
+
+    def __setitem__(self, key, value: Dict):
+        arrays = {
+            k: v
+            for k, v in value.items() if isinstance(v, np.ndarray)
+        } if isinstance(value, dict) else {}
+        size = sum(v.nbytes for v in arrays.values())
+        if len(arrays) == 0 or size > self.max_bytes:
+            return
+
+        memmap = self._open()
+        self.discard(key)
+        start = self._allocate(size)
+
+        arrays_meta, fields = {}, {}
+        offset = start
+        for k, v in value.items():
+            if k in arrays:
+                v = np.ascontiguousarray(v)
+                memmap[offset:offset + v.nbytes] = v.reshape(-1).view(np.uint8)
+                arrays_meta[k] = (offset, v.shape, v.dtype)
+                offset += v.nbytes
+            else:
+                fields[k] = v
+        self._entries[key] = (start, start + size, arrays_meta, fields)
+
+    def discard(self, key) -> None:
+        """Removes sample from the index without reading it"""
+        if key in self:
+            del self._entries[key]
+
+    def pop(self, key, default: Any = None) -> Any:
+        """Gets sample from the spill file and removes it from the index
+
+        Args:
+            key: key of the sample
+            default: value to return if sample was not spilled
+
+        Returns:
+            spilled sample or ``default``
+        """
+        if key not in self:
+            return default
+
+        _, _, arrays_meta, fields = self._entries.pop(key)
+        value = dict(fields)
+        for k, (offset, shape, dtype) in arrays_meta.items():
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            value[k] = np.array(self._memmap[offset:offset + nbytes]) \
+                .view(dtype).reshape(shape)
+        return value
+
+
+class _BytesBoundedCache:
+    """
+    Base class for RAM caches limited by number of bytes
+    with optional :class:`MemmapSpill` second tier.
+    """
+
+    def __init__(self, max_bytes: int, spill: MemmapSpill = None):
+        """
+        Args:
+            max_bytes (int): memory budget for cached samples, in bytes
+            spill (MemmapSpill): second tier for evicted samples
+        """
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.nbytes = 0
+
+    def _evict(self, key, value, nbytes: int):
+        self.nbytes -= nbytes
+        if self.spill is not None:
+            self.spill[key] = value
+
+    def _lookup(self, key):
+        raise NotImplementedError()
+
+    def _insert(self, key, value, nbytes: int):
+        raise NotImplementedError()
+
+    def get(self, key, default: Any = None) -> Any:
+        value = self._lookup(key)
+        if value is None and self.spill is not None:
+            value = self.spill.pop(key)
+            if value is not None:
+                self[key] = value
+        return default if value is None else value
+
+    def __setitem__(self, key, value: Any):
+        nbytes = get_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        self._insert(key, value, nbytes)
+
+
+class LRUCache(_BytesBoundedCache):
+    """
+    Least-recently-used cache limited by number of bytes.
+    """
+
+    def __init__(self, max_bytes: int, spill: MemmapSpill = None):
+        super().__init__(max_bytes=max_bytes, spill=spill)
+        self._items = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def _lookup(self, key):
+        item = self._items.get(key, None)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def _insert(self, key, value, nbytes: int):
+        if key in self._items:
+            self.nbytes -= self._items.pop(key)[1]
+        self._items[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            key_, (value_, nbytes_) = self._items.popitem(last=False)
+            self._evict(key_, value_, nbytes_)
+
+
+class ARCCache(_BytesBoundedCache):
+    """
+    Adaptive replacement cache limited by number of bytes.
+
+    Keeps recently (``T1``) and frequently (``T2``) used samples,
+    and adapts the balance between them with ghost lists
+    (``B1``, ``B2``) of recently evicted keys.
+    Unlike LRU, it is resistant to the scan over the whole dataset,
+    which happens every epoch.
+
+    Based on "ARC: A Self-Tuning, Low Overhead Replacement Cache"
+    by N. Megiddo and D. Modha.
+    """
+
+    def __init__(self, max_bytes: int, spill: MemmapSpill = None):
+        super().__init__(max_bytes=max_bytes, spill=spill)
+        # target size of T1, in bytes
+        self.p = 0
+        self._t1, self._t2 = OrderedDict(), OrderedDict()
+        self._b1, self._b2 = OrderedDict(), OrderedDict()
+        self._t1_bytes, self._b1_bytes, self._b2_bytes = 0, 0, 0
+
+    def __len__(self) -> int:
+        return len(self._t1) + len(self._t2)
+
+    def __contains__(self, key) -> bool:
+        return key in self._t1 or key in self._t2
+
+    def _lookup(self, key):
+        if key in self._t1:
+            value, nbytes = self._t1.pop(key)
+            self._t1_bytes -= nbytes
+            self._t2[key] = (value, nbytes)
+            return value
+        if key in self._t2:
+            self._t2.move_to_end(key)
+            return self._t2[key][0]
+        return None
+
+    def _replace(self, in_b2: bool):
+        if len(self._t1) > 0 and (
+            self._t1_bytes > self.p
+            or (in_b2 and self._t1_bytes == self.p)
+            or len(self._t2) == 0
+        ):
+            key, (value, nbytes) = self._t1.popitem(last=False)
+            self._t1_bytes -= nbytes
+            self._b1[key] = nbytes
+            self._b1_bytes += nbytes
+        else:
+            key, (value, nbytes) = self._t2.popitem(last=False)
+            self._b2[key] = nbytes
+            self._b2_bytes += nbytes
+        self._evict(key, value, nbytes)
+
+    def _trim_ghosts(self):
+        while len(self._b1) > 0 \
+                and self._t1_bytes + self._b1_bytes > self.max_bytes:
+            self._b1_bytes -= self._b1.popitem(last=False)[1]
+        while len(self._b2) > 0 and \
+                self.nbytes + self._b1_bytes + self._b2_bytes \
+                > 2 * self.max_bytes:
+            self._b2_bytes -= self._b2.popitem(last=False)[1]
+
+    def _insert(self, key, value, nbytes: int):
+        if key in self:
+            return
+
+        in_b2 = False
+        if key in self._b1:
+            delta = max(1, self._b2_bytes / max(self._b1_bytes, 1)) * nbytes
+            self.p = min(self.max_bytes, self.p + delta)
+            self._b1_bytes -= self._b1.pop(key)
+            target = self._t2
+        elif key in self._b2:
+            delta = max(1, self._b1_bytes / max(self._b2_bytes, 1)) * nbytes
+            self.p = max(0, self.p - delta)
+            self._b2_bytes -= self._b2.pop(key)
+            target = self._t2
+            in_b2 = True
+        else:
+            target = self._t1
+
+        while self.nbytes + nbytes > self.max_bytes:
+            self._replace(in_b2)
+
+        target[key] = (value, nbytes)
+        self.nbytes += nbytes
+        if target is self._t1:
+            self._t1_bytes += nbytes
+        self._trim_ghosts()
+
+
+def get_cache(
+    mode: str = "local",
+    length: int = None,
+    max_bytes: int = None,
+    spill_path: str = None,
+    spill_bytes: int = None
+):
+    """
+    Creates sample cache for :class:`catalyst.data.dataset.ListDataset`
+
+    Args:
+        mode (str): cache type,
+            must be one of ["local", "shared", "lru", "arc"]
+            ``local`` - plain per-process dict without any limits,
+            ``shared`` - :class:`SharedMemoryCache`
+            visible to all ``DataLoader`` workers,
+            ``lru`` - :class:`LRUCache`,
+            ``arc`` - :class:`ARCCache`
+        length (int): number of samples in the dataset
+        max_bytes (int): cache memory budget, in bytes
+        spill_path (str): path prefix of :class:`MemmapSpill` file
+            for samples evicted from ``lru`` and ``arc`` caches
+        spill_bytes (int): size of :class:`MemmapSpill` file, in bytes
+
+    Returns:
+        sample cache
+    """
+    if mode == "local":
+        return dict()
+    elif mode == "shared":
+        assert length is not None and max_bytes is not None, \
+            "shared cache requires dataset length and memory budget"
+        return SharedMemoryCache(length=length, max_bytes=max_bytes)
+    elif mode in ["lru", "arc"]:
+        assert max_bytes is not None, \
+            f"{mode} cache requires memory budget"
+        spill = None
+        if spill_path is not None:
+            assert spill_bytes is not None, "spill requires file size"
+            spill = MemmapSpill(path=spill_path, max_bytes=spill_bytes)
+        cache_fn = LRUCache if mode == "lru" else ARCCache
+        return cache_fn(max_bytes=max_bytes, spill=spill)
+    else:
+        raise NotImplementedError(f"unknown cache mode: {mode}")
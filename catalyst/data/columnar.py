@@ -0,0 +1,130 @@
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+
+class StringColumn:
+    """
+    Arrow-style string column: all strings are stored
+    in one utf-8 buffer with an array of offsets,
+    so the column has no per-string Python objects.
+    Values, that are not strings (for example ``NaN``),
+    are kept as is in a sparse mapping.
+    """
+
+    def __init__(self, values: List[Any]):
+        """
+        Args:
+            values (List[Any]): column values
+        """
+        self.missing = {
+            i: x
+            for i, x in enumerate(values) if not isinstance(x, str)
+        }
+        encoded = [
+            x.encode("utf-8") if isinstance(x, str) else b""
+            for x in values
+        ]
+        lengths = np.fromiter(
+            (len(x) for x in encoded), dtype=np.int64, count=len(encoded)
+        )
+        self.offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        if index in self.missing:
+            return self.missing[index]
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.offsets.nbytes
+
+
+class ColumnarList:
+    """
+    Read-only list of annotation dicts, stored by columns in numpy arrays.
+
+    Can be used instead of ``List[Dict]`` in
+    :class:`catalyst.data.dataset.ListDataset`: every row is still returned
+    as a dict, but the storage consists of a few large buffers
+    instead of millions of Python objects.
+    This reduces memory usage and avoids copy-on-write page faults
+    in forked ``DataLoader`` workers (reference counting does not
+    touch the column buffers).
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        """
+        Args:
+            columns (Dict[str, Any]): mapping from column name to values
+        """
+        self.columns = {}
+        length = None
+        for name, values in columns.items():
+            values = np.asarray(values)
+            if values.dtype.kind in "OUS":
+                values = StringColumn(values.tolist())
+            self.columns[name] = values
+            assert length is None or len(values) == length, \
+                "all columns should have the same length"
+            length = len(values)
+        self._length = length or 0
+
+    @classmethod
+    def from_dataframe(cls, dataframe) -> "ColumnarList":
+        """
+        Creates columnar list from dataframe (without indexes)
+
+        Args:
+            dataframe (DataFrame): input dataframe
+
+        Returns:
+            ColumnarList: columnar list of rows
+        """
+        return cls(
+            {
+                name: dataframe[name].values
+                for name in dataframe.columns
+            }
+        )
+
+    def column(self, name: str) -> Any:
+        """
+        Args:
+            name (str): column name
+
+        Returns:
+            column values, np.ndarray for numeric columns
+        """
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("index out of range")
+
+        row = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if isinstance(value, np.generic):
+                value = value.item()
+            row[name] = value
+        return row
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._length):
+            yield self[i]
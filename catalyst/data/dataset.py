@@ -2,6 +2,7 @@ import random
 from typing import List, Dict, Callable, Any
 from torch.utils.data import Dataset
 from catalyst.utils.misc import merge_dicts
+from catalyst.data.cache import get_cache
 
 
 class ListDataset(Dataset):
@@ -15,7 +16,11 @@ class ListDataset(Dataset):
         open_fn: Callable,
         dict_transform: Callable = None,
         cache_prob: float = -1,
-        cache_transforms: bool = False
+        cache_transforms: bool = False,
+        cache_mode: str = "local",
+        cache_size: int = None,
+        cache_spill_path: str = None,
+        cache_spill_size: int = None
     ):
         """
         Args:
@@ -32,13 +37,29 @@ class ListDataset(Dataset):
                 for speedup
             cache_transforms (bool): flag if you need
                 to cache sample after transformations to RAM
+            cache_mode (str): cache type to use,
+                ``local`` - per-process dict (every worker has its own copy),
+                ``shared`` - shared memory cache, visible to all workers,
+                ``lru``/``arc`` - per-process cache with eviction,
+                for more info see :func:`catalyst.data.cache.get_cache`
+            cache_size (int): cache memory budget in bytes,
+                required for ``shared``, ``lru`` and ``arc`` caches
+            cache_spill_path (str): path prefix of memory-mapped file
+                to keep samples evicted from ``lru``/``arc`` caches
+            cache_spill_size (int): size of spill file in bytes
         """
         self.data = list_data
         self.open_fn = open_fn
         self.dict_transform = dict_transform
         self.cache_prob = cache_prob
         self.cache_transforms = cache_transforms
-        self.cache = dict()
+        self.cache = get_cache(
+            mode=cache_mode,
+            length=len(list_data),
+            max_bytes=cache_size,
+            spill_path=cache_spill_path,
+            spill_bytes=cache_spill_size
+        ) if cache_prob > 0 else dict()
 
     def prepare_new_item(self, index: int):
         row = self.data[index]
@@ -83,6 +104,72 @@ class ListDataset(Dataset):
         return len(self.data)
 
 
+class BatchListDataset(Dataset):
+    """
+    Dataset class, that reads the whole batch in one ``__getitem__`` call
+    with a batched reader (for example
+    :class:`catalyst.data.reader.ReaderCompose`), which implements
+    ``read_batch(rows)``.
+
+    Should be used with a batch sampler and disabled auto-batching:
+
+    .. code-block:: python
+
+        dataset = BatchListDataset(list_data, open_fn=ReaderCompose(...))
+        loader = DataLoader(
+            dataset,
+            sampler=BatchSampler(
+                RandomSampler(dataset), batch_size=256, drop_last=False
+            ),
+            batch_size=None,
+        )
+    """
+
+    def __init__(
+        self,
+        list_data: List[Dict],
+        open_fn: Callable,
+        batch_transform: Callable = None
+    ):
+        """
+        Args:
+            list_data (List[Dict]): list of dicts, that stores
+                you data annotations
+            open_fn (callable): batched reader with ``read_batch(rows)``
+                method, that returns dict of stacked arrays
+            batch_transform (callable): transforms to use
+                on the whole batch dict
+        """
+        assert hasattr(open_fn, "read_batch"), \
+            "open_fn should implement read_batch"
+        self.data = list_data
+        self.open_fn = open_fn
+        self.batch_transform = batch_transform
+
+    def __getitem__(self, indices: List[int]) -> Any:
+        """Gets the batch of elements of the dataset
+
+        Args:
+            indices (List[int]): indices of the elements in the dataset
+        Returns:
+            dict with stacked elements
+        """
+        rows = [self.data[index] for index in indices]
+        batch = self.open_fn.read_batch(rows)
+
+        if self.batch_transform is not None:
+            batch = self.batch_transform(batch)
+
+        return batch
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: length of the dataset (number of samples)
+        """
+        return len(self.data)
+
+
 class MergeDataset(Dataset):
     """
     Abstraction to merge several datasets into one dataset.
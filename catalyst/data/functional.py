@@ -1,17 +1,171 @@
 import os
+from typing import Tuple, Union
 import numpy as np
 import cv2
 import jpeg4py as jpeg
 import torch
 
+# like jpeg4py, reduced decoding returns RGB and ignores EXIF orientation
+_REDUCED_FLAGS = {
+    factor: flag | cv2.IMREAD_IGNORE_ORIENTATION
+    for factor, flag in [
+        (2, cv2.IMREAD_REDUCED_COLOR_2),
+        (4, cv2.IMREAD_REDUCED_COLOR_4),
+        (8, cv2.IMREAD_REDUCED_COLOR_8),
+    ]
+}
+
+
+def get_image_size(buffer) -> Union[Tuple[int, int], None]:
+    """
+    Reads image size from JPEG or PNG header without decoding
+
+    Args:
+        buffer (np.ndarray): encoded image as uint8 array
+
+    Returns:
+        (height, width) of the image or None for unknown formats
+    """
+    if len(buffer) > 24 and bytes(buffer[:8]) == b"\x89PNG\r\n\x1a\n":
+        width = int.from_bytes(bytes(buffer[16:20]), "big")
+        height = int.from_bytes(bytes(buffer[20:24]), "big")
+        return height, width
+
+    if len(buffer) < 4 or buffer[0] != 0xFF or buffer[1] != 0xD8:
+        return None
+
+    # walk through JPEG segments up to the start of frame marker
+    position = 2
+    while position + 9 < len(buffer):
+        if buffer[position] != 0xFF:
+            return None
+        marker = buffer[position + 1]
+        if marker == 0xFF:  # fill byte
+            position += 1
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(
+                bytes(buffer[position + 5:position + 7]), "big"
+            )
+            width = int.from_bytes(
+                bytes(buffer[position + 7:position + 9]), "big"
+            )
+            return height, width
+        length = int.from_bytes(
+            bytes(buffer[position + 2:position + 4]), "big"
+        )
+        position += 2 + length
+    return None
+
+
+def get_reduce_factor(image_size, target_size, round_up=True) -> int:
+    """
+    Computes the largest decoding scale factor (1, 2, 4 or 8),
+    which keeps the image not smaller than ``target_size``
+
+    Args:
+        image_size: (height, width) of the image
+        target_size: (height, width) or int, target image size
+        round_up (bool): whether the reduced size is rounded up
+            (JPEG) or down (PNG and other formats in OpenCV)
+
+    Returns:
+        int: scale factor
+    """
+    if isinstance(target_size, int):
+        target_size = (target_size, target_size)
+    height, width = image_size
+    target_height, target_width = target_size
+
+    def reduce(size, factor):
+        return -(-size // factor) if round_up else size // factor
+
+    for factor in (8, 4, 2):
+        if reduce(height, factor) >= target_height \
+                and reduce(width, factor) >= target_width:
+            return factor
+    return 1
+
+
+def _postprocess_image(img, grayscale=False):
+    if len(img.shape) < 3:  # grayscale
+        img = np.expand_dims(img, -1)
+
+    if img.shape[-1] != 3 and not grayscale:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
+
+    return img
+
+
+def _decode_reduced(buffer, target_size):
+    image_size = get_image_size(buffer)
+    if image_size is None:
+        return None
+
+    is_jpeg = buffer[0] == 0xFF and buffer[1] == 0xD8
+    factor = get_reduce_factor(image_size, target_size, round_up=is_jpeg)
+    if factor == 1:
+        return None
+
+    img = cv2.imdecode(buffer, _REDUCED_FLAGS[factor])
+    if img is not None and len(img.shape) == 3:  # BGR -> RGB
+        img = img[:, :, ::-1]
+    return img
+
 
-def read_image(image_name, datapath=None, grayscale=False):
+def decode_image(buffer, grayscale=False, target_size=None):
+    """
+    Decodes image from encoded bytes
+
+    Args:
+        buffer (np.ndarray): encoded image as uint8 array,
+            for example memory-mapped shard record
+        grayscale (bool): flag if you need to work only
+            with grayscale images
+        target_size: (height, width) or int, if specified, image is
+            decoded at the lowest resolution (1/2, 1/4 or 1/8),
+            which is not smaller than ``target_size``.
+            JPEG images are downscaled while decoding (DCT-domain scaling),
+            PNG images are downscaled right after full decoding
+
+    Returns:
+        np.ndarray: RGB image
+    """
+    img = None
+    if target_size is not None:
+        img = _decode_reduced(buffer, target_size)
+        if img is not None:
+            return _postprocess_image(img, grayscale=grayscale)
+
+    try:
+        # JPEG magic bytes
+        if buffer[0] == 0xFF and buffer[1] == 0xD8:
+            img = jpeg.JPEG(buffer).decode()
+    except Exception:
+        pass
+
+    if img is None:
+        img = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+
+        if len(img.shape) == 3:  # BGR -> RGB
+            img = img[:, :, ::-1]
+
+    return _postprocess_image(img, grayscale=grayscale)
+
+
+def read_image(image_name, datapath=None, grayscale=False, target_size=None):
     if datapath is not None:
         image_name = (
             image_name if image_name.startswith(datapath) else
             os.path.join(datapath, image_name)
         )
 
+    if target_size is not None:
+        buffer = np.fromfile(image_name, dtype=np.uint8)
+        return decode_image(
+            buffer, grayscale=grayscale, target_size=target_size
+        )
+
     img = None
     try:
         if image_name.endswith(("jpg", "JPG", "jpeg", "JPEG")):
@@ -25,13 +179,7 @@ def read_image(image_name, datapath=None, grayscale=False):
         if len(img.shape) == 3:  # BGR -> RGB
             img = img[:, :, ::-1]
 
-    if len(img.shape) < 3:  # grayscale
-        img = np.expand_dims(img, -1)
-
-    if img.shape[-1] != 3 and not grayscale:
-        img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-
-    return img
+    return _postprocess_image(img, grayscale=grayscale)
 
 
 def compute_mixup_lambda(bs, alpha, share_lambda=True):
@@ -1,7 +1,46 @@
-from typing import Callable, Type, List
+import os
+import csv
+import mmap
+from numbers import Number
+from typing import Any, Callable, Type, List, Dict, Tuple, Union
 
 import numpy as np
-from catalyst.data.functional import read_image
+from catalyst.data.functional import read_image, decode_image
+
+
+def stack_values(values: List[Any]) -> Union[np.ndarray, List[Any]]:
+    """
+    Stacks batch values into one array if possible
+
+    Args:
+        values (List[Any]): values of one key for all samples in the batch
+
+    Returns:
+        np.ndarray with batch values if all of them are arrays or numbers,
+        otherwise the list of values
+    """
+    if all(isinstance(x, (np.ndarray, np.generic, Number)) for x in values):
+        try:
+            return np.stack(values)
+        except ValueError:  # different shapes
+            pass
+    return list(values)
+
+
+def collate_rows(results: List[Dict]) -> Dict:
+    """
+    Collates a list of per-row dicts into a dict of stacked values
+
+    Args:
+        results (List[Dict]): readers results for every row
+
+    Returns:
+        dict with stacked values
+    """
+    return {
+        key: stack_values([result[key] for result in results])
+        for key in results[0]
+    }
 
 
 class BaseReader:
@@ -36,6 +75,19 @@ class BaseReader:
             "You cannot apply a transformation using `BaseReader`"
         )
 
+    def read_batch(self, rows: List) -> Dict:
+        """Reads a batch of rows from your annotations dict.
+        Default implementation reads rows one by one
+        and stacks the results, override it for vectorized readers.
+
+        Args:
+            rows: elems in your dataset.
+
+        Returns:
+            dict with stacked data for the whole batch
+        """
+        return collate_rows([self(row) for row in rows])
+
 
 class ImageReader(BaseReader):
     """
@@ -47,7 +99,8 @@ class ImageReader(BaseReader):
         input_key: str,
         output_key: str,
         datapath: str = None,
-        grayscale: bool = False
+        grayscale: bool = False,
+        target_size: Union[int, Tuple[int, int]] = None
     ):
         """
         Args:
@@ -57,10 +110,15 @@ class ImageReader(BaseReader):
                 (so your can use relative paths in annotations)
             grayscale (bool): flag if you need to work only
                 with grayscale images
+            target_size: (height, width) or int, size of the images
+                after your transforms. If specified, JPEG and PNG images
+                are decoded at reduced resolution (1/2, 1/4 or 1/8),
+                which is still not smaller than ``target_size``
         """
         super().__init__(input_key, output_key)
         self.datapath = datapath
         self.grayscale = grayscale
+        self.target_size = target_size
 
     def __call__(self, row):
         """Reads a row from your annotations dict with filename and
@@ -74,7 +132,95 @@ class ImageReader(BaseReader):
         """
         image_name = str(row[self.input_key])
         img = read_image(
-            image_name, datapath=self.datapath, grayscale=self.grayscale
+            image_name,
+            datapath=self.datapath,
+            grayscale=self.grayscale,
+            target_size=self.target_size
+        )
+
+        result = {self.output_key: img}
+        return result
+
+
+class ShardImageReader(BaseReader):
+    """
+    Image reader abstraction for images packed into shard files
+    with ``catalyst-data pack-images``.
+
+    Shard files are memory-mapped lazily (once per ``DataLoader`` worker),
+    and encoded images are decoded right from the mapped memory.
+    """
+
+    def __init__(
+        self,
+        input_key: str,
+        output_key: str,
+        shards_path: str,
+        grayscale: bool = False,
+        target_size: Union[int, Tuple[int, int]] = None
+    ):
+        """
+        Args:
+            input_key (str): key to use from annotation dict
+            output_key (str): key to use to store the result
+            shards_path (str): path to directory with shard files
+                and ``index.csv``
+            grayscale (bool): flag if you need to work only
+                with grayscale images
+            target_size: (height, width) or int, size of the images
+                after your transforms, see :class:`ImageReader`
+        """
+        super().__init__(input_key, output_key)
+        self.shards_path = shards_path
+        self.grayscale = grayscale
+        self.target_size = target_size
+        self._index: Dict[str, Tuple[int, int, int]] = None
+        self._shards: Dict[int, mmap.mmap] = {}
+
+    def _load_index(self):
+        index = {}
+        with open(os.path.join(self.shards_path, "index.csv")) as fin:
+            for row in csv.DictReader(fin):
+                index[row["key"]] = (
+                    int(row["shard"]), int(row["offset"]), int(row["length"])
+                )
+        return index
+
+    def _get_shard(self, shard: int) -> mmap.mmap:
+        if shard not in self._shards:
+            filename = os.path.join(self.shards_path, f"{shard:05d}.shard")
+            with open(filename, "rb") as fin:
+                self._shards[shard] = mmap.mmap(
+                    fin.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        return self._shards[shard]
+
+    def __getstate__(self):
+        # memory maps are opened again in every worker
+        state = self.__dict__.copy()
+        state["_shards"] = {}
+        return state
+
+    def __call__(self, row):
+        """Reads a row from your annotations dict with filename and
+        transfer it to an image
+
+        Args:
+            row: elem in your dataset.
+
+        Returns:
+            np.ndarray: Image
+        """
+        if self._index is None:
+            self._index = self._load_index()
+
+        shard, offset, length = self._index[str(row[self.input_key])]
+        buffer = np.frombuffer(
+            self._get_shard(shard), dtype=np.uint8,
+            count=length, offset=offset
+        )
+        img = decode_image(
+            buffer, grayscale=self.grayscale, target_size=self.target_size
         )
 
         result = {self.output_key: img}
@@ -116,17 +262,43 @@ class ScalarReader(BaseReader):
             row: elem in your dataset.
 
         Returns:
-            dtype: Scalar value
+            dtype: Scalar value.
+            For one-hot encoding, negative values become zero vectors.
         """
         scalar = self.dtype(row.get(self.input_key, self.default_value))
-        if self.one_hot_classes is not None \
-                and scalar is not None and scalar >= 0:
+        if self.one_hot_classes is not None and scalar is not None:
             one_hot = np.zeros(self.one_hot_classes, dtype=np.float32)
-            one_hot[scalar] = 1.0
+            if scalar >= 0:
+                one_hot[scalar] = 1.0
             scalar = one_hot
         result = {self.output_key: scalar}
         return result
 
+    def read_batch(self, rows: List) -> Dict:
+        """Reads a batch of rows from your annotations dict
+        with vectorized type conversion and one-hot encoding
+
+        Args:
+            rows: elems in your dataset.
+
+        Returns:
+            dict with np.ndarray of values for the whole batch.
+            For one-hot encoding, negative values become zero vectors.
+        """
+        values = np.array(
+            [row.get(self.input_key, self.default_value) for row in rows],
+            dtype=self.dtype
+        )
+        if self.one_hot_classes is not None:
+            one_hot = np.zeros(
+                (len(values), self.one_hot_classes), dtype=np.float32
+            )
+            indices = np.nonzero(values >= 0)[0]
+            one_hot[indices, values[indices].astype(np.int64)] = 1.0
+            values = one_hot
+        result = {self.output_key: values}
+        return result
+
 
 class LambdaReader(BaseReader):
     """
@@ -138,7 +310,8 @@ class LambdaReader(BaseReader):
         self,
         input_key: str,
         output_key: str,
-        encode_fn: Callable = lambda x: x
+        encode_fn: Callable = lambda x: x,
+        batch_encode_fn: Callable = None
     ):
         """
         Args:
@@ -146,9 +319,13 @@ class LambdaReader(BaseReader):
             output_key (str): output key to use to store the result
             encode_fn (callable): encode function to use to prepare your data
                 (for example convert chars/words/tokens to indices, etc)
+            batch_encode_fn (callable): vectorized version of ``encode_fn``,
+                takes a list of elems and returns a batch of encoded values,
+                used by ``read_batch``
         """
         super().__init__(input_key, output_key)
         self.encode_fn = encode_fn
+        self.batch_encode_fn = batch_encode_fn
 
     def __call__(self, row):
         """Reads a row from your annotations dict
@@ -165,6 +342,24 @@ class LambdaReader(BaseReader):
         result = {self.output_key: elem}
         return result
 
+    def read_batch(self, rows: List) -> Dict:
+        """Reads a batch of rows from your annotations dict
+        and applies ``batch_encode_fn`` (or ``encode_fn`` to every elem)
+
+        Args:
+            rows: elems in your dataset.
+
+        Returns:
+            dict with encoded values for the whole batch
+        """
+        elems = [row[self.input_key] for row in rows]
+        if self.batch_encode_fn is not None:
+            elems = self.batch_encode_fn(elems)
+        else:
+            elems = stack_values([self.encode_fn(elem) for elem in elems])
+        result = {self.output_key: elems}
+        return result
+
 
 class ReaderCompose(object):
     """
@@ -192,7 +387,36 @@ class ReaderCompose(object):
         """
         result = {}
         for fn in self.readers:
-            result = {**result, **fn(row)}
+            result.update(fn(row))
         for fn in self.mixins:
-            result = {**result, **fn(result)}
+            result.update(fn(result))
+        return result
+
+    def read_batch(self, rows: List) -> Dict:
+        """Reads a batch of rows from your annotations dict
+        with ``read_batch`` of every reader.
+        Mixins are applied to every sample of the batch.
+
+        Args:
+            rows: elems in your dataset.
+
+        Returns:
+            dict with stacked data for the whole batch
+        """
+        result = {}
+        for fn in self.readers:
+            if hasattr(fn, "read_batch"):
+                result.update(fn.read_batch(rows))
+            else:
+                result.update(collate_rows([fn(row) for row in rows]))
+
+        if len(self.mixins) > 0:
+            samples = [
+                {key: value[i] for key, value in result.items()}
+                for i in range(len(rows))
+            ]
+            for fn in self.mixins:
+                for sample in samples:
+                    sample.update(fn(sample))
+            result = collate_rows(samples)
         return result
@@ -1,4 +1,5 @@
 from typing import List, Iterator
+from itertools import islice
 import numpy as np
 
 from torch.utils.data.sampler import Sampler
@@ -64,3 +65,26 @@ class BalanceClassSampler(Sampler):
              length of result sample
         """
         return self.length
+
+
+class SkipBatchSampler(Sampler):
+    """
+    Wraps batch sampler and skips its first ``num_batches`` batches,
+    allows to continue interrupted loader without reading skipped samples.
+    """
+
+    def __init__(self, batch_sampler: Sampler, num_batches: int):
+        """
+        Args:
+            batch_sampler (Sampler): batch sampler to wrap,
+                e.g. ``DataLoader.batch_sampler``
+            num_batches (int): number of batches to skip
+        """
+        self.batch_sampler = batch_sampler
+        self.num_batches = num_batches
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return islice(iter(self.batch_sampler), self.num_batches, None)
+
+    def __len__(self) -> int:
+        return max(len(self.batch_sampler) - self.num_batches, 0)
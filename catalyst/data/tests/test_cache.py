@@ -0,0 +1,149 @@
+import multiprocessing as mp
+
+import numpy as np
+
+from ..cache import SharedMemoryCache, LRUCache, ARCCache, MemmapSpill, \
+    get_nbytes
+from ..dataset import ListDataset
+
+
+def _fill_cache(cache, indices):
+    for i in indices:
+        cache[i] = {"image": np.full((4, 4), i, dtype=np.uint8)}
+
+
+def test_shared_cache_visible_after_fork():
+    cache = SharedMemoryCache(length=8, max_bytes=2 ** 16)
+
+    ctx = mp.get_context("fork")
+    workers = [
+        ctx.Process(target=_fill_cache, args=(cache, indices))
+        for indices in ([0, 1, 2, 3], [4, 5, 6, 7])
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(cache) == 8
+    for i in range(8):
+        assert (cache.get(i)["image"] == i).all()
+
+
+def _write_all(cache, worker, start):
+    start.wait()
+    for i in range(cache.length):
+        # every worker writes samples of its own size
+        image = np.full(8 * (worker + 1), i % 256, dtype=np.uint8)
+        cache[i] = {"image": image}
+
+
+def test_shared_cache_concurrent_writers():
+    cache = SharedMemoryCache(length=2048, max_bytes=2 ** 22)
+
+    ctx = mp.get_context("fork")
+    start = ctx.Event()
+    workers = [
+        ctx.Process(target=_write_all, args=(cache, worker, start))
+        for worker in range(8)
+    ]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join()
+
+    assert len(cache) == cache.length
+    for i in range(cache.length):
+        image = cache.get(i)["image"]
+        assert (image == i % 256).all() and len(image) % 8 == 0
+    # every sample is allocated once, losing writers back off
+    assert cache.nbytes == int(cache._sizes.sum())
+
+
+def test_shared_cache_budget():
+    cache = SharedMemoryCache(length=4, max_bytes=64)
+    cache[0] = b"x" * 16
+    cache[1] = b"x" * 128
+
+    assert 0 in cache
+    assert 1 not in cache
+    assert cache.get(1) is None
+    assert cache.nbytes <= 64
+
+
+def test_list_dataset_shared_cache():
+    calls = []
+
+    def open_fn(row):
+        calls.append(row)
+        return {"value": row["value"]}
+
+    dataset = ListDataset(
+        [{"value": i} for i in range(4)],
+        open_fn=open_fn,
+        cache_prob=1,
+        cache_mode="shared",
+        cache_size=2 ** 12
+    )
+    for _ in range(2):
+        values = [dataset[i]["value"] for i in range(len(dataset))]
+        assert values == list(range(4))
+
+    assert len(calls) == 4
+
+
+def _sample(i, size=16):
+    return {"image": np.full(size, i, dtype=np.uint8), "label": i}
+
+
+def test_lru_cache_eviction():
+    sample_bytes = get_nbytes(_sample(0))
+    cache = LRUCache(max_bytes=3 * sample_bytes)
+    for i in range(3):
+        cache[i] = _sample(i)
+    cache.get(0)
+    cache[3] = _sample(3)
+
+    assert len(cache) == 3
+    assert cache.nbytes <= cache.max_bytes
+    assert 1 not in cache
+    assert all(i in cache for i in [0, 2, 3])
+
+
+def test_arc_cache_scan_resistance():
+    sample_bytes = get_nbytes(_sample(0))
+    cache = ARCCache(max_bytes=4 * sample_bytes)
+    # frequently used samples
+    for _ in range(2):
+        for i in range(2):
+            if cache.get(i) is None:
+                cache[i] = _sample(i)
+    # one-time scan
+    for i in range(10, 20):
+        if cache.get(i) is None:
+            cache[i] = _sample(i)
+
+    assert cache.nbytes <= cache.max_bytes
+    assert 0 in cache and 1 in cache
+
+
+def test_cache_spill(tmpdir):
+    sample_bytes = get_nbytes(_sample(0))
+    spill = MemmapSpill(path=str(tmpdir / "spill"), max_bytes=16 * 3)
+    cache = LRUCache(max_bytes=sample_bytes, spill=spill)
+    for i in range(5):
+        cache[i] = _sample(i)
+
+    # 0 was overwritten in the spill ring buffer, 1..3 are spilled
+    assert 0 not in spill
+    assert all(i in spill for i in [1, 2, 3])
+    # spill file is unlinked right after mapping
+    assert tmpdir.listdir() == []
+
+    sample = cache.get(3)
+    assert (sample["image"] == 3).all() and sample["label"] == 3
+    assert 3 in cache and 4 in spill
+
+    spill.discard(4)
+    assert 4 not in spill
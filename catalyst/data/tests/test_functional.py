@@ -0,0 +1,30 @@
+import cv2
+import numpy as np
+
+from ..functional import decode_image, read_image
+
+
+def test_decode_reduced_grayscale():
+    image = np.tile(np.arange(64, dtype=np.uint8) * 4, (48, 1))
+    _, buffer = cv2.imencode(".jpg", image)
+    buffer = buffer.reshape(-1)
+
+    full = decode_image(buffer, grayscale=True)
+    reduced = decode_image(buffer, grayscale=True, target_size=(12, 16))
+
+    assert full.shape == (48, 64, 3)
+    assert reduced.shape == (12, 16, 3)
+    assert np.abs(
+        cv2.resize(full, (16, 12), interpolation=cv2.INTER_AREA).astype(int)
+        - reduced
+    ).max() < 8
+
+
+def test_read_reduced_png_odd_size(tmpdir):
+    filename = str(tmpdir.join("image.png"))
+    image = np.random.RandomState(0).randint(0, 255, (447, 449, 3))
+    cv2.imwrite(filename, image.astype(np.uint8))
+
+    # 447 // 2 is smaller than the target size, so the image isn't reduced
+    assert read_image(filename, target_size=224).shape == (447, 449, 3)
+    assert read_image(filename, target_size=223).shape == (223, 224, 3)
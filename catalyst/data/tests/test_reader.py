@@ -0,0 +1,76 @@
+import numpy as np
+from torch.utils.data import DataLoader, BatchSampler, SequentialSampler
+
+from ..dataset import BatchListDataset
+from ..reader import ScalarReader, LambdaReader, ReaderCompose
+
+
+def _rows():
+    return [{"label": i % 3, "text": "a" * i} for i in range(7)]
+
+
+def test_scalar_reader_batch():
+    rows = _rows()
+    for one_hot_classes in [None, 3]:
+        reader = ScalarReader(
+            "label", "targets",
+            dtype=np.int64,
+            one_hot_classes=one_hot_classes
+        )
+        batch = reader.read_batch(rows)["targets"]
+        expected = np.stack([reader(row)["targets"] for row in rows])
+        assert np.array_equal(batch, expected)
+
+
+def test_scalar_reader_negative_one_hot():
+    rows = [{"label": 1}, {"label": -1}]
+    reader = ScalarReader(
+        "label", "targets", dtype=np.int64, one_hot_classes=3
+    )
+    expected = np.array([[0, 1, 0], [0, 0, 0]], dtype=np.float32)
+    assert np.array_equal(reader.read_batch(rows)["targets"], expected)
+    assert np.array_equal(
+        np.stack([reader(row)["targets"] for row in rows]), expected
+    )
+
+
+def test_reader_compose_batch():
+    rows = _rows()
+    reader = ReaderCompose(
+        readers=[
+            ScalarReader("label", "targets", dtype=np.int64),
+            LambdaReader("text", "length", encode_fn=len),
+            LambdaReader(
+                "text",
+                "length_batch",
+                encode_fn=len,
+                batch_encode_fn=lambda x: np.array([len(t) for t in x])
+            ),
+        ],
+        mixins=[lambda x: {"double": x["length"] * 2}]
+    )
+    batch = reader.read_batch(rows)
+
+    assert np.array_equal(batch["length"], batch["length_batch"])
+    for i, row in enumerate(rows):
+        sample = reader(row)
+        for key, value in sample.items():
+            assert batch[key][i] == value
+
+
+def test_batch_list_dataset():
+    dataset = BatchListDataset(
+        _rows(),
+        open_fn=ReaderCompose(
+            [ScalarReader("label", "targets", dtype=np.int64)]
+        )
+    )
+    loader = DataLoader(
+        dataset,
+        sampler=BatchSampler(
+            SequentialSampler(dataset), batch_size=3, drop_last=False
+        ),
+        batch_size=None
+    )
+    batches = [batch["targets"].tolist() for batch in loader]
+    assert batches == [[0, 1, 2], [0, 1, 2], [0]]
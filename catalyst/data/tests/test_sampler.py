@@ -0,0 +1,14 @@
+from torch.utils.data.sampler import BatchSampler, SequentialSampler
+
+from ..sampler import SkipBatchSampler
+
+
+def test_skip_batch_sampler():
+    batch_sampler = BatchSampler(
+        SequentialSampler(range(10)), batch_size=3, drop_last=False
+    )
+    sampler = SkipBatchSampler(batch_sampler, num_batches=2)
+
+    assert len(sampler) == 2
+    assert list(sampler) == [[6, 7, 8], [9]]
+    assert len(SkipBatchSampler(batch_sampler, num_batches=10)) == 0
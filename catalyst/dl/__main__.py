@@ -1,9 +1,12 @@
 from collections import OrderedDict
 from argparse import ArgumentParser, RawTextHelpFormatter
 
-from .scripts import run, make_report
+from .scripts import run, make_report, sweep, tune_loader, benchmark
 
-COMMANDS = OrderedDict([("run", run), ("make-report", make_report)])
+COMMANDS = OrderedDict([
+    ("run", run), ("make-report", make_report), ("sweep", sweep),
+    ("tune-loader", tune_loader), ("benchmark", benchmark)
+])
 
 
 def build_parser() -> ArgumentParser:
@@ -5,4 +5,6 @@ from .inference import *
 from .loggers import *
 from .metrics import *
 from .mixup import *
+from .profiler import *
+from .pruning import *
 from .schedulers import *
@@ -1,13 +1,20 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 import torch
 
 from catalyst.dl.state import RunnerState
 from catalyst.dl.utils import UtilsFactory
 from .core import Callback
-from catalyst.dl.fp16 import Fp16Wrap, copy_params, copy_grads
+from catalyst.dl.fp16 import Fp16Wrap, copy_params, copy_grads, \
+    autocast, create_grad_scaler
+from catalyst.dl.profiler import profile_span
+from catalyst.dl.distributed import is_master
+from catalyst.utils.misc import get_rng_states, set_rng_states
 from .utils import get_optimizer_momentum, scheduler_step
 
+_foreach_mul_ = getattr(torch, "_foreach_mul_", None)
+
 
 class CheckpointCallback(Callback):
     """
@@ -15,16 +22,42 @@ class CheckpointCallback(Callback):
     """
 
     def __init__(
-        self, save_n_best: int = 3, resume: str = None
+        self,
+        save_n_best: int = 3,
+        resume: str = None,
+        async_save=False,
+        save_every_batches: int = None
     ):
         """
         :param save_n_best: number of best checkpoint to keep
-        :param resume: path to checkpoint to load and initialize runner state
+        :param resume: path to checkpoint to load and initialize runner state,
+            training from the step checkpoint continues from its batch
+        :param async_save: if True, copies checkpoint to cpu
+            and saves it in a background thread,
+            pending save is awaited on the next epoch end and the stage end
+        :param save_every_batches: if set, saves ``checkpoints/step.pth``
+            every ``save_every_batches`` batches of every loader
+            and on the epoch end, with loader position, RNG states
+            and metric meters to resume interrupted epoch.
+            Skipped batches are not read on resume,
+            sampler order is reproduced with the shuffling generator
+            and RNG states of the loader start
         """
         self.save_n_best = save_n_best
         self.resume = resume
+        self.async_save = async_save
+        self.save_every_batches = save_every_batches
         self.top_best_metrics = []
 
+        self._executor = None
+        self._pending_save = None
+        # RNG states on the current loader start, they define sampler order
+        self._loader_rng_states = None
+        self._loader_sampler_state = None
+        # step checkpoint to restore on the resumed loader start
+        self._resume_checkpoint = None
+        self._restore_rng_states = None
+
         self._keys_from_state = ["resume"]
 
     @staticmethod
@@ -34,6 +67,12 @@ class CheckpointCallback(Callback):
             checkpoint = UtilsFactory.load_checkpoint(filename)
 
             state.epoch = checkpoint["epoch"]
+            if checkpoint.get("stage") == state.stage \
+                    and "resume_epoch" in checkpoint:
+                state.step = checkpoint["step"]
+                state.start_epoch = checkpoint["resume_epoch"]
+                state.resume_loader = checkpoint["resume_loader"]
+                state.skip_batches = checkpoint["resume_batches"]
 
             UtilsFactory.unpack_checkpoint(
                 checkpoint,
@@ -48,6 +87,7 @@ class CheckpointCallback(Callback):
                     filename, checkpoint["epoch"]
                 )
             )
+            return checkpoint
         else:
             raise Exception("no checkpoint found at \"{}\"".format(filename))
 
@@ -84,6 +124,11 @@ class CheckpointCallback(Callback):
     def pack_checkpoint(self, **kwargs):
         return UtilsFactory.pack_checkpoint(**kwargs)
 
+    def wait_pending_save(self):
+        if self._pending_save is not None:
+            pending_save, self._pending_save = self._pending_save, None
+            pending_save.result()
+
     def on_stage_start(self, state):
         for key in self._keys_from_state:
             value = getattr(state, key, None)
@@ -91,10 +136,115 @@ class CheckpointCallback(Callback):
                 setattr(self, key, value)
 
         if self.resume is not None:
-            self.load_checkpoint(filename=self.resume, state=state)
+            checkpoint = self.load_checkpoint(
+                filename=self.resume, state=state
+            )
+            if checkpoint.get("stage") == state.stage \
+                    and "resume_epoch" in checkpoint:
+                self._resume_checkpoint = checkpoint
+
+        # batches order is saved and restored only with step checkpoints,
+        # other runs keep samplers untouched
+        if self._resume_checkpoint is not None or (
+            self.save_every_batches is not None
+            and not state.stage.startswith("infer")
+        ):
+            state.seed_sampler = True
+
+    def _submit(self, fn, **kwargs):
+        if self.async_save:
+            kwargs["checkpoint"] = \
+                UtilsFactory.checkpoint_to_cpu(kwargs["checkpoint"])
+            # keeps at most one checkpoint in the queue
+            self.wait_pending_save()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._pending_save = self._executor.submit(fn, **kwargs)
+        else:
+            fn(**kwargs)
+
+    def save_step_checkpoint(self, state: RunnerState, end_of_epoch: bool):
+        """
+        Saves ``checkpoints/step.pth`` to resume training
+        from the current batch or from the next epoch
+        """
+        metrics_state = state.metrics.state_dict()
+        if end_of_epoch:
+            position = dict(
+                resume_epoch=state.epoch + 1,
+                resume_loader=None,
+                resume_batches=0,
+                metrics_state={
+                    "best_main_metric_value":
+                        metrics_state["best_main_metric_value"]
+                }
+            )
+        else:
+            position = dict(
+                resume_epoch=state.epoch,
+                resume_loader=state.loader_name,
+                resume_batches=state.loader_step,
+                metrics_state=metrics_state,
+                loader_rng_states=self._loader_rng_states,
+                loader_sampler_state=self._loader_sampler_state,
+                rng_states=get_rng_states()
+            )
+        checkpoint = self.pack_checkpoint(
+            model=state.model,
+            criterion=state.criterion,
+            optimizer=state.optimizer,
+            scheduler=state.scheduler,
+            stage=state.stage,
+            epoch=state.epoch,
+            step=state.step,
+            **position
+        )
+        self._submit(
+            UtilsFactory.save_checkpoint,
+            logdir=f"{state.logdir}/checkpoints",
+            checkpoint=checkpoint,
+            suffix="step"
+        )
+
+    def on_loader_start(self, state: RunnerState):
+        resume_checkpoint, self._resume_checkpoint = \
+            self._resume_checkpoint, None
+        if resume_checkpoint is not None:
+            state.metrics.load_state_dict(resume_checkpoint["metrics_state"])
+            if "rng_states" in resume_checkpoint:
+                # reproduces the sampler order of the interrupted loader,
+                # the rest of the states is restored on the first batch
+                set_rng_states(resume_checkpoint["loader_rng_states"])
+                self._restore_rng_states = resume_checkpoint["rng_states"]
+            sampler_state = resume_checkpoint.get("loader_sampler_state")
+            if sampler_state is not None \
+                    and state.sampler_generator is not None:
+                state.sampler_generator.set_state(sampler_state)
+
+        if self.save_every_batches is not None \
+                and not state.stage.startswith("infer"):
+            self._loader_rng_states = get_rng_states()
+            self._loader_sampler_state = \
+                state.sampler_generator.get_state() \
+                if state.sampler_generator is not None else None
+
+    def on_batch_start(self, state: RunnerState):
+        if self._restore_rng_states is not None:
+            set_rng_states(self._restore_rng_states)
+            self._restore_rng_states = None
+            return
+
+        # saves on the next batch start, when all batch_end hooks are done
+        if self.save_every_batches is None \
+                or state.stage.startswith("infer") or not is_master():
+            return
+        if state.loader_step > 0 \
+                and state.loader_step % self.save_every_batches == 0:
+            self.save_step_checkpoint(state, end_of_epoch=False)
 
     def on_epoch_end(self, state: RunnerState):
-        if state.stage.startswith("infer"):
+        # only rank 0 process saves checkpoints in distributed mode
+        if state.stage.startswith("infer") or not is_master():
             return
 
         checkpoint = self.pack_checkpoint(
@@ -107,7 +257,7 @@ class CheckpointCallback(Callback):
             stage=state.stage,
             epoch=state.epoch
         )
-        self.save_checkpoint(
+        save_kwargs = dict(
             logdir=state.logdir,
             checkpoint=checkpoint,
             is_best=state.metrics.is_best,
@@ -115,8 +265,18 @@ class CheckpointCallback(Callback):
             main_metric=state.main_metric,
             minimize_metric=state.minimize_metric
         )
+        self._submit(self.save_checkpoint, **save_kwargs)
+        if self.save_every_batches is not None:
+            self.save_step_checkpoint(state, end_of_epoch=True)
 
     def on_stage_end(self, state):
+        self.wait_pending_save()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if not is_master():
+            return
+
         print("Top best models:")
         top_best_metrics_str = "\n".join(
             [
@@ -156,11 +316,17 @@ class OptimizerCallback(Callback):
         self.accumulation_steps = accumulation_steps
         self.optimizer_key = optimizer_key
         self.loss_key = loss_key
-        self._optimizer_wd = 0
+        self._optimizer_wd = []
         self._accumulation_counter = 0
+        self._grad_scaler = None
 
     def on_stage_start(self, state: RunnerState):
         self.fp16 = isinstance(state.model, Fp16Wrap)
+        assert not (self.fp16 and state.autocast_dtype is not None), \
+            "Fp16Wrap and mixed precision can't be used together"
+        self._grad_scaler = create_grad_scaler(
+            state.device, state.autocast_dtype
+        )
         optimizer = state.get_key(
             key="optimizer", inner_key=self.optimizer_key
         )
@@ -174,20 +340,69 @@ class OptimizerCallback(Callback):
         optimizer = state.get_key(
             key="optimizer", inner_key=self.optimizer_key
         )
-        self._optimizer_wd = optimizer.param_groups[0].get("weight_decay", 0.0)
-        optimizer.param_groups[0]["weight_decay"] = 0.0
+        self._optimizer_wd = [
+            group.get("weight_decay", 0.0) for group in optimizer.param_groups
+        ]
+        for group in optimizer.param_groups:
+            group["weight_decay"] = 0.0
 
     @staticmethod
-    def grad_step(*, optimizer, optimizer_wd=0, grad_clip_fn=None):
-        for group in optimizer.param_groups:
-            if optimizer_wd > 0:
-                for param in group["params"]:
-                    param.data = param.data.add(
-                        -optimizer_wd * group["lr"], param.data
-                    )
+    def decay_weights(params, weight_decay: float, lr: float):
+        """
+        Decoupled weight decay ``param -= weight_decay * lr * param``,
+        applied in place and with one multi-tensor op if available
+        """
+        if weight_decay <= 0:
+            return
+        with torch.no_grad():
+            if _foreach_mul_ is not None:
+                _foreach_mul_(list(params), 1.0 - weight_decay * lr)
+            else:
+                for param in params:
+                    param.mul_(1.0 - weight_decay * lr)
+
+    @staticmethod
+    def _grads_are_finite(optimizer) -> bool:
+        grads = [
+            param.grad for group in optimizer.param_groups
+            for param in group["params"] if param.grad is not None
+        ]
+        if len(grads) == 0:
+            return True
+        # one device sync for all gradients
+        is_finite = torch.stack([torch.isfinite(x).all() for x in grads])
+        return bool(is_finite.all())
+
+    @staticmethod
+    def grad_step(
+        *, optimizer, optimizer_wd=0, grad_clip_fn=None, grad_scaler=None
+    ):
+        """
+        :param optimizer: optimizer to step
+        :param optimizer_wd: weight decay for all param groups
+            or list of weight decays, one per param group
+        :param grad_clip_fn: function to clip group gradients
+        :param grad_scaler: loss scaler for float16 mixed precision
+        """
+        if grad_scaler is not None:
+            grad_scaler.unscale_(optimizer)
+        if not isinstance(optimizer_wd, (list, tuple)):
+            optimizer_wd = [optimizer_wd] * len(optimizer.param_groups)
+        # the scaler skips the step with inf/nan gradients, so does the decay
+        if grad_scaler is not None and any(wd > 0 for wd in optimizer_wd) \
+                and not OptimizerCallback._grads_are_finite(optimizer):
+            optimizer_wd = [0] * len(optimizer.param_groups)
+        for group, group_wd in zip(optimizer.param_groups, optimizer_wd):
+            OptimizerCallback.decay_weights(
+                group["params"], group_wd, group["lr"]
+            )
             if grad_clip_fn is not None:
                 grad_clip_fn(group["params"])
-        optimizer.step()
+        if grad_scaler is not None:
+            grad_scaler.step(optimizer)
+            grad_scaler.update()
+        else:
+            optimizer.step()
 
     def on_batch_end(self, state):
         if not state.need_backward:
@@ -200,15 +415,20 @@ class OptimizerCallback(Callback):
                 key="optimizer", inner_key=self.optimizer_key
             )
             loss = state.get_key(key="loss", inner_key=self.loss_key)
-            loss.backward()
+            if self._grad_scaler is not None:
+                loss = self._grad_scaler.scale(loss)
+            with profile_span(state.profiler, "backward", "model"):
+                loss.backward()
 
             if (self._accumulation_counter + 1) % self.accumulation_steps == 0:
-                self.grad_step(
-                    optimizer=optimizer,
-                    optimizer_wd=self._optimizer_wd,
-                    grad_clip_fn=self.grad_clip_fn
-                )
-                model.zero_grad()
+                with profile_span(state.profiler, "optimizer_step", "model"):
+                    self.grad_step(
+                        optimizer=optimizer,
+                        optimizer_wd=self._optimizer_wd,
+                        grad_clip_fn=self.grad_clip_fn,
+                        grad_scaler=self._grad_scaler
+                    )
+                    model.zero_grad()
                 self._accumulation_counter = 0
         else:
             model = state.model
@@ -218,7 +438,8 @@ class OptimizerCallback(Callback):
             )
             loss = state.get_key(key="loss", inner_key=self.optimizer_key)
             scaled_loss = self.fp16_grad_scale * loss.float()
-            scaled_loss.backward()
+            with profile_span(state.profiler, "backward", "model"):
+                scaled_loss.backward()
 
             master_params = list(optimizer.param_groups[0]["params"])
             model_params = list(
@@ -227,19 +448,23 @@ class OptimizerCallback(Callback):
             copy_grads(source=model_params, target=master_params)
             for param in master_params:
                 param.grad.data.mul_(1. / self.fp16_grad_scale)
-            self.grad_step(
-                optimizer=optimizer,
-                optimizer_wd=self._optimizer_wd,
-                grad_clip_fn=self.grad_clip_fn
-            )
-            copy_params(source=master_params, target=model_params)
-            torch.cuda.synchronize()
+            with profile_span(state.profiler, "optimizer_step", "model"):
+                self.grad_step(
+                    optimizer=optimizer,
+                    optimizer_wd=self._optimizer_wd,
+                    grad_clip_fn=self.grad_clip_fn
+                )
+                copy_params(source=master_params, target=model_params)
+                torch.cuda.synchronize()
 
     def on_epoch_end(self, state):
         optimizer = state.get_key(
             key="optimizer", inner_key=self.optimizer_key
         )
-        optimizer.param_groups[0]["weight_decay"] = self._optimizer_wd
+        for group, group_wd in zip(
+            optimizer.param_groups, self._optimizer_wd
+        ):
+            group["weight_decay"] = group_wd
 
 
 class SchedulerCallback(Callback):
@@ -291,9 +516,10 @@ class LossCallback(Callback):
         assert state.criterion is not None
 
     def on_batch_end(self, state):
-        state.loss = state.criterion(
-            state.output[self.output_key], state.input[self.input_key]
-        )
+        with autocast(state.device, state.autocast_dtype):
+            state.loss = state.criterion(
+                state.output[self.output_key], state.input[self.input_key]
+            )
 
 
 class EarlyStoppingCallback(Callback):
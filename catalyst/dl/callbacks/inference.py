@@ -1,8 +1,9 @@
 import os
-from collections import defaultdict
+import json
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import random
 import numpy as np
-from skimage.morphology import erosion, disk
 import cv2
 
 import torch
@@ -11,14 +12,71 @@ import torch.nn.functional as F
 from .core import Callback
 
 
+def _truncate_npy(filename: str, length: int):
+    """
+    Truncates ``.npy`` file to the first ``length`` rows in place,
+    the new header is padded to the length of the old one
+    """
+    with open(filename, "r+b") as fout:
+        version = np.lib.format.read_magic(fout)
+        if version == (1, 0):
+            shape, fortran_order, dtype = \
+                np.lib.format.read_array_header_1_0(fout)
+            prefix_len = 10
+        else:
+            shape, fortran_order, dtype = \
+                np.lib.format.read_array_header_2_0(fout)
+            prefix_len = 12
+        assert not fortran_order
+        header_len = fout.tell()
+
+        shape = (length, ) + tuple(shape[1:])
+        header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+            np.lib.format.dtype_to_descr(dtype), shape
+        )
+        header = header.ljust(header_len - prefix_len - 1) + "\n"
+        assert len(header) == header_len - prefix_len
+
+        fout.seek(prefix_len)
+        fout.write(header.encode("latin1"))
+        row_bytes = int(np.prod(shape[1:], dtype=np.int64)) * dtype.itemsize
+        fout.truncate(header_len + length * row_bytes)
+
+
 # @TODO: refactor
 class InferCallback(Callback):
-    def __init__(self, out_dir=None, out_prefix=None):
+    def __init__(
+        self,
+        out_dir=None,
+        out_prefix=None,
+        memmap=False,
+        flush_every=100,
+        resume=False
+    ):
+        """
+        :param out_dir: directory to save predictions to
+        :param out_prefix: predictions filename template with ``{suffix}``,
+            suffix is ``<loader name>.<output key>``
+        :param memmap: if True, streams predictions into ``.npy`` memmaps,
+            preallocated for ``loader_len * batch_size`` samples,
+            instead of keeping them in memory
+        :param flush_every: number of batches between memmap flushes,
+            progress of the loader is saved on every flush
+        :param resume: if True, continues interrupted memmap inference
+            from the last flush
+        """
         self.out_dir = out_dir
         self.out_prefix = out_prefix
+        self.memmap = memmap
+        self.flush_every = flush_every
+        self.resume = resume
         self.predictions = defaultdict(lambda: [])
         self._keys_from_state = ["out_dir", "out_prefix"]
 
+        self._num_samples = 0
+        self._num_batches = 0
+        self._capacity = 0
+
     def on_stage_start(self, state):
         for key in self._keys_from_state:
             value = getattr(state, key, None)
@@ -29,17 +87,102 @@ class InferCallback(Callback):
             self.out_prefix = str(self.out_dir) + "/" + str(self.out_prefix)
         if self.out_prefix is not None:
             os.makedirs(os.path.dirname(self.out_prefix), exist_ok=True)
+        if self.memmap:
+            assert self.out_prefix is not None, \
+                "memmap mode requires out_prefix"
+
+    def _get_filename(self, loader_name, key):
+        filename = self.out_prefix.format(
+            suffix=".".join([loader_name, key])
+        )
+        return filename if filename.endswith(".npy") else f"{filename}.npy"
+
+    def _get_progress_filename(self, loader_name):
+        return self.out_prefix.format(suffix=loader_name) + ".progress.json"
+
+    def _flush(self, state):
+        for value in self.predictions.values():
+            value.flush()
+        progress = {
+            "num_samples": self._num_samples,
+            "num_batches": self._num_batches,
+            "capacity": self._capacity,
+            "batch_size": state.batch_size,
+            "keys": sorted(self.predictions.keys()),
+        }
+        filename = self._get_progress_filename(state.loader_name)
+        with open(f"{filename}.tmp", "w") as fout:
+            json.dump(progress, fout)
+        os.replace(f"{filename}.tmp", filename)
+
+    def _resume(self, state):
+        filename = self._get_progress_filename(state.loader_name)
+        if not os.path.isfile(filename):
+            return
+        with open(filename) as fin:
+            progress = json.load(fin)
+        if progress["capacity"] != self._capacity \
+                or progress["batch_size"] != state.batch_size:
+            return
+
+        self._num_samples = progress["num_samples"]
+        self._num_batches = progress["num_batches"]
+        for key in progress["keys"]:
+            self.predictions[key] = np.lib.format.open_memmap(
+                self._get_filename(state.loader_name, key), mode="r+"
+            )
+        state.skip_batches = self._num_batches
+        print(
+            f"=> resuming {state.loader_name} inference "
+            f"from {self._num_samples} samples"
+        )
 
     def on_loader_start(self, state):
         self.predictions = defaultdict(lambda: [])
+        if self.memmap:
+            self.predictions = {}
+            self._num_samples = 0
+            self._num_batches = 0
+            self._capacity = state.loader_len * state.batch_size
+            if self.resume:
+                self._resume(state)
 
     def on_batch_end(self, state):
         dct = state.output
         dct = {key: value.detach().cpu().numpy() for key, value in dct.items()}
+        if not self.memmap:
+            for key, value in dct.items():
+                self.predictions[key].append(value)
+            return
+
+        start = self._num_samples
         for key, value in dct.items():
-            self.predictions[key].append(value)
+            if key not in self.predictions:
+                self.predictions[key] = np.lib.format.open_memmap(
+                    self._get_filename(state.loader_name, key),
+                    mode="w+",
+                    dtype=value.dtype,
+                    shape=(self._capacity, ) + value.shape[1:]
+                )
+            self.predictions[key][start:start + len(value)] = value
+            self._num_samples = start + len(value)
+        self._num_batches += 1
+
+        if self._num_batches % self.flush_every == 0:
+            self._flush(state)
 
     def on_loader_end(self, state):
+        if self.memmap:
+            self._flush(state)
+            keys = list(self.predictions.keys())
+            self.predictions = {}
+            for key in keys:
+                filename = self._get_filename(state.loader_name, key)
+                _truncate_npy(filename, self._num_samples)
+                self.predictions[key] = np.load(filename, mmap_mode="r")
+            os.remove(self._get_progress_filename(state.loader_name))
+            return
+
         self.predictions = {
             key: np.concatenate(value, axis=0)
             for key, value in self.predictions.items()
@@ -66,7 +209,15 @@ class InferMaskCallback(Callback):
         threshold=None,
         name_key=None,
         dump_mask=False,
+        num_workers=4,
+        max_pending=None,
     ):
+        """
+        :param num_workers: number of threads to render and write images
+        :param max_pending: maximum number of images waiting for writing,
+            the next batch waits if there are more, ``4 * num_workers``
+            by default
+        """
         self.out_dir = out_dir
         self.out_prefix = out_prefix
         self.mean = mean or np.array([0.485, 0.456, 0.406])
@@ -80,9 +231,16 @@ class InferMaskCallback(Callback):
         self.output_key = output_key
         self.name_key = name_key
         self.dump_mask = dump_mask
+        self.num_workers = num_workers
+        self.max_pending = max_pending or 4 * num_workers
         self.counter = 0
         self._keys_from_state = ["out_dir", "out_prefix"]
 
+        # same footprint as skimage.morphology.disk(4)
+        self._kernel = np.uint8(np.hypot(*np.ogrid[-4:5, -4:5]) <= 4)
+        self._executor = None
+        self._pending = deque()
+
     def on_stage_start(self, state):
         for key in self._keys_from_state:
             value = getattr(state, key, None)
@@ -93,6 +251,7 @@ class InferMaskCallback(Callback):
             self.out_prefix = str(self.out_dir) + "/" + str(self.out_prefix)
         if self.out_prefix is not None:
             os.makedirs(os.path.dirname(self.out_prefix), exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
 
     @staticmethod
     def _get_spaced_colors2(n_colors, seed=42):
@@ -108,13 +267,40 @@ class InferMaskCallback(Callback):
             ret.append((int(r) % 256, int(g) % 256, int(b) % 256))
         return ret
 
+    def _wait(self, max_pending=0):
+        while len(self._pending) > max_pending:
+            self._pending.popleft().result()
+
+    def _render(self, img, masks, colors, filename):
+        """
+        Draws contours of all mask channels over the image and saves it
+
+        :param img: RGB image, uint8 array of shape HxWx3
+        :param masks: float32 masks of shape HxWxC
+        :param colors: color for every mask channel
+        :param filename: filename without extension
+        """
+        if self.dump_mask:
+            for t in range(masks.shape[2]):
+                cv2.imwrite(f"{filename}_{t}.jpg", masks[:, :, t] * 255)
+
+        # erosion of all channels at once, cv2 keeps the channels axis
+        # only for multichannel images
+        eroded = cv2.erode(masks, self._kernel)
+        contours = (masks - eroded.reshape(masks.shape)) > 0.5
+
+        shw = img.copy()
+        for t in range(masks.shape[2]):
+            shw[contours[:, :, t]] = colors[t]
+        cv2.imwrite(f"{filename}.jpg", shw[:, :, ::-1])
+
     def on_loader_start(self, state):
-        lm = state.loader_mode
+        lm = state.loader_name
         os.makedirs(f"{self.out_prefix}/{lm}/", exist_ok=True)
 
     def on_batch_end(self, state):
-        lm = state.loader_mode
-        names = state.input.get(self.name_key, {})
+        lm = state.loader_name
+        names = state.input.get(self.name_key, None)
 
         features = state.input[self.input_key]
         logits = state.output[self.output_key]
@@ -123,38 +309,40 @@ class InferMaskCallback(Callback):
             else logits
 
         if self.mask_type == "soft":
-            probs = F.sigmoid(logits)
+            probs = torch.sigmoid(logits)
         else:
             probs = F.softmax(logits, dim=1)
+        if self.threshold is not None:
+            probs = probs > self.threshold
 
-        features = features.detach().cpu().numpy()
+        features = features.detach().float().cpu().numpy()
         features = np.transpose(features, (0, 2, 3, 1))
+        images = np.uint8(255 * (self.std * features + self.mean))
 
-        probs = probs.detach().cpu().numpy()
-        probs = np.transpose(probs, (0, 2, 3, 1))
+        masks = probs.detach().float().cpu().numpy()
+        masks = np.ascontiguousarray(np.transpose(masks, (0, 2, 3, 1)))
 
-        colors = self._get_spaced_colors2(n_colors=probs.shape[3])
-        for i in range(probs.shape[0]):
-            img = np.uint8(255 * (self.std * features[i] + self.mean))
-            suffix = names.get(i, f"{self.counter}:6d")
+        colors = self._get_spaced_colors2(n_colors=masks.shape[3])
+        for i in range(masks.shape[0]):
+            suffix = names[i] if names is not None else f"{self.counter:06d}"
             self.counter += 1
 
-            shw = img.copy()
-            for t in range(probs.shape[3]):
-                mask = probs[i, :, :, t] > self.threshold \
-                    if self.threshold is not None \
-                    else probs[i, :, :, t]
-                mask = mask.astype(np.float32)
-
-                if self.dump_mask:
-                    mask_ = np.concatenate(
-                        [np.expand_dims(mask, -1)] * 3,
-                        axis=-1).astype(np.float32) * 255
-                    filename_ = f"{self.out_prefix}/{lm}/{suffix}_{t}.jpg"
-                    cv2.imwrite(filename_, mask_)
-
-                mask = mask - erosion(mask, disk(4))
-                shw[mask > 0.5] = colors[t]
-
-            filename = f"{self.out_prefix}/{lm}/{suffix}.jpg"
-            cv2.imwrite(filename, shw[:, :, ::-1])
+            # backpressure: waits for the oldest images
+            self._wait(self.max_pending - 1)
+            self._pending.append(
+                self._executor.submit(
+                    self._render,
+                    images[i],
+                    masks[i],
+                    colors,
+                    f"{self.out_prefix}/{lm}/{suffix}"
+                )
+            )
+
+    def on_loader_end(self, state):
+        self._wait()
+
+    def on_stage_end(self, state):
+        self._wait()
+        self._executor.shutdown()
+        self._executor = None
@@ -175,7 +175,11 @@ class TensorboardLogger(Callback):
         self,
         metric_names: List[str] = None,
         log_on_batch_end=True,
-        log_on_epoch_end=True
+        log_on_epoch_end=True,
+        batch_log_interval: int = 1,
+        batch_reduce: str = "last",
+        asynchronous: bool = False,
+        max_queue_size: int = 1000
     ):
         """
         :param logdir: directory where logs will be created
@@ -184,22 +188,41 @@ class TensorboardLogger(Callback):
         :param log_on_batch_end: Logs per-batch value of metrics,
             prepends 'batch_' prefix to their names.
         :param log_on_epoch_end: Logs per-epoch metrics if set True.
+        :param batch_log_interval: Logs batch metrics every N batches.
+        :param batch_reduce: How to reduce batch metrics between logs:
+            "last" - logs values of every N-th batch only,
+            "mean" - logs average values of the last N batches.
+        :param asynchronous: Writes events in a background thread.
+        :param max_queue_size: Maximum number of not written events
+            for the asynchronous writer.
         """
         self.metrics_to_log = metric_names
         self.log_on_batch_end = log_on_batch_end
         self.log_on_epoch_end = log_on_epoch_end
+        self.batch_log_interval = batch_log_interval
+        self.batch_reduce = batch_reduce
+        self.asynchronous = asynchronous
+        self.max_queue_size = max_queue_size
 
         assert self.log_on_batch_end or self.log_on_epoch_end, \
             "You have to log something!"
+        assert batch_log_interval > 0
+        assert batch_reduce in ["last", "mean"], \
+            f"unknown batch_reduce: {batch_reduce}"
 
         self.loggers = dict()
+        self._batch_counter = 0
 
     def on_loader_start(self, state):
         lm = state.loader_name
         if lm not in self.loggers:
             self.loggers[lm] = UtilsFactory.create_tflogger(
-                logdir=state.logdir, name=lm
+                logdir=state.logdir,
+                name=lm,
+                asynchronous=self.asynchronous,
+                max_queue_size=self.max_queue_size
             )
+        self._batch_counter = 0
 
     def _log_metrics(
         self, metrics: Dict[str, float], step: int, mode: str, suffix=""
@@ -213,18 +236,30 @@ class TensorboardLogger(Callback):
                     f"{name}{suffix}", metrics[name], step
                 )
 
+    def _log_batch_metrics(self, state: RunnerState):
+        if self.batch_reduce == "mean":
+            # deferred metrics are synced only on the log batches
+            metrics_ = state.metrics.pop_window_means()
+        else:
+            metrics_ = state.metrics.batch_values
+        self._log_metrics(
+            metrics=metrics_,
+            step=state.step,
+            mode=state.loader_name,
+            suffix="/batch"
+        )
+
     def on_batch_end(self, state: RunnerState):
         if self.log_on_batch_end:
-            mode = state.loader_name
-            metrics_ = state.metrics.batch_values
-            self._log_metrics(
-                metrics=metrics_,
-                step=state.step,
-                mode=mode,
-                suffix="/batch"
-            )
+            self._batch_counter += 1
+            if self._batch_counter % self.batch_log_interval == 0:
+                self._log_batch_metrics(state)
 
     def on_loader_end(self, state: RunnerState):
+        if self.log_on_batch_end and self.batch_reduce == "mean" \
+                and self._batch_counter % self.batch_log_interval != 0:
+            # logs the last partial window
+            self._log_batch_metrics(state)
         if self.log_on_epoch_end:
             mode = state.loader_name
             metrics_ = state.metrics.epoch_values[mode]
@@ -234,3 +269,8 @@ class TensorboardLogger(Callback):
                 mode=mode,
                 suffix="/epoch"
             )
+
+    def on_stage_end(self, state: RunnerState):
+        for logger in self.loggers.values():
+            logger.close()
+        self.loggers = dict()
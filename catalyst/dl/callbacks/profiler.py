@@ -0,0 +1,44 @@
+import os
+
+from catalyst.dl.profiler import Profiler
+from catalyst.dl.state import RunnerState
+from .core import Callback
+
+
+class ProfilerCallback(Callback):
+    """
+    Profiles every stage: callback hooks, state hooks (loggers),
+    data fetching, forward, backward and optimizer step.
+    On the stage end saves ``<stage>.trace.json`` (open it with
+    ``chrome://tracing``) and ``<stage>.summary.txt``
+    to the ``profiler`` folder in the logdir.
+    """
+
+    def __init__(self, max_events: int = 1000000, verbose: bool = True):
+        """
+        Args:
+            max_events (int): maximum number of spans in the trace
+            verbose (bool): if True, prints summary table on the stage end
+        """
+        self.max_events = max_events
+        self.verbose = verbose
+
+    def on_stage_start(self, state: RunnerState):
+        state.profiler = Profiler(max_events=self.max_events)
+
+    def on_stage_end(self, state: RunnerState):
+        profiler, state.profiler = state.profiler, None
+        if profiler is None:
+            return
+
+        if state.logdir is not None:
+            profiler_dir = f"{state.logdir}/profiler"
+            os.makedirs(profiler_dir, exist_ok=True)
+            profiler.export_chrome_trace(
+                f"{profiler_dir}/{state.stage}.trace.json"
+            )
+            profiler.export_summary(
+                f"{profiler_dir}/{state.stage}.summary.txt"
+            )
+        if self.verbose:
+            print(profiler.summary_table())
@@ -0,0 +1,70 @@
+from catalyst.dl.pruning import TrialCoordinator
+from catalyst.dl.state import RunnerState
+from .core import Callback
+
+
+class PruningCallback(Callback):
+    """
+    Reports validation metric of every epoch to the
+    :class:`catalyst.dl.pruning.TrialCoordinator`
+    and stops the experiment if the coordinator prunes the trial
+    """
+
+    def __init__(
+        self,
+        storage: str,
+        study: str = "default",
+        trial: str = None,
+        metric: str = "loss",
+        minimize: bool = True,
+        rule: str = "median",
+        warmup_epochs: int = 1,
+        min_trials: int = 4,
+        min_epochs: int = 1,
+        reduction_factor: int = 3,
+    ):
+        """
+        Args:
+            storage (str): path to the SQLite database of the study
+            study (str): name of the study
+            trial (str): name of the trial, logdir by default
+            metric (str): validation metric to compare trials by
+            minimize (bool): whether the metric should be minimized
+            rule (str): pruning rule, "median" or "halving"
+            warmup_epochs (int): median rule, number of first epochs,
+                when the trial is not pruned
+            min_trials (int): median rule, minimum number of other trials
+            min_epochs (int): halving rule, epoch of the first rung
+            reduction_factor (int): halving rule reduction factor
+        """
+        self.trial = trial
+        self.metric = metric
+        self.coordinator = TrialCoordinator(
+            storage=storage,
+            study=study,
+            rule=rule,
+            minimize=minimize,
+            warmup_epochs=warmup_epochs,
+            min_trials=min_trials,
+            min_epochs=min_epochs,
+            reduction_factor=reduction_factor
+        )
+
+    def on_stage_start(self, state: RunnerState):
+        if self.trial is None:
+            self.trial = str(state.logdir)
+
+    def on_epoch_end(self, state: RunnerState) -> None:
+        if state.stage.startswith("infer"):
+            return
+
+        epoch = state.epoch + 1
+        score = state.metrics.valid_values[self.metric]
+        self.coordinator.report(self.trial, epoch, score, stage=state.stage)
+        if self.coordinator.should_prune(self.trial, epoch, stage=state.stage):
+            print(f"Trial pruned at {state.epoch} epoch of {state.stage}")
+            # remaining stages are skipped too
+            state.stop_experiment = True
+
+
+__all__ = ["PruningCallback"]
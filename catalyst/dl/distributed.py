@@ -0,0 +1,170 @@
+from typing import Callable, Dict, Tuple
+import os
+import socket
+
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+
+def is_distributed() -> bool:
+    """
+    Returns:
+        bool: True if the process is a part of initialized process group
+    """
+    return dist.is_available() and dist.is_initialized()
+
+
+def get_rank() -> int:
+    return dist.get_rank() if is_distributed() else 0
+
+
+def get_world_size() -> int:
+    return dist.get_world_size() if is_distributed() else 1
+
+
+def is_master() -> bool:
+    """
+    Returns:
+        bool: True for the rank 0 process and for non-distributed runs
+    """
+    return get_rank() == 0
+
+
+def barrier() -> None:
+    if is_distributed():
+        dist.barrier()
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+def get_default_backend() -> str:
+    return "nccl" if torch.cuda.is_available() else "gloo"
+
+
+def init_distributed(
+    rank: int,
+    world_size: int,
+    backend: str = None,
+    master_addr: str = "127.0.0.1",
+    master_port: int = None,
+) -> None:
+    """
+    Initializes process group for the current process.
+    With CUDA every process uses device ``cuda:{rank % device_count}``,
+    on CPU every process is pinned to its own group of cores.
+
+    Args:
+        rank (int): process rank
+        world_size (int): number of processes
+        backend (str): ``torch.distributed`` backend,
+            nccl for CUDA and gloo for CPU by default
+        master_addr (str): address of the rank 0 process
+        master_port (int): free port of the rank 0 process
+    """
+    os.environ.setdefault("MASTER_ADDR", master_addr)
+    if master_port is not None:
+        os.environ["MASTER_PORT"] = str(master_port)
+    os.environ.setdefault("MASTER_PORT", "29500")
+
+    if torch.cuda.is_available():
+        torch.cuda.set_device(rank % torch.cuda.device_count())
+    else:
+        cores = sorted(os.sched_getaffinity(0)) \
+            if hasattr(os, "sched_getaffinity") \
+            else list(range(os.cpu_count() or 1))
+        group_size = max(1, len(cores) // world_size)
+        group = cores[rank * group_size:(rank + 1) * group_size] or cores
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, group)
+        torch.set_num_threads(len(group))
+
+    dist.init_process_group(
+        backend=backend or get_default_backend(),
+        rank=rank,
+        world_size=world_size
+    )
+
+
+def all_reduce_means(
+    means: Dict[str, float], counts: Dict[str, int]
+) -> Dict[str, float]:
+    """
+    Averages metric means across all processes,
+    weighting every process by its number of values
+
+    Args:
+        means (Dict[str, float]): metric means of the current process
+        counts (Dict[str, int]): number of values behind every mean
+
+    Returns:
+        Dict[str, float]: metric means over all processes
+    """
+    if not is_distributed():
+        return means
+
+    names = sorted(means.keys())
+    values = torch.tensor(
+        [[means[name] * counts[name] for name in names],
+         [counts[name] for name in names]],
+        dtype=torch.float64
+    )
+    if dist.get_backend() == "nccl":
+        values = values.cuda()
+    dist.all_reduce(values)
+    values = values.cpu()
+    return {
+        name: (values[0, i] / values[1, i]).item()
+        for i, name in enumerate(names)
+    }
+
+
+def _worker(
+    rank: int,
+    fn: Callable,
+    world_size: int,
+    backend: str,
+    master_port: int,
+    args: Tuple,
+):
+    init_distributed(
+        rank=rank,
+        world_size=world_size,
+        backend=backend,
+        master_port=master_port
+    )
+    try:
+        fn(*args)
+    finally:
+        dist.destroy_process_group()
+
+
+def launch(
+    fn: Callable, world_size: int, backend: str = None, args: Tuple = ()
+) -> None:
+    """
+    Runs ``fn(*args)`` in ``world_size`` processes
+    with initialized process group
+
+    Args:
+        fn (Callable): function to run, should be picklable
+        world_size (int): number of processes
+        backend (str): ``torch.distributed`` backend
+        args (Tuple): ``fn`` arguments
+    """
+    mp.spawn(
+        _worker,
+        args=(fn, world_size, backend, get_free_port(), args),
+        nprocs=world_size,
+        join=True
+    )
+
+
+__all__ = [
+    "is_distributed", "get_rank", "get_world_size", "is_master", "barrier",
+    "init_distributed", "all_reduce_means", "launch"
+]
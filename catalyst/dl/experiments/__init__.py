@@ -1,4 +1,5 @@
 # flake8: noqa
 from .experiment import Experiment, BaseExperiment, ConfigExperiment, \
     SupervisedExperiment
-from .runner import Runner, SupervisedRunner
+from .runner import Runner, SupervisedRunner, EnsembleRunner, \
+    BatchPrefetcher
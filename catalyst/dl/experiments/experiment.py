@@ -1,10 +1,13 @@
 from abc import abstractmethod, ABC
 from typing import Iterable, Any, Mapping, Dict, List
 from collections import OrderedDict
+import inspect
+import json
 
 import torch
 from torch import nn, optim
 from torch.utils.data import DataLoader, Dataset  # noqa F401
+from torch.utils.data.distributed import DistributedSampler
 
 from catalyst.contrib.registry import Registry
 from catalyst.dl.callbacks import Callback  # noqa F401
@@ -12,8 +15,13 @@ from catalyst.dl.callbacks import LossCallback, OptimizerCallback, \
     SchedulerCallback, CheckpointCallback
 from catalyst.dl.utils import UtilsFactory
 from catalyst.dl.fp16 import Fp16Wrap
+from catalyst.dl.distributed import is_distributed
 from catalyst.utils.misc import merge_dicts
 
+# persistent loader workers are available since torch 1.7
+_PERSISTENT_WORKERS = \
+    "persistent_workers" in inspect.signature(DataLoader).parameters
+
 _Model = nn.Module
 _Criterion = nn.Module
 _Optimizer = optim.Optimizer
@@ -83,6 +91,13 @@ class Experiment(ABC):
     def get_transforms(stage: str = None, mode: str = None):
         raise NotImplementedError
 
+    def close(self) -> None:
+        """
+        Releases experiment resources (e.g. loader workers),
+        called by the runner after the last stage
+        """
+        pass
+
 
 class BaseExperiment(Experiment):
     """
@@ -202,6 +217,8 @@ class ConfigExperiment(Experiment):
         self._logdir = \
             self._config.get("args", {}).get("logdir", None) \
             or self._prepare_logdir(config)
+        # loaders with persistent workers, by data params or by stage
+        self._loaders: Dict[str, "OrderedDict[str, DataLoader]"] = {}
 
     def _prepare_stages_config(self, stages_config):
         stages_defaults = {}
@@ -270,11 +287,29 @@ class ConfigExperiment(Experiment):
         return scheduler
 
     def get_loaders(self, stage: str) -> "OrderedDict[str, DataLoader]":
+        """
+        Creates stage loaders. If ``data_params.persistent_workers``
+        is True (torch>=1.7), loaders keep their workers between epochs,
+        so changes of the datasets in the main process don't reach them.
+        Set ``data_params.reuse_loaders: True`` to share such loaders
+        between the stages with the same ``data_params``,
+        if datasets don't depend on the stage
+        """
         data_conf = dict(self.stages_config[stage]["data_params"])
+        persistent_workers = data_conf.pop("persistent_workers", False)
+        reuse_loaders = data_conf.pop("reuse_loaders", False)
+        assert _PERSISTENT_WORKERS or not persistent_workers, \
+            "persistent workers require torch>=1.7"
+
+        key = json.dumps(data_conf, sort_keys=True, default=str) \
+            if reuse_loaders else f"stage:{stage}"
+        if persistent_workers and key in self._loaders:
+            return self._loaders[key]
 
         batch_size = data_conf.pop("batch_size")
         num_workers = data_conf.pop("num_workers")
         drop_last = data_conf.pop("drop_last", False)
+        persistent_workers = persistent_workers and num_workers > 0
 
         datasets = self.get_datasets(stage=stage, **data_conf)
 
@@ -286,6 +321,8 @@ class ConfigExperiment(Experiment):
                 "pin_memory": torch.cuda.is_available(),
                 "drop_last": drop_last,
             }
+            if persistent_workers:
+                loader_params["persistent_workers"] = True
             if isinstance(ds_, Dataset):
                 loader_params["dataset"] = ds_
                 loader_params["shuffle"] = name.startswith("train")
@@ -298,10 +335,40 @@ class ConfigExperiment(Experiment):
                 loader_params = merge_dicts(ds_, loader_params)
             else:
                 raise NotImplementedError
+
+            if is_distributed() and loader_params.get("sampler") is None:
+                # every process reads its own shard of the dataset
+                loader_params["sampler"] = DistributedSampler(
+                    loader_params["dataset"],
+                    shuffle=loader_params["shuffle"]
+                )
+                loader_params["shuffle"] = False
             loaders[name] = DataLoader(**loader_params)
 
+        if persistent_workers:
+            if not reuse_loaders:
+                # stage loaders are not needed after the stage
+                for key_ in list(self._loaders):
+                    if key_.startswith("stage:"):
+                        self._close_loaders(self._loaders.pop(key_))
+            self._loaders[key] = loaders
         return loaders
 
+    @staticmethod
+    def _close_loaders(loaders: "OrderedDict[str, DataLoader]") -> None:
+        """Shuts down persistent workers of the loaders"""
+        for loader in loaders.values():
+            # relies on the private DataLoader attribute: persistent workers
+            # are shut down when their iterator is garbage collected,
+            # but the loader keeps the iterator while it's referenced
+            loader._iterator = None
+        loaders.clear()
+
+    def close(self) -> None:
+        for loaders in self._loaders.values():
+            self._close_loaders(loaders)
+        self._loaders = {}
+
     def get_callbacks(self, stage: str) -> "List[Callback]":
         callbacks_params = (
             self.stages_config[stage].get("callbacks_params", {}))
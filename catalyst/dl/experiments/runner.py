@@ -1,12 +1,21 @@
-from typing import Any, Mapping, Dict, List
+from typing import Any, Callable, Mapping, Dict, List, Union
 from abc import ABC, abstractmethod
 from collections import OrderedDict  # noqa F401
+import copy
+import glob
+import os
+import queue
+import threading
 
 import torch
 from torch import nn, optim
-from torch.utils.data import DataLoader  # noqa F401
+from torch.utils.data import DataLoader, RandomSampler
 
+from catalyst.data.sampler import SkipBatchSampler
 from catalyst.dl.callbacks import Callback
+from catalyst.dl.distributed import barrier
+from catalyst.dl.fp16 import autocast
+from catalyst.dl.profiler import perf_counter_ns, profile_span
 from catalyst.dl.state import RunnerState
 from catalyst.dl.utils import UtilsFactory
 from . import Experiment, SupervisedExperiment
@@ -18,7 +27,78 @@ _Optimizer = optim.Optimizer
 _Scheduler = optim.lr_scheduler._LRScheduler
 
 
+class BatchPrefetcher:
+    """
+    Wraps a loader and prepares next ``num_batches`` batches
+    in a background thread, so data loading and host to device transfer
+    overlap with the model step.
+    """
+
+    _end = object()
+
+    def __init__(
+        self, loader, batch_fn: Callable = None, num_batches: int = 2
+    ):
+        """
+        Args:
+            loader: loader to iterate over, usually ``DataLoader``
+            batch_fn (callable): function to apply to every batch
+                in the background thread, for example transfer to device
+            num_batches (int): number of batches to keep ready
+        """
+        assert num_batches > 0
+        self.loader = loader
+        self.batch_fn = batch_fn
+        self.num_batches = num_batches
+
+    def __len__(self) -> int:
+        return len(self.loader)
+
+    def _worker(self, batches: queue.Queue, stop: threading.Event):
+        def put(item):
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            for batch in self.loader:
+                if self.batch_fn is not None:
+                    batch = self.batch_fn(batch)
+                if not put((batch, None)):
+                    return
+            put((self._end, None))
+        except Exception as e:
+            put((None, e))
+
+    def __iter__(self):
+        batches = queue.Queue(maxsize=self.num_batches)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._worker, args=(batches, stop), daemon=True
+        )
+        thread.start()
+        try:
+            while True:
+                batch, error = batches.get()
+                if error is not None:
+                    raise error
+                if batch is self._end:
+                    break
+                yield batch
+        finally:
+            stop.set()
+            thread.join()
+
+
 class Runner(ABC):
+    _events = [
+        "stage_start", "stage_end", "epoch_start", "epoch_end",
+        "loader_start", "loader_end", "batch_start", "batch_end"
+    ]
 
     def __init__(
         self,
@@ -34,6 +114,7 @@ class Runner(ABC):
         self.experiment: Experiment = None
         self.state: RunnerState = None
         self.callbacks: List[Callback] = None
+        self._event_handlers: Dict[str, tuple] = {}
 
         # additional
         self._check_run = False
@@ -41,9 +122,12 @@ class Runner(ABC):
         if model is not None and device is None:
             self._prepare_model()
 
-    def _batch2device(self, batch: Mapping[str, Any], device):
+    def _batch2device(
+        self, batch: Mapping[str, Any], device, non_blocking: bool = False
+    ):
         res = {
-            key: value.to(device) if torch.is_tensor(value) else value
+            key: value.to(device, non_blocking=non_blocking)
+            if torch.is_tensor(value) else value
             for key, value in batch.items()
         }
         return res
@@ -84,17 +168,68 @@ class Runner(ABC):
             **migrating_params
         )
 
-    def _run_event(self, event: str):
-
-        if self.state is not None and hasattr(self.state, f"on_{event}_pre"):
-            getattr(self.state, f"on_{event}_pre")()
+    @staticmethod
+    def _get_callback_names(callbacks: List[Callback]) -> List[str]:
+        names = [type(callback).__name__ for callback in callbacks]
+        counts = {name: names.count(name) for name in names}
+        result, seen = [], {}
+        for name in names:
+            if counts[name] > 1:
+                seen[name] = seen.get(name, -1) + 1
+                name = f"{name}_{seen[name]}"
+            result.append(name)
+        return result
+
+    def _prepare_event_handlers(self):
+        """
+        Resolves state and callback hooks once per stage.
+        Only callbacks, that override a hook of the base ``Callback``,
+        are called for the corresponding event.
+        """
+        callbacks = self.callbacks or []
+        names = self._get_callback_names(callbacks)
+
+        self._event_handlers = {}
+        for event in self._events:
+            hook = f"on_{event}"
+            base_hook = getattr(Callback, hook)
+            handlers = [
+                (name, getattr(callback, hook))
+                for name, callback in zip(names, callbacks)
+                if getattr(type(callback), hook, None) is not base_hook
+            ]
+            pre = getattr(self.state, f"{hook}_pre", None)
+            post = getattr(self.state, f"{hook}_post", None)
+            self._event_handlers[event] = (pre, handlers, post)
 
-        if self.callbacks is not None:
-            for callback in self.callbacks:
-                getattr(callback, f"on_{event}")(self.state)
+    def _run_event(self, event: str):
+        pre, handlers, post = self._event_handlers[event]
+        profiler = self.state.profiler
+
+        if pre is not None:
+            with profile_span(profiler, f"state.{pre.__name__}", "state"):
+                pre()
+
+        time_callbacks = \
+            self.state.profile_callbacks and event.startswith("batch")
+        if profiler is not None or time_callbacks:
+            elapsed = self.state.timer.elapsed
+            for name, handler in handlers:
+                start = perf_counter_ns()
+                handler(self.state)
+                end = perf_counter_ns()
+                if profiler is not None:
+                    profiler.add(f"{name}.on_{event}", "callback", start, end)
+                if time_callbacks:
+                    key = f"callbacks/{name}"
+                    elapsed[key] = elapsed.get(key, 0) + (end - start) / 1e9
+        else:
+            for name, handler in handlers:
+                handler(self.state)
 
-        if self.state is not None and hasattr(self.state, f"on_{event}_post"):
-            getattr(self.state, f"on_{event}_post")()
+        if post is not None:
+            with profile_span(profiler, f"state.{post.__name__}", "state"):
+                post()
 
     @abstractmethod
     def predict_batch(self, batch: Mapping[str, Any]):
@@ -102,34 +237,113 @@ class Runner(ABC):
 
     def _run_batch(self, batch):
         self.state.step += self.state.batch_size
-        batch = self._batch2device(batch, self.device)
         self.state.input = batch
-        self.state.output = self.predict_batch(batch)
+        with autocast(self.device, self.state.autocast_dtype):
+            self.state.output = self.predict_batch(batch)
+
+    @staticmethod
+    def _get_sampler_generator(loader) -> Union[torch.Generator, None]:
+        sampler = getattr(loader, "sampler", None)
+        if not isinstance(sampler, RandomSampler) \
+                or not hasattr(sampler, "generator"):
+            return None
+        loader_generator = getattr(loader, "generator", None)
+        if sampler.generator is None or sampler.generator is loader_generator:
+            # the sampler gets its own generator, so the order of batches
+            # depends only on its state and not on the workers start,
+            # e.g. persistent workers don't draw a new seed every epoch
+            seed = torch.empty((), dtype=torch.int64).random_(
+                generator=sampler.generator
+            ).item()
+            sampler.generator = torch.Generator().manual_seed(seed)
+        return sampler.generator
+
+    @staticmethod
+    def _skip_batches(loader: DataLoader, num_batches: int) -> DataLoader:
+        assert isinstance(loader, DataLoader), \
+            "only DataLoader batches can be skipped"
+        kwargs = dict(
+            num_workers=loader.num_workers,
+            collate_fn=loader.collate_fn,
+            pin_memory=loader.pin_memory,
+            timeout=loader.timeout,
+            worker_init_fn=loader.worker_init_fn
+        )
+        # loader params of the later torch versions
+        for key in [
+            "multiprocessing_context", "generator", "prefetch_factor",
+            "persistent_workers", "pin_memory_device", "in_order"
+        ]:
+            if hasattr(loader, key):
+                kwargs[key] = getattr(loader, key)
+        return DataLoader(
+            loader.dataset,
+            batch_sampler=SkipBatchSampler(loader.batch_sampler, num_batches),
+            **kwargs
+        )
 
     def _run_loader(self, loader):
+        sampler = getattr(loader, "sampler", None)
+        if hasattr(sampler, "set_epoch"):
+            # reshuffles distributed sampler every epoch
+            sampler.set_epoch(self.state.epoch)
+
         self.state.batch_size = loader.batch_size
+        self.state.loader_step = self.state.skip_batches
+        if self.state.skip_batches > 0:
+            # callbacks can ask to continue the loader from some batch
+            loader = self._skip_batches(loader, self.state.skip_batches)
+            self.state.skip_batches = 0
         self.state.step = (
             self.state.step
             or self.state.epoch * len(loader) * self.state.batch_size
         )
+
+        profiler = self.state.profiler
+
+        # starts loader workers, persistent workers are only resumed
+        start = perf_counter_ns()
+        with profile_span(profiler, "workers_start", "loader"):
+            loader = iter(loader)
+        self.state.workers_start_time = (perf_counter_ns() - start) / 1e9
+
+        if self.state.prefetch_batches > 0:
+            batches = BatchPrefetcher(
+                loader,
+                batch_fn=lambda x: self._batch2device(
+                    x, self.device, non_blocking=True
+                ),
+                num_batches=self.state.prefetch_batches
+            )
+        else:
+            batches = map(lambda x: self._batch2device(x, self.device), loader)
+
         # @TODO: remove time usage, use it under the hood
         self.state.timer.reset()
 
         self.state.timer.start("base/batch_time")
         self.state.timer.start("base/data_time")
+        if profiler is not None:
+            profiler.start("batch", "loader")
+            profiler.start("data", "loader")
 
-        for i, batch in enumerate(loader):
-            batch = self._batch2device(batch, self.device)
+        for i, batch in enumerate(batches):
             self.state.timer.stop("base/data_time")
+            if profiler is not None:
+                profiler.stop()
 
             self._run_event("batch_start")
 
             self.state.timer.start("base/model_time")
-            self._run_batch(batch)
+            with profile_span(profiler, "forward", "model"):
+                self._run_batch(batch)
             self.state.timer.stop("base/model_time")
+            self.state.loader_step += 1
 
             self.state.timer.stop("base/batch_time")
             self._run_event("batch_end")
+            if profiler is not None:
+                profiler.stop()
 
             self.state.timer.reset()
 
@@ -138,6 +352,12 @@ class Runner(ABC):
 
             self.state.timer.start("base/batch_time")
             self.state.timer.start("base/data_time")
+            if profiler is not None:
+                profiler.start("batch", "loader")
+                profiler.start("data", "loader")
+
+        if profiler is not None:
+            profiler.cancel("batch")
 
     def _run_epoch(self, loaders):
         # @TODO: better solution with train/inference handling ?
@@ -150,14 +370,27 @@ class Runner(ABC):
                 "for inference no train loader should be passed"
 
         for loader_name in loaders:
+            if self.state.resume_loader is not None:
+                # skips loaders, finished before the interruption
+                if loader_name != self.state.resume_loader:
+                    continue
+                self.state.resume_loader = None
+
             self.state.loader_name = loader_name
             self.state.loader_len = len(loaders[loader_name])
+            self.state.batch_size = loaders[loader_name].batch_size
+            self.state.sampler_generator = \
+                self._get_sampler_generator(loaders[loader_name]) \
+                if self.state.seed_sampler else None
             self.state.need_backward = loader_name.startswith("train")
             self.model.train(self.state.need_backward)
 
-            self._run_event("loader_start")
-            self._run_loader(loaders[loader_name])
-            self._run_event("loader_end")
+            with profile_span(
+                self.state.profiler, f"loader/{loader_name}", "loader"
+            ):
+                self._run_event("loader_start")
+                self._run_loader(loaders[loader_name])
+                self._run_event("loader_end")
 
     def _run_stage(self, stage: str):
         loaders = self.experiment.get_loaders(stage)
@@ -165,9 +398,10 @@ class Runner(ABC):
 
         self._prepare_state(stage)
         self.state.stage = stage
+        self._prepare_event_handlers()
 
         self._run_event("stage_start")
-        for epoch in range(self.state.num_epochs):
+        for epoch in range(self.state.start_epoch, self.state.num_epochs):
             self.state.epoch = epoch
 
             self._run_event("epoch_start")
@@ -176,10 +410,12 @@ class Runner(ABC):
 
             if self._check_run and epoch >= 3:
                 break
-            if self.state.early_stop:
+            if self.state.early_stop or self.state.stop_experiment:
                 self.state.early_stop = False
                 break
         self._run_event("stage_end")
+        # waits for the rank 0 process to save the stage checkpoints
+        barrier()
 
     def run_experiment(
         self,
@@ -189,8 +425,13 @@ class Runner(ABC):
         self._check_run = check
 
         self.experiment = experiment
-        for stage in self.experiment.stages:
-            self._run_stage(stage)
+        try:
+            for stage in self.experiment.stages:
+                self._run_stage(stage)
+                if self.state.stop_experiment:
+                    break
+        finally:
+            self.experiment.close()
         return self
 
 
@@ -221,16 +462,59 @@ class SupervisedRunner(Runner):
         self.input_key = input_key
         self.output_key = output_key
         self.target_key = input_target_key
+        self._jit_model = None
 
-    def _batch2device(self, batch: Mapping[str, Any], device):
+    def _prepare_state(self, stage: str):
+        super()._prepare_state(stage)
+        self._jit_model = None
+
+    def _get_jit_cache_path(self):
+        checkpoint_path = getattr(self.state, "resume", None)
+        if checkpoint_path is None and self.state.logdir is not None:
+            checkpoint_path = f"{self.state.logdir}/checkpoints/best.pth"
+        if checkpoint_path is None or not os.path.isfile(checkpoint_path):
+            return None
+
+        # compiled model is cached next to the checkpoint and keyed
+        # by the weights, callbacks can load any other checkpoint
+        model_hash = UtilsFactory.get_model_hash(self.model)[:16]
+        prefix = os.path.splitext(checkpoint_path)[0]
+        suffix = f".{self.state.jit}.{self.device.type}.pt"
+        cache_path = f"{prefix}.{model_hash}{suffix}"
+
+        # removes models compiled for the previous weights
+        pattern = glob.escape(prefix) + "." + "[0-9a-f]" * 16 + suffix
+        for path in glob.glob(pattern):
+            if path != cache_path:
+                os.remove(path)
+        return cache_path
+
+    def _get_jit_model(self, batch: Mapping[str, Any]):
+        if self._jit_model is None:
+            self._jit_model = UtilsFactory.get_jit_model(
+                self.model,
+                example_input=batch[self.input_key],
+                mode=self.state.jit,
+                cache_path=self._get_jit_cache_path(),
+                device=self.device
+            )
+        return self._jit_model
+
+    def _batch2device(
+        self, batch: Mapping[str, Any], device, non_blocking: bool = False
+    ):
         if isinstance(batch, (tuple, list)):
             assert len(batch) == 2
             batch = {self.input_key: batch[0], self.target_key: batch[1]}
-        batch = super()._batch2device(batch, device)
+        batch = super()._batch2device(batch, device, non_blocking)
         return batch
 
     def predict_batch(self, batch: Mapping[str, Any]):
-        output = self.model(batch[self.input_key])
+        if self.state.jit is not None and self.state.stage.startswith("infer"):
+            with torch.no_grad():
+                output = self._get_jit_model(batch)(batch[self.input_key])
+        else:
+            output = self.model(batch[self.input_key])
         output = {self.output_key: output}
         return output
 
@@ -276,8 +560,139 @@ class SupervisedRunner(Runner):
         callbacks: "List[Callback]" = None,
         verbose: bool = False,
         state_kwargs: Dict = None,
-        check: bool = False
+        check: bool = False,
+        jit: str = None
     ):
+        """
+        :param jit: "trace" or "script" to compile the model
+            with TorchScript on the first batch
+        """
+        if jit is not None:
+            state_kwargs = {**(state_kwargs or {}), "jit": jit}
+        experiment = self._default_experiment(
+            stage="infer",
+            model=model,
+            loaders=loaders,
+            callbacks=callbacks,
+            verbose=verbose,
+            state_kwargs=state_kwargs
+        )
+        self.run_experiment(experiment, check=check)
+
+
+class EnsembleRunner(SupervisedRunner):
+    """
+    Runner for inference with an ensemble of models:
+    every batch is loaded once and passed through all models.
+    Outputs of the i-th model are stored under ``<output_key>_<i>``,
+    their average is stored under ``output_key``.
+    """
+
+    def __init__(
+        self,
+        model: nn.ModuleList = None,
+        device=None,
+        input_key: str = "features",
+        output_key: str = "logits",
+        input_target_key: str = "targets",
+        devices: List = None,
+    ):
+        """
+        :param devices: devices to put the models on,
+            by default models are distributed over all available GPUs.
+            Models on different GPUs run concurrently,
+            as their kernels are launched asynchronously
+        """
+        self.devices = devices
+        self.model_devices: List[torch.device] = None
+        super().__init__(
+            model=model,
+            device=device,
+            input_key=input_key,
+            output_key=output_key,
+            input_target_key=input_target_key
+        )
+
+    @staticmethod
+    def load_models(model: nn.Module, checkpoints: List[str]) -> nn.ModuleList:
+        """
+        Creates a copy of ``model`` for every checkpoint
+        and loads the checkpoint weights to it
+
+        Args:
+            model (nn.Module): model architecture
+            checkpoints (List[str]): paths to the checkpoints
+
+        Returns:
+            nn.ModuleList: loaded models
+        """
+        models = nn.ModuleList()
+        for filepath in checkpoints:
+            model_ = copy.deepcopy(model)
+            checkpoint = UtilsFactory.load_checkpoint(filepath)
+            UtilsFactory.unpack_checkpoint(checkpoint, model=model_)
+            models.append(model_)
+        return models
+
+    def _get_model_devices(self, num_models: int) -> List[torch.device]:
+        if self.devices is not None:
+            devices = [torch.device(x) for x in self.devices]
+        elif torch.cuda.is_available():
+            devices = [
+                torch.device("cuda", i)
+                for i in range(torch.cuda.device_count())
+            ]
+        else:
+            devices = [torch.device("cpu")]
+        return [devices[i % len(devices)] for i in range(num_models)]
+
+    def _prepare_model(self, stage: str = None):
+        if stage is not None:
+            self.model = self.experiment.get_model(stage)
+        if not isinstance(self.model, nn.ModuleList):
+            self.model = nn.ModuleList(self.model)
+
+        self.model_devices = self._get_model_devices(len(self.model))
+        for model, device in zip(self.model, self.model_devices):
+            model.to(device)
+        # batches are loaded to the device of the first model
+        self.device = self.model_devices[0]
+
+    def predict_batch(self, batch: Mapping[str, Any]):
+        features = batch[self.input_key]
+        outputs = []
+        for model, device in zip(self.model, self.model_devices):
+            output = model(features.to(device))
+            outputs.append(output.to(self.device))
+
+        output = {
+            f"{self.output_key}_{i}": value
+            for i, value in enumerate(outputs)
+        }
+        output[self.output_key] = torch.stack(outputs).mean(dim=0)
+        return output
+
+    def train(self, *args, **kwargs):
+        raise NotImplementedError("EnsembleRunner supports only inference")
+
+    def infer(
+        self,
+        model: Union[_Model, List[_Model]],
+        loaders: "OrderedDict[str, DataLoader]",
+        callbacks: "List[Callback]" = None,
+        verbose: bool = False,
+        state_kwargs: Dict = None,
+        check: bool = False,
+        checkpoints: List[str] = None
+    ):
+        """
+        :param model: list of models
+            or model architecture to load ``checkpoints`` to
+        :param checkpoints: paths to the checkpoints of the ensemble models
+        """
+        if checkpoints is not None:
+            model = self.load_models(model, checkpoints)
+        model = nn.ModuleList(model)
         experiment = self._default_experiment(
             stage="infer",
             model=model,
@@ -1,6 +1,23 @@
+from contextlib import contextmanager
 import torch
 import torch.nn as nn
 
+try:
+    from contextlib import nullcontext
+except ImportError:  # python 3.6
+
+    @contextmanager
+    def nullcontext():
+        yield
+
+
+_MIXED_PRECISION_DTYPES = {
+    "fp16": torch.float16,
+    "float16": torch.float16,
+    "bf16": torch.bfloat16,
+    "bfloat16": torch.bfloat16,
+}
+
 
 def copy_params(source, target):
     for i in range(len(target)):
@@ -41,3 +58,51 @@ class Fp16Wrap(nn.Module):
         kwargs = {key: value.half() for key, value in kwargs.items()}
         output = self.network(*args, **kwargs)
         return output
+
+
+def get_autocast_dtype(mixed_precision, device=None):
+    """
+    Resolves mixed precision mode to the autocast dtype
+
+    Args:
+        mixed_precision: False/None to disable mixed precision,
+            True for float16 on CUDA and bfloat16 on CPU,
+            or dtype name: "fp16", "bf16", "float16", "bfloat16"
+        device: device the model is on
+
+    Returns:
+        torch.dtype: autocast dtype or None if disabled
+    """
+    if not mixed_precision:
+        return None
+    if mixed_precision is True:
+        device = torch.device(device or "cpu")
+        return torch.float16 if device.type == "cuda" else torch.bfloat16
+    assert mixed_precision in _MIXED_PRECISION_DTYPES, \
+        f"unknown mixed precision mode: {mixed_precision}"
+    return _MIXED_PRECISION_DTYPES[mixed_precision]
+
+
+def autocast(device=None, dtype=None):
+    """
+    Returns autocast context for the device,
+    the context does nothing if ``dtype`` is None
+    """
+    if dtype is None:
+        return nullcontext()
+    assert hasattr(torch, "autocast"), "mixed precision requires torch>=1.10"
+    device = torch.device(device or "cpu")
+    return torch.autocast(device_type=device.type, dtype=dtype)
+
+
+def create_grad_scaler(device=None, dtype=None):
+    """
+    Returns dynamic loss scaler for float16 autocast on CUDA,
+    bfloat16 has the float32 range and does not need loss scaling
+    """
+    device = torch.device(device or "cpu")
+    if dtype != torch.float16 or device.type != "cuda":
+        return None
+    if hasattr(torch.amp, "GradScaler"):
+        return torch.amp.GradScaler("cuda")
+    return torch.cuda.amp.GradScaler()
@@ -1,10 +1,13 @@
 from collections import defaultdict
-from time import time
+from time import perf_counter
 from numbers import Number
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+import torch
 from torchnet.meter import AverageValueMeter
 
+from .distributed import all_reduce_means
+
 
 class TimerManager:
     def __init__(self):
@@ -16,7 +19,7 @@ class TimerManager:
         Args:
             name (str): name of a timer
         """
-        self._starts[name] = time()
+        self._starts[name] = perf_counter()
 
     def stop(self, name: str) -> None:
         """Stops timer ``name``
@@ -25,7 +28,7 @@ class TimerManager:
         """
         assert name in self._starts, f"Timer '{name}' wasn't started"
 
-        self.elapsed[name] = time() - self._starts[name]
+        self.elapsed[name] = perf_counter() - self._starts[name]
         del self._starts[name]
 
     def reset(self) -> None:
@@ -46,18 +49,53 @@ class MetricManager:
         value = float(value)
         return value
 
+    @staticmethod
+    def _materialize(values_list: List[Dict[str, Any]]) -> None:
+        """
+        Converts all tensor values to python floats in place,
+        with one device synchronization per device
+        """
+        tensors = defaultdict(list)
+        for values in values_list:
+            for name, value in values.items():
+                if torch.is_tensor(value):
+                    tensors[value.device].append((values, name))
+
+        for items in tensors.values():
+            stacked = torch.stack(
+                [values[name].to(torch.float64) for values, name in items]
+            )
+            for (values, name), value in zip(items, stacked.tolist()):
+                values[name] = value
+
     def __init__(
         self,
         valid_loader: str = "valid",
         main_metric: str = "loss",
         minimize: bool = True,
+        sync_interval: int = 1,
     ):
+        """
+        Args:
+            valid_loader (str): loader to select the best epoch by
+            main_metric (str): metric to select the best epoch by
+            minimize (bool): whether the main metric should be minimized
+            sync_interval (int): number of batches to keep tensor metrics
+                on their device before converting them to python floats.
+                With ``1`` every metric is converted on the batch end.
+        """
+        assert sync_interval > 0
         self._valid_loader = valid_loader
         self._main_metric = main_metric
         self._minimize = minimize
+        self._sync_interval = sync_interval
 
         self._meters: Dict[str, AverageValueMeter] = None
-        self._batch_values: Dict[str, float] = None
+        self._batch_values: Dict[str, Any] = None
+        self._pending_values: List[Dict[str, Any]] = []
+        # sums of the synced batch values since the last window pop
+        self._window_sums: Dict[str, float] = defaultdict(float)
+        self._window_size = 0
         self.epoch_values: Dict[str, Dict[str:float]] = None
         self.valid_values: Dict[str, float] = None
 
@@ -89,10 +127,19 @@ class MetricManager:
     def begin_loader(self, name: str):
         self._current_loader_name = name
         self._meters = defaultdict(AverageValueMeter)
+        self._pending_values = []
+        self._window_sums = defaultdict(float)
+        self._window_size = 0
 
     def end_loader(self):
-        for name, meter in self._meters.items():
-            self.epoch_values[self._current_loader_name][name] = meter.mean
+        self.sync()
+        # averages metrics over all processes in distributed mode
+        means = all_reduce_means(
+            means={name: meter.mean for name, meter in self._meters.items()},
+            counts={name: meter.n for name, meter in self._meters.items()}
+        )
+        for name, value in means.items():
+            self.epoch_values[self._current_loader_name][name] = value
 
         self._current_loader_name = None
 
@@ -101,11 +148,44 @@ class MetricManager:
 
     def end_batch(self):
         if len(self._meters) != 0:
-            assert self._meters.keys() == self._batch_values.keys(), \
-                "Metric set is not consistent among batches"
+            metric_names = self._meters.keys()
+        elif len(self._pending_values) != 0:
+            metric_names = self._pending_values[0].keys()
+        else:
+            metric_names = self._batch_values.keys()
+        assert metric_names == self._batch_values.keys(), \
+            "Metric set is not consistent among batches"
 
-        for name, value in self._batch_values.items():
-            self._meters[name].add(value)
+        self._pending_values.append(self._batch_values)
+        if len(self._pending_values) >= self._sync_interval:
+            self.sync()
+
+    def sync(self):
+        """
+        Converts all accumulated batch metrics to python floats
+        and adds them to the loader meters
+        """
+        self._materialize(self._pending_values)
+        for batch_values in self._pending_values:
+            for name, value in batch_values.items():
+                self._meters[name].add(value)
+                self._window_sums[name] += value
+        self._window_size += len(self._pending_values)
+        self._pending_values = []
+
+    def pop_window_means(self) -> Dict[str, float]:
+        """
+        Syncs batch metrics and returns their averages over the batches
+        since the previous call or the loader start
+        """
+        self.sync()
+        means = {
+            name: value / self._window_size
+            for name, value in self._window_sums.items()
+        } if self._window_size > 0 else {}
+        self._window_sums = defaultdict(float)
+        self._window_size = 0
+        return means
 
     def add_batch_value(
         self,
@@ -119,11 +199,49 @@ class MetricManager:
             metrics_dict[name] = value
 
         for name, value in metrics_dict.items():
-            self._batch_values[name] = self._to_single_value(value)
+            if self._sync_interval > 1 \
+                    and torch.is_tensor(value) and value.numel() == 1:
+                value = value.detach().reshape(())
+            else:
+                value = self._to_single_value(value)
+            self._batch_values[name] = value
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: metrics of the current epoch and
+                meters of the current loader, to resume it from a checkpoint
+        """
+        self.sync()
+        return {
+            "best_main_metric_value": self.best_main_metric_value,
+            "epoch_values": {
+                key: dict(value)
+                for key, value in (self.epoch_values or {}).items()
+            },
+            "meters": {
+                name: {
+                    key: value.item() if hasattr(value, "item") else value
+                    for key, value in vars(meter).items()
+                } for name, meter in (self._meters or {}).items()
+            },
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, Any]) -> None:
+        """
+        Restores the current epoch metrics and the current loader meters,
+        should be called after ``begin_loader``
+        """
+        self.best_main_metric_value = state_dict["best_main_metric_value"]
+        for key, value in state_dict.get("epoch_values", {}).items():
+            self.epoch_values[key].update(value)
+        for name, meter_state in state_dict.get("meters", {}).items():
+            vars(self._meters[name]).update(meter_state)
 
     @property
     def batch_values(self) -> Dict[str, float]:
         self.add_batch_value()
+        self._materialize([self._batch_values])
         return self._batch_values
 
     @property
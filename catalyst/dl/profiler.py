@@ -0,0 +1,158 @@
+from typing import Dict, List
+from contextlib import contextmanager
+import json
+import os
+import threading
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # python < 3.7
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1e9)
+
+
+class Profiler:
+    """
+    Records nested time spans with ``perf_counter_ns``,
+    keeps aggregated statistics for every span name
+    and exports them as a Chrome trace (``chrome://tracing``)
+    and a summary table.
+    """
+
+    def __init__(self, max_events: int = 1000000):
+        """
+        Args:
+            max_events (int): maximum number of spans to keep for the trace,
+                aggregated statistics are collected for all spans
+        """
+        self.max_events = max_events
+        self.events: List[tuple] = []
+        self.stats: Dict[str, list] = {}
+        self._stack: List[tuple] = []
+        self._pid = os.getpid()
+
+    def add(self, name: str, category: str, start: int, end: int) -> None:
+        """Records finished span ``name`` from ``start`` to ``end`` (in ns)
+        Args:
+            name (str): name of a span
+            category (str): category of a span, e.g. "callback"
+            start (int): start time in ns
+            end (int): end time in ns
+        """
+        duration = end - start
+        if len(self.events) < self.max_events:
+            self.events.append(
+                (name, category, start, duration, threading.get_ident())
+            )
+
+        stats = self.stats.get(name)
+        if stats is None:
+            self.stats[name] = [1, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+    def start(self, name: str, category: str = "default") -> None:
+        """Starts nested span ``name``
+        Args:
+            name (str): name of a span
+            category (str): category of a span
+        """
+        self._stack.append((name, category, perf_counter_ns()))
+
+    def stop(self) -> None:
+        """Stops the last started span"""
+        end = perf_counter_ns()
+        name, category, start = self._stack.pop()
+        self.add(name, category, start, end)
+
+    def cancel(self, name: str = None) -> None:
+        """Drops started, but not stopped spans
+        Args:
+            name (str): if given, drops only the last started span ``name``
+                and all spans nested in it, otherwise drops all spans
+        """
+        names = [span[0] for span in self._stack]
+        if name is None:
+            self._stack = []
+        elif name in names:
+            index = len(names) - 1 - names[::-1].index(name)
+            self._stack = self._stack[:index]
+
+    @contextmanager
+    def span(self, name: str, category: str = "default"):
+        self.start(name, category)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def summary(self) -> List[Dict]:
+        """
+        Returns:
+            List[Dict]: statistics for every span name,
+                sorted by total time
+        """
+        result = [
+            {
+                "name": name,
+                "count": count,
+                "total_ms": total / 1e6,
+                "mean_ms": total / count / 1e6,
+                "max_ms": max_ / 1e6,
+            } for name, (count, total, max_) in self.stats.items()
+        ]
+        return sorted(result, key=lambda x: x["total_ms"], reverse=True)
+
+    def summary_table(self) -> str:
+        header = f"{'name':<48} {'count':>9} {'total, ms':>12} " \
+            f"{'mean, ms':>10} {'max, ms':>10}"
+        lines = [header, "-" * len(header)]
+        for row in self.summary():
+            lines.append(
+                f"{row['name']:<48} {row['count']:>9} "
+                f"{row['total_ms']:>12.2f} {row['mean_ms']:>10.3f} "
+                f"{row['max_ms']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict:
+        start = min((event[2] for event in self.events), default=0)
+        events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (begin - start) / 1e3,
+                "dur": duration / 1e3,
+                "pid": self._pid,
+                "tid": tid,
+            } for name, category, begin, duration, tid in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, filename: str) -> None:
+        with open(filename, "w") as fout:
+            json.dump(self.chrome_trace(), fout)
+
+    def export_summary(self, filename: str) -> None:
+        with open(filename, "w") as fout:
+            fout.write(self.summary_table() + "\n")
+
+
+@contextmanager
+def profile_span(profiler: Profiler, name: str, category: str = "default"):
+    """
+    Records span ``name`` if profiler is available, does nothing otherwise
+    """
+    if profiler is None:
+        yield
+    else:
+        with profiler.span(name, category):
+            yield
+
+
+__all__ = ["Profiler", "profile_span"]
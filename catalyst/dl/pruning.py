@@ -0,0 +1,147 @@
+from typing import List
+from contextlib import closing
+import sqlite3
+
+import numpy as np
+
+
+class TrialCoordinator:
+    """
+    Collects per-epoch metric values of simultaneous trials
+    in a SQLite database and decides which trials should be pruned.
+    Trials are compared at the same epoch of the same stage.
+
+    Rules:
+        - ``median``: trial is pruned if its best value
+          is worse than the median of other trials at the same epoch
+        - ``halving``: asynchronous successive halving, on rung epochs
+          ``min_epochs * reduction_factor ** k`` trial continues
+          only if it is in the top ``1 / reduction_factor`` of the trials,
+          that have reached this rung
+    """
+
+    def __init__(
+        self,
+        storage: str,
+        study: str = "default",
+        rule: str = "median",
+        minimize: bool = True,
+        warmup_epochs: int = 1,
+        min_trials: int = 4,
+        min_epochs: int = 1,
+        reduction_factor: int = 3,
+    ):
+        """
+        Args:
+            storage (str): path to the SQLite database,
+                shared between all trials of the study
+            study (str): name of the study, e.g. sweep name
+            rule (str): pruning rule, "median" or "halving"
+            minimize (bool): whether the metric should be minimized
+            warmup_epochs (int): median rule, number of first epochs,
+                when the trial is not pruned
+            min_trials (int): median rule, minimum number of other trials
+                at the same epoch to compare with
+            min_epochs (int): halving rule, epoch of the first rung
+            reduction_factor (int): halving rule, only
+                ``1 / reduction_factor`` of the trials reach the next rung
+        """
+        assert rule in ["median", "halving"], f"unknown rule: {rule}"
+        assert reduction_factor > 1
+        self.storage = storage
+        self.study = study
+        self.rule = rule
+        self.minimize = minimize
+        self.warmup_epochs = warmup_epochs
+        self.min_trials = min_trials
+        self.min_epochs = min_epochs
+        self.reduction_factor = reduction_factor
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS trial_values ("
+                "study TEXT, trial TEXT, stage TEXT, epoch INTEGER, "
+                "value REAL, PRIMARY KEY (study, trial, stage, epoch))"
+            )
+
+    def _connect(self):
+        # every trial is a separate process, so connections are not shared
+        return sqlite3.connect(self.storage, timeout=60)
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        with closing(self._connect()) as connection:
+            return connection.execute(sql, params).fetchall()
+
+    def report(
+        self, trial: str, epoch: int, value: float, stage: str = ""
+    ) -> None:
+        """Saves metric ``value`` of the ``trial`` at the stage ``epoch``"""
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO trial_values VALUES (?, ?, ?, ?, ?)",
+                (self.study, trial, stage, epoch, float(value))
+            )
+
+    def _best_values(self, epoch: int, stage: str) -> dict:
+        """Best values of every trial up to the stage ``epoch``"""
+        reduce = "MIN" if self.minimize else "MAX"
+        rows = self._query(
+            f"SELECT trial, {reduce}(value) FROM trial_values "
+            f"WHERE study = ? AND stage = ? AND epoch <= ? GROUP BY trial "
+            f"HAVING MAX(epoch) >= ?",
+            (self.study, stage, epoch, epoch)
+        )
+        return dict(rows)
+
+    def _is_better(self, value: float, other: float) -> bool:
+        return value <= other if self.minimize else value >= other
+
+    def _should_prune_median(self, trial: str, epoch: int, stage: str) -> bool:
+        if epoch <= self.warmup_epochs:
+            return False
+        values = self._best_values(epoch, stage)
+        if trial not in values:
+            return False
+        value = values.pop(trial)
+        if len(values) < self.min_trials:
+            return False
+        return not self._is_better(value, np.median(list(values.values())))
+
+    def _should_prune_halving(
+        self, trial: str, epoch: int, stage: str
+    ) -> bool:
+        rung = self.min_epochs
+        while rung < epoch:
+            rung *= self.reduction_factor
+        if rung != epoch:
+            return False
+
+        rows = self._query(
+            "SELECT trial, value FROM trial_values "
+            "WHERE study = ? AND stage = ? AND epoch = ?",
+            (self.study, stage, epoch)
+        )
+        values = dict(rows)
+        if trial not in values or len(values) <= 1:
+            return False
+        competing = sorted(values.values(), reverse=not self.minimize)
+        num_promoted = max(1, len(competing) // self.reduction_factor)
+        return not self._is_better(values[trial], competing[num_promoted - 1])
+
+    def should_prune(self, trial: str, epoch: int, stage: str = "") -> bool:
+        """
+        Args:
+            trial (str): name of the trial
+            epoch (int): last reported epoch of the trial,
+                i.e. number of finished epochs of the stage
+            stage (str): stage of the trial
+
+        Returns:
+            bool: True if the trial should be stopped
+        """
+        if self.rule == "median":
+            return self._should_prune_median(trial, epoch, stage)
+        return self._should_prune_halving(trial, epoch, stage)
+
+
+__all__ = ["TrialCoordinator"]
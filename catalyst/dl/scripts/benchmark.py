@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+from collections import OrderedDict
+from typing import Dict, List
+
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, TensorDataset
+
+from catalyst.dl.callbacks import Callback, LossCallback, \
+    OptimizerCallback, CheckpointCallback, PrecisionCallback, MapKCallback
+from catalyst.dl.experiments import SupervisedRunner
+from catalyst.utils.misc import set_global_seeds
+
+SETUPS = ["supervised", "metrics", "logging"]
+
+
+def build_args(parser):
+    parser.add_argument(
+        "--setups",
+        type=str,
+        default=",".join(SETUPS),
+        help=f"comma separated setups to run: {', '.join(SETUPS)}"
+    )
+    parser.add_argument("--num-samples", type=int, default=4096)
+    parser.add_argument("--num-features", type=int, default=32)
+    parser.add_argument("--num-classes", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument(
+        "--num-epochs",
+        type=int,
+        default=3,
+        help="number of epochs, the first one is warmup"
+    )
+    parser.add_argument(
+        "--out",
+        type=str,
+        default="benchmark.json",
+        help="path to save the results"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="path to the results of previous run to compare with"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    args, unknown_args = parser.parse_known_args()
+    return args, unknown_args
+
+
+class BenchmarkCallback(Callback):
+    """
+    Measures throughput of the train loader
+    and collects timings of every epoch after the first one
+    """
+
+    def __init__(self):
+        self.epochs: List[Dict] = []
+        self._start = None
+        self._elapsed = 0.0
+
+    def on_loader_start(self, state):
+        self._start = time.perf_counter()
+
+    def on_loader_end(self, state):
+        if state.loader_name.startswith("train"):
+            self._elapsed = time.perf_counter() - self._start
+
+    def on_epoch_end(self, state):
+        if state.epoch == 0:  # warmup
+            return
+        values = state.metrics.epoch_values["train"]
+        callbacks = {
+            key.split("/", 1)[1]: value * 1e3
+            for key, value in values.items()
+            if key.startswith("callbacks/")
+            and not key.startswith(f"callbacks/{type(self).__name__}")
+        }
+        batch_time = self._elapsed / state.loader_len
+        self.epochs.append({
+            "batches_per_sec": state.loader_len / self._elapsed,
+            "batch_time_ms": batch_time * 1e3,
+            "data_time_ms": values["base/data_time"] * 1e3,
+            "model_time_ms": values["base/model_time"] * 1e3,
+            "callbacks_ms": callbacks,
+        })
+
+    def summary(self) -> Dict:
+        result = {
+            key: sum(epoch[key] for epoch in self.epochs) / len(self.epochs)
+            for key in [
+                "batches_per_sec", "batch_time_ms", "data_time_ms",
+                "model_time_ms"
+            ]
+        }
+        result["callbacks_ms"] = {
+            name: sum(
+                epoch["callbacks_ms"][name] for epoch in self.epochs
+            ) / len(self.epochs)
+            for name in self.epochs[0]["callbacks_ms"]
+        }
+        # runner, state, metric manager and loggers
+        result["overhead_ms"] = result["batch_time_ms"] \
+            - result["data_time_ms"] - result["model_time_ms"] \
+            - sum(result["callbacks_ms"].values())
+        return result
+
+
+def get_callbacks(setup: str) -> List[Callback]:
+    callbacks = [
+        LossCallback(),
+        OptimizerCallback(),
+        CheckpointCallback(),
+    ]
+    if setup == "metrics":
+        callbacks.extend([
+            PrecisionCallback(precision_args=[1, 3, 5]),
+            MapKCallback(map_args=[1, 3, 5]),
+        ])
+    return callbacks
+
+
+def get_state_kwargs(setup: str) -> Dict:
+    # only the logging setup pays for the console and tensorboard logs
+    return {
+        "verbose": setup == "logging",
+        "default_loggers": setup == "logging",
+        "profile_callbacks": True,
+    }
+
+
+def run_setup(setup: str, args) -> Dict:
+    set_global_seeds(args.seed)
+    model = nn.Sequential(
+        nn.Linear(args.num_features, 64), nn.ReLU(),
+        nn.Linear(64, args.num_classes)
+    )
+    dataset = TensorDataset(
+        torch.randn(args.num_samples, args.num_features),
+        torch.randint(0, args.num_classes, (args.num_samples, ))
+    )
+    loaders = OrderedDict(
+        train=DataLoader(dataset, batch_size=args.batch_size, shuffle=True),
+        valid=DataLoader(dataset, batch_size=args.batch_size),
+    )
+    callback = BenchmarkCallback()
+
+    state_kwargs = get_state_kwargs(setup)
+    logdir = tempfile.mkdtemp()
+    try:
+        SupervisedRunner().train(
+            model=model,
+            criterion=nn.CrossEntropyLoss(),
+            optimizer=torch.optim.Adam(model.parameters()),
+            loaders=loaders,
+            logdir=logdir,
+            callbacks=[callback] + get_callbacks(setup),
+            num_epochs=args.num_epochs,
+            verbose=state_kwargs.pop("verbose"),
+            state_kwargs=state_kwargs
+        )
+    finally:
+        shutil.rmtree(logdir, ignore_errors=True)
+    return callback.summary()
+
+
+def get_meta() -> Dict:
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "time": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "torch": torch.__version__,
+        "platform": platform.platform(),
+        "num_threads": torch.get_num_threads(),
+    }
+
+
+def main(args, _):
+    assert args.num_epochs > 1, "the first epoch is warmup"
+    setups = args.setups.split(",")
+    for setup in setups:
+        assert setup in SETUPS, f"unknown setup: {setup}"
+
+    results = OrderedDict()
+    for setup in setups:
+        results[setup] = run_setup(setup, args)
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as fin:
+            baseline = json.load(fin)["results"]
+
+    print()
+    for setup, result in results.items():
+        line = f"{setup:>12}: {result['batches_per_sec']:9.1f} batches/sec"
+        if baseline is not None and setup in baseline:
+            change = result["batches_per_sec"] \
+                / baseline[setup]["batches_per_sec"] - 1
+            line += f" ({change:+.1%})"
+        line += f" | data_time={result['data_time_ms']:.3f}ms " \
+            f"model_time={result['model_time_ms']:.3f}ms " \
+            f"overhead={result['overhead_ms']:.3f}ms"
+        print(line)
+        for name, value in result["callbacks_ms"].items():
+            print(f"{'':>14}{name}: {value:.3f}ms")
+
+    with open(args.out, "w") as fout:
+        json.dump({"meta": get_meta(), "results": results}, fout, indent=2)
+    print(f"=> results saved to {args.out}")
+
+
+if __name__ == "__main__":
+    args, unknown_args = parse_args()
+    main(args, unknown_args)
@@ -3,6 +3,9 @@
 import argparse
 from pathlib import Path
 
+import torch
+
+from catalyst.dl.distributed import get_rank, is_master, launch
 from catalyst.utils.config import parse_args_uargs
 from catalyst.utils.misc import set_global_seeds, boolean_flag
 from catalyst.dl.scripts.utils import import_experiment_and_runner, dump_code
@@ -44,6 +47,27 @@ def build_args(parser):
     parser.add_argument("--seed", type=int, default=42)
     boolean_flag(parser, "verbose", default=False)
     boolean_flag(parser, "check", default=False)
+    boolean_flag(
+        parser,
+        "distributed",
+        default=False,
+        help="run one training process per device (or cpu core group) "
+        "with DistributedDataParallel"
+    )
+    parser.add_argument(
+        "--world-size",
+        default=None,
+        type=int,
+        help="number of processes for distributed training, "
+        "number of GPUs by default"
+    )
+    parser.add_argument(
+        "--dist-backend",
+        default=None,
+        type=str,
+        help="torch.distributed backend, nccl for GPU and gloo for CPU "
+        "by default"
+    )
 
     return parser
 
@@ -55,15 +79,18 @@ def parse_args():
     return args, unknown_args
 
 
-def main(args, unknown_args):
-    args, config = parse_args_uargs(args, unknown_args, dump_config=True)
-    set_global_seeds(config.get("seed", 42))
+def main_worker(args, unknown_args):
+    args, config = parse_args_uargs(
+        args, unknown_args, dump_config=is_master()
+    )
+    set_global_seeds(config.get("seed", 42) + get_rank())
 
     Experiment, Runner = import_experiment_and_runner(Path(args.expdir))
 
     experiment = Experiment(config)
     runner = Runner()
-    dump_code(args.expdir, experiment.logdir)
+    if is_master():
+        dump_code(args.expdir, experiment.logdir)
 
     runner.run_experiment(
         experiment,
@@ -71,6 +98,19 @@ def main(args, unknown_args):
     )
 
 
+def main(args, unknown_args):
+    if args.distributed:
+        world_size = args.world_size or max(torch.cuda.device_count(), 1)
+        launch(
+            main_worker,
+            world_size=world_size,
+            backend=args.dist_backend,
+            args=(args, unknown_args)
+        )
+    else:
+        main_worker(args, unknown_args)
+
+
 if __name__ == "__main__":
     args, unknown_args = parse_args()
     main(args, unknown_args)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import itertools
+import subprocess
+from typing import Any, Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from catalyst.dl.utils import UtilsFactory
+from catalyst.utils.config import load_ordered_yaml
+
+
+def build_args(parser):
+    parser.add_argument(
+        "-C",
+        "--config",
+        help="path to config/configs",
+        required=True
+    )
+    parser.add_argument("--expdir", type=str, required=True)
+    parser.add_argument(
+        "--logdir",
+        type=str,
+        required=True,
+        help="sweep directory, trial logs are saved to <logdir>/trial_<i>"
+    )
+    parser.add_argument(
+        "--space",
+        type=str,
+        required=True,
+        help="yml/json file with the search space: "
+        "mapping from config key (like `stages/optimizer_params/lr`) "
+        "to the list of its values"
+    )
+    parser.add_argument(
+        "-n",
+        "--num-parallel",
+        type=int,
+        default=1,
+        help="number of trials to run simultaneously"
+    )
+    parser.add_argument(
+        "--cores-per-trial",
+        type=int,
+        default=None,
+        help="number of cpu cores to pin every trial to, "
+        "all available cores are split between trials by default"
+    )
+
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    args, unknown_args = parser.parse_known_args()
+    return args, unknown_args
+
+
+def load_space(filepath: str) -> Dict[str, List]:
+    with open(filepath, "r") as fin:
+        if filepath.endswith("json"):
+            space = json.load(fin, object_pairs_hook=OrderedDict)
+        elif filepath.endswith("yml"):
+            space = load_ordered_yaml(fin)
+        else:
+            raise Exception("Unknown file format")
+    return space
+
+
+def expand_grid(space: Dict[str, List]) -> List[Dict[str, Any]]:
+    """
+    Expands the search space into the list of all combinations
+
+    Args:
+        space (Dict[str, List]): mapping from config key to its values
+
+    Returns:
+        List[Dict[str, Any]]: params of every trial
+    """
+    keys = list(space.keys())
+    values = [
+        value if isinstance(value, list) else [value]
+        for value in space.values()
+    ]
+    return [
+        OrderedDict(zip(keys, combination))
+        for combination in itertools.product(*values)
+    ]
+
+
+def params_to_args(params: Dict[str, Any]) -> List[str]:
+    """
+    Converts trial params to ``catalyst-dl run`` config overrides,
+    like ``--stages/optimizer_params/lr=0.001:float``
+    """
+    args = []
+    for key, value in params.items():
+        assert isinstance(value, (bool, int, float, str)), \
+            f"only scalar values are supported, got {key}={value}"
+        args.append(f"--{key}={value}:{type(value).__name__}")
+    return args
+
+
+def get_core_groups(num_parallel: int, cores_per_trial: int = None):
+    """
+    Splits available cpu cores into ``num_parallel`` disjoint groups
+    """
+    cores = sorted(os.sched_getaffinity(0)) \
+        if hasattr(os, "sched_getaffinity") \
+        else list(range(os.cpu_count() or 1))
+    cores_per_trial = cores_per_trial \
+        or max(1, len(cores) // num_parallel)
+    return [
+        cores[i * cores_per_trial:(i + 1) * cores_per_trial] or cores
+        for i in range(num_parallel)
+    ]
+
+
+def run_trial(command: List[str], cores: List[int], logfile: str) -> int:
+    """
+    Runs trial command pinned to ``cores``
+    with ``OMP_NUM_THREADS`` equal to the number of cores
+
+    Returns:
+        int: trial return code
+    """
+    env = os.environ.copy()
+    for key in ["OMP_NUM_THREADS", "MKL_NUM_THREADS"]:
+        env[key] = str(len(cores))
+
+    with open(logfile, "w") as fout:
+        # trials are started from threads, so the child is pinned
+        # by the parent instead of unsafe ``preexec_fn``
+        process = subprocess.Popen(
+            command, env=env, stdout=fout, stderr=subprocess.STDOUT
+        )
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(process.pid, cores)
+            except OSError:  # the trial has already finished
+                pass
+        return process.wait()
+
+
+def get_trial_metrics(logdir: str) -> Dict[str, Any]:
+    checkpoint_path = f"{logdir}/checkpoints/best.pth"
+    if not os.path.isfile(checkpoint_path):
+        return {}
+    checkpoint = UtilsFactory.load_checkpoint(checkpoint_path)
+    return {"epoch": checkpoint["epoch"], **checkpoint["valid_metrics"]}
+
+
+def main(args, unknown_args):
+    trials = expand_grid(load_space(args.space))
+    core_groups = queue.Queue()
+    for cores in get_core_groups(args.num_parallel, args.cores_per_trial):
+        core_groups.put(cores)
+
+    def run(index, params):
+        logdir = f"{args.logdir}/trial_{index:03d}"
+        os.makedirs(logdir, exist_ok=True)
+        command = [
+            sys.executable, "-m", "catalyst.dl", "run",
+            "--config", args.config,
+            "--expdir", args.expdir,
+            "--logdir", logdir,
+            *unknown_args,
+            *params_to_args(params)
+        ]
+
+        cores = core_groups.get()
+        start = time.time()
+        try:
+            returncode = run_trial(command, cores, f"{logdir}/sweep.log")
+        finally:
+            core_groups.put(cores)
+        elapsed = time.time() - start
+        print(
+            f"=> trial {index} finished in {elapsed:.1f}s "
+            f"with code {returncode}: {dict(params)}"
+        )
+
+        row = {"trial": index, **params}
+        row["returncode"] = returncode
+        row["time"] = elapsed
+        row.update(get_trial_metrics(logdir))
+        return row
+
+    with ThreadPoolExecutor(args.num_parallel) as executor:
+        rows = list(executor.map(run, range(len(trials)), trials))
+
+    report = pd.DataFrame(rows)
+    report.to_csv(f"{args.logdir}/sweep.csv", index=False)
+    print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    args, unknown_args = parse_args()
+    main(args, unknown_args)
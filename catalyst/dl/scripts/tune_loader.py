@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+
+import os
+import copy
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import itertools
+import multiprocessing
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from catalyst.dl.callbacks import Callback
+from catalyst.utils.config import parse_args_uargs
+from catalyst.utils.misc import set_global_seeds
+from catalyst.dl.scripts.utils import import_experiment_and_runner
+
+
+def build_args(parser):
+    parser.add_argument(
+        "-C",
+        "--config",
+        help="path to config/configs",
+        required=True
+    )
+    parser.add_argument("--expdir", type=str, required=True)
+    parser.add_argument(
+        "--stage", type=str, default=None, help="stage to probe, first one "
+        "by default"
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=str,
+        default="16,32,64,128",
+        help="comma separated batch sizes to probe"
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=str,
+        default="0,2,4,8",
+        help="comma separated numbers of loader workers to probe"
+    )
+    parser.add_argument(
+        "--num-batches",
+        type=int,
+        default=20,
+        help="number of timed batches in every probe"
+    )
+    parser.add_argument(
+        "--num-warmup-batches",
+        type=int,
+        default=3,
+        help="number of batches to skip before timing, "
+        "includes worker startup"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.05,
+        help="settings with throughput within the tolerance from the best "
+        "are compared by memory usage"
+    )
+    parser.add_argument(
+        "--out-config",
+        type=str,
+        default=None,
+        help="path to save the config override with the best "
+        "`data_params`, `<config>.loader.yml` by default, "
+        "use it after the original config: `--config=<config>,<override>`"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    args, unknown_args = parser.parse_known_args()
+    return args, unknown_args
+
+
+def get_rss_mb() -> float:
+    """
+    Resident memory of the current process and its children
+    (e.g. loader workers) in MB. Pages shared by the processes
+    are counted several times, so it's an upper bound.
+    """
+    pids = [os.getpid()] + [
+        process.pid for process in multiprocessing.active_children()
+    ]
+    rss = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status") as fin:
+                for line in fin:
+                    if line.startswith("VmRSS:"):
+                        rss += int(line.split()[1])
+        except OSError:
+            continue
+    return rss / 1024
+
+
+class _ProbeFinished(Exception):
+    pass
+
+
+class LoaderProbeCallback(Callback):
+    """
+    Times the first loader of the stage and interrupts the stage
+    after ``num_warmup_batches + num_batches`` batches
+    """
+
+    def __init__(self, num_batches: int, num_warmup_batches: int):
+        self.num_batches = num_batches
+        self.num_warmup_batches = num_warmup_batches
+        self.loader_name = None
+        self.batch_times: List[float] = []
+        self.data_times: List[float] = []
+        self.peak_rss = 0.0
+        self._counter = 0
+        self._last_batch_end = None
+
+    def on_loader_start(self, state):
+        self.loader_name = state.loader_name
+        self._last_batch_end = time.perf_counter()
+
+    def on_batch_end(self, state):
+        now = time.perf_counter()
+        self._counter += 1
+        if self._counter > self.num_warmup_batches:
+            # forward, backward and callbacks are done by now
+            self.batch_times.append(now - self._last_batch_end)
+            self.data_times.append(state.timer.elapsed["base/data_time"])
+            self.peak_rss = max(self.peak_rss, get_rss_mb())
+        self._last_batch_end = time.perf_counter()
+
+        if self._counter >= self.num_warmup_batches + self.num_batches:
+            raise _ProbeFinished()
+
+    def on_loader_end(self, state):
+        raise _ProbeFinished()
+
+
+def probe(
+    config: Dict,
+    expdir: Path,
+    stage: str,
+    batch_size: int,
+    num_workers: int,
+    num_batches: int,
+    num_warmup_batches: int,
+) -> Dict:
+    """
+    Runs the stage for a few batches with given loader params
+
+    Returns:
+        Dict: probe results
+    """
+    config = copy.deepcopy(config)
+    config["stages"].setdefault("data_params", {})
+    config["stages"]["data_params"]["batch_size"] = batch_size
+    config["stages"]["data_params"]["num_workers"] = num_workers
+    logdir = tempfile.mkdtemp()
+    config["args"]["logdir"] = logdir
+
+    Experiment, Runner = import_experiment_and_runner(expdir)
+    # only the probed stage is run
+    stages = [
+        key for key in config["stages"]
+        if key not in Experiment.STAGE_KEYWORDS
+    ]
+    stage = stage or stages[0]
+    config["stages"] = {
+        key: value
+        for key, value in config["stages"].items()
+        if key == stage or key in Experiment.STAGE_KEYWORDS
+    }
+    experiment = Experiment(config)
+
+    callback = LoaderProbeCallback(num_batches, num_warmup_batches)
+    get_callbacks = experiment.get_callbacks
+    experiment.get_callbacks = \
+        lambda stage_: get_callbacks(stage_) + [callback]
+
+    try:
+        Runner().run_experiment(experiment)
+    except _ProbeFinished:
+        pass
+    finally:
+        shutil.rmtree(logdir, ignore_errors=True)
+
+    num_measured = max(len(callback.batch_times), 1)
+    batch_time = sum(callback.batch_times) / num_measured
+    data_time = sum(callback.data_times) / num_measured
+    return {
+        "batch_size": batch_size,
+        "num_workers": num_workers,
+        "loader": callback.loader_name,
+        "samples_per_sec": batch_size / batch_time if batch_time > 0 else 0,
+        "data_time": data_time,
+        "model_time": batch_time - data_time,
+        "peak_rss_mb": callback.peak_rss,
+    }
+
+
+def select_best(results: List[Dict], tolerance: float) -> Dict:
+    """
+    Selects the settings with the lowest memory usage among the settings
+    with throughput within ``tolerance`` from the best one
+    """
+    best_throughput = max(x["samples_per_sec"] for x in results)
+    candidates = [
+        x for x in results
+        if x["samples_per_sec"] >= (1 - tolerance) * best_throughput
+    ]
+    return min(candidates, key=lambda x: x["peak_rss_mb"])
+
+
+def save_config(config: Dict, filename: str) -> None:
+    with open(filename, "w") as fout:
+        if filename.endswith("json"):
+            json.dump(config, fout, indent=2, ensure_ascii=False)
+        else:
+            yaml.safe_dump(config, fout, default_flow_style=False)
+
+
+def main(args, unknown_args):
+    set_global_seeds(args.seed)
+    # only experiment args are passed to the config
+    _, config = parse_args_uargs(
+        argparse.Namespace(
+            config=args.config, expdir=args.expdir, seed=args.seed
+        ), unknown_args
+    )
+    grid = itertools.product(
+        map(int, args.batch_sizes.split(",")),
+        map(int, args.num_workers.split(","))
+    )
+
+    results = []
+    for batch_size, num_workers in grid:
+        result = probe(
+            config,
+            expdir=Path(args.expdir),
+            stage=args.stage,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            num_batches=args.num_batches,
+            num_warmup_batches=args.num_warmup_batches
+        )
+        results.append(result)
+        print(
+            f"batch_size={batch_size:<5} num_workers={num_workers:<3} "
+            f"{result['samples_per_sec']:10.1f} samples/sec | "
+            f"data_time={result['data_time']:.4f} "
+            f"model_time={result['model_time']:.4f} | "
+            f"peak_rss={result['peak_rss_mb']:.0f}MB"
+        )
+
+    best = select_best(results, args.tolerance)
+    print(
+        f"=> best: batch_size={best['batch_size']} "
+        f"num_workers={best['num_workers']}"
+    )
+
+    # the original config is not rewritten to keep its comments and order
+    config_path = args.config.split(",")[0]
+    out_config = args.out_config \
+        or os.path.splitext(config_path)[0] + ".loader.yml"
+    override = {
+        "stages": {
+            "data_params": {
+                "batch_size": best["batch_size"],
+                "num_workers": best["num_workers"],
+            }
+        }
+    }
+    save_config(override, out_config)
+    print(
+        f"=> config override saved to {out_config}, "
+        f"use it with --config={args.config},{out_config}"
+    )
+
+
+if __name__ == "__main__":
+    args, unknown_args = parse_args()
+    main(args, unknown_args)
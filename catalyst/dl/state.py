@@ -2,6 +2,8 @@ from pathlib import Path
 from torch.optim.optimizer import Optimizer
 
 from catalyst.utils.misc import FrozenClass
+from .distributed import is_master
+from .fp16 import get_autocast_dtype
 from .metric_manager import MetricManager, TimerManager
 
 
@@ -27,6 +29,13 @@ class RunnerState(FrozenClass):
         minimize_metric=True,
         valid_loader="valid",
         verbose=False,
+        prefetch_batches=0,
+        metrics_sync_interval=1,
+        profile_callbacks=False,
+        tensorboard_params=None,
+        default_loggers=True,
+        mixed_precision=False,
+        jit=None,
         **kwargs
     ):
         # @TODO: refactor
@@ -49,10 +58,33 @@ class RunnerState(FrozenClass):
         # data pipeline
         self.input = None
         self.output = None
+        # number of batches to prepare in background, 0 - no prefetching
+        self.prefetch_batches = prefetch_batches
+        # autocast dtype for forward and loss, None - full precision
+        self.mixed_precision = mixed_precision
+        self.autocast_dtype = get_autocast_dtype(mixed_precision, device)
+        # TorchScript mode for infer stages: None, "trace" or "script"
+        self.jit = jit
 
         # counters
         self.loader_len = 0
         self.batch_size = 0
+        # number of loader batches to skip, e.g. to resume interrupted run
+        self.skip_batches = 0
+        # number of processed batches of the current loader
+        self.loader_step = 0
+        # position to resume interrupted stage from:
+        # the first epoch and the loader to continue, previous are skipped
+        self.start_epoch = 0
+        self.resume_loader = None
+        # gives shuffling samplers their own seeded generator,
+        # e.g. to save and replay the order of batches on resume
+        self.seed_sampler = False
+        # generator of the current loader shuffling, its state on the loader
+        # start defines the order of batches, None for ordered loaders
+        self.sampler_generator = None
+        # time to start (or resume) workers of the current loader, in seconds
+        self.workers_start_time = None
         self.step = 0
         self.epoch = 0
         self.num_epochs = num_epochs
@@ -64,15 +96,25 @@ class RunnerState(FrozenClass):
         self.metrics = MetricManager(
             valid_loader=valid_loader,
             main_metric=main_metric,
-            minimize=minimize_metric
+            minimize=minimize_metric,
+            sync_interval=metrics_sync_interval
         )
         self.loggers = []
-        if verbose:
+        # only rank 0 process logs in distributed mode
+        if verbose and is_master():
             self.loggers.insert(0, VerboseLogger())
-        if not stage.startswith("infer"):
-            self.loggers.extend([ConsoleLogger(), TensorboardLogger()])
+        # console and tensorboard logs of train stages
+        if default_loggers and not stage.startswith("infer") and is_master():
+            self.loggers.extend([
+                ConsoleLogger(),
+                TensorboardLogger(**(tensorboard_params or {}))
+            ])
 
         self.timer = TimerManager()
+        # time batch hooks of every callback as `callbacks/<name>` metrics
+        self.profile_callbacks = profile_callbacks
+        # catalyst.dl.profiler.Profiler, set by ProfilerCallback
+        self.profiler = None
 
         # base metrics
         self.lr = None
@@ -82,6 +124,8 @@ class RunnerState(FrozenClass):
         # other
         self.need_backward = False
         self.early_stop = False
+        # stops the current and all remaining stages
+        self.stop_experiment = False
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -143,6 +187,9 @@ class RunnerState(FrozenClass):
 
     def on_loader_end_post(self):
         self.metrics.end_loader()
+        if self.workers_start_time is not None:
+            self.metrics.epoch_values[self.loader_name][
+                "base/workers_start_time"] = self.workers_start_time
         for logger in self.loggers:
             logger.on_loader_end(self)
 
@@ -0,0 +1,48 @@
+import argparse
+import json
+
+from ..scripts import benchmark
+from ..state import RunnerState
+
+
+def test_setup_callbacks(tmpdir):
+    base = {"LossCallback", "OptimizerCallback", "CheckpointCallback"}
+    expected = {
+        "supervised": base,
+        "metrics": base | {"PrecisionCallback", "MapKCallback"},
+        "logging": base | {
+            "VerboseLogger", "ConsoleLogger", "TensorboardLogger"
+        },
+    }
+    for setup in benchmark.SETUPS:
+        state = RunnerState(
+            stage="train",
+            logdir=str(tmpdir),
+            **benchmark.get_state_kwargs(setup)
+        )
+        callbacks = benchmark.get_callbacks(setup) + state.loggers
+        assert {type(x).__name__ for x in callbacks} == expected[setup]
+
+
+def test_benchmark(tmpdir):
+    parser = argparse.ArgumentParser()
+    benchmark.build_args(parser)
+    out = str(tmpdir.join("benchmark.json"))
+    args = parser.parse_args([
+        "--setups", "supervised,metrics",
+        "--num-samples", "64",
+        "--num-epochs", "2",
+        "--out", out,
+    ])
+    benchmark.main(args, None)
+
+    with open(out) as fin:
+        results = json.load(fin)["results"]
+    assert list(results.keys()) == ["supervised", "metrics"]
+    assert results["supervised"]["batches_per_sec"] > 0
+    assert "PrecisionCallback" in results["metrics"]["callbacks_ms"]
+    assert "BenchmarkCallback" not in results["metrics"]["callbacks_ms"]
+
+    args.baseline = out
+    args.setups = "supervised"
+    benchmark.main(args, None)
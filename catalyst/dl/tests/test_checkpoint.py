@@ -0,0 +1,143 @@
+from collections import OrderedDict
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from ..callbacks import Callback, CheckpointCallback
+from ..experiments import SupervisedRunner
+from ..utils import UtilsFactory
+
+
+def test_save_checkpoint(tmpdir):
+    logdir = str(tmpdir)
+    weight = torch.ones(3)
+    checkpoint = UtilsFactory.checkpoint_to_cpu({"weight": weight, "epoch": 0})
+    weight.add_(1)
+
+    first = UtilsFactory.save_checkpoint(
+        logdir, checkpoint, suffix="train.0", is_best=True, is_last=True
+    )
+    second = UtilsFactory.save_checkpoint(
+        logdir, {"weight": weight, "epoch": 1}, suffix="train.1", is_last=True
+    )
+
+    assert UtilsFactory.load_checkpoint(first)["weight"].eq(1).all()
+    assert UtilsFactory.load_checkpoint(f"{logdir}/best.pth")["epoch"] == 0
+    assert UtilsFactory.load_checkpoint(f"{logdir}/last.pth")["epoch"] == 1
+    assert sorted(tmpdir.listdir()) == sorted(
+        tmpdir.join(x) for x in ["best.pth", "last.pth", "train.0.pth",
+                                 "train.1.pth"]
+    )
+
+    tmpdir.join("train.0.pth").remove()
+    assert UtilsFactory.load_checkpoint(f"{logdir}/best.pth")["epoch"] == 0
+    assert second.endswith("train.1.pth")
+
+
+class _Interrupt(Callback):
+    def __init__(self, num_batches):
+        self.num_batches = num_batches
+        self.counter = 0
+
+    def on_batch_end(self, state):
+        self.counter += 1
+        if self.counter == self.num_batches:
+            raise KeyboardInterrupt()
+
+
+def _train(logdir, callbacks, **loader_params):
+    torch.manual_seed(42)
+    model = torch.nn.Sequential(
+        torch.nn.Linear(4, 8), torch.nn.Dropout(0.5), torch.nn.Linear(8, 1)
+    )
+    generator = torch.Generator().manual_seed(0)
+    dataset = TensorDataset(
+        torch.randn(40, 4, generator=generator),
+        torch.randn(40, 1, generator=generator)
+    )
+    if loader_params.get("num_workers", 0) > 0:
+        # workers seed is drawn from the loader generator,
+        # so dropout doesn't depend on the number of workers starts
+        loader_params["generator"] = torch.Generator().manual_seed(1)
+    loaders = OrderedDict(
+        train=DataLoader(
+            dataset, batch_size=4, shuffle=True, **loader_params
+        ),
+        valid=DataLoader(dataset, batch_size=4)
+    )
+    runner = SupervisedRunner()
+    runner.train(
+        model=model,
+        criterion=torch.nn.MSELoss(),
+        optimizer=torch.optim.SGD(model.parameters(), lr=0.01, momentum=0.9),
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=3,
+        callbacks=callbacks
+    )
+    return model, runner.state.metrics.epoch_values, loaders
+
+
+class _BatchRecorder(Callback):
+    def __init__(self):
+        self.batches = []
+
+    def on_batch_end(self, state):
+        if state.loader_name == "train":
+            self.batches.append(state.input["features"].sum().item())
+
+
+@pytest.mark.parametrize(
+    "loader_params",
+    [{}, {"num_workers": 2, "persistent_workers": True}]
+)
+def test_resume_step_checkpoint(tmpdir, loader_params):
+    expected_batches = _BatchRecorder()
+    expected_model, expected_metrics, _ = _train(
+        str(tmpdir.join("full")),
+        [CheckpointCallback(save_every_batches=3), expected_batches],
+        **loader_params
+    )
+
+    logdir = str(tmpdir.join("resumed"))
+    # interrupts on the 6th train batch of the second epoch
+    with pytest.raises(KeyboardInterrupt):
+        _train(
+            logdir,
+            [CheckpointCallback(save_every_batches=3), _Interrupt(26)],
+            **loader_params
+        )
+    checkpoint = UtilsFactory.load_checkpoint(f"{logdir}/checkpoints/step.pth")
+    assert checkpoint["resume_epoch"] == 1
+    assert checkpoint["resume_loader"] == "train"
+    assert checkpoint["resume_batches"] == 3
+
+    batches = _Interrupt(0)
+    resumed_batches = _BatchRecorder()
+    model, metrics, _ = _train(
+        logdir, [
+            CheckpointCallback(
+                resume=f"{logdir}/checkpoints/step.pth",
+                save_every_batches=3
+            ), batches, resumed_batches
+        ],
+        **loader_params
+    )
+
+    # 7 train batches of the second epoch and the third epoch
+    assert batches.counter == 7 + 10 + 10 + 10
+    assert resumed_batches.batches == expected_batches.batches[-17:]
+    for param, expected in zip(
+        model.parameters(), expected_model.parameters()
+    ):
+        assert torch.allclose(param, expected)
+    for loader in ["train", "valid"]:
+        assert abs(
+            metrics[loader]["loss"] - expected_metrics[loader]["loss"]
+        ) < 1e-6
+
+
+def test_sampler_untouched(tmpdir):
+    _, _, loaders = _train(str(tmpdir), [CheckpointCallback()])
+    assert loaders["train"].sampler.generator is None
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+import os
+
+import torch
+import torch.distributed as dist
+from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data.distributed import DistributedSampler
+
+from .. import distributed
+from ..experiments import SupervisedRunner
+from ..metric_manager import MetricManager
+
+
+def _check_distributed(logdir):
+    rank = distributed.get_rank()
+    assert distributed.get_world_size() == 2
+
+    metrics = MetricManager("valid", "test", True)
+    metrics.begin_epoch()
+    metrics.begin_loader("valid")
+    for _ in range(rank + 1):
+        metrics.begin_batch()
+        metrics.add_batch_value("test", rank)
+        metrics.end_batch()
+    metrics.end_loader()
+    assert abs(metrics.epoch_values["valid"]["test"] - 2 / 3) < 1e-6
+
+    torch.manual_seed(rank)
+    features = torch.randn(64, 4)
+    targets = (features[:, 0] > 0).long()
+    dataset = TensorDataset(features, targets)
+    loaders = OrderedDict(
+        train=DataLoader(
+            dataset, batch_size=8, sampler=DistributedSampler(dataset)
+        ),
+        valid=DataLoader(dataset, batch_size=8),
+    )
+    model = torch.nn.Linear(4, 2)
+    SupervisedRunner().train(
+        model=model,
+        criterion=torch.nn.CrossEntropyLoss(),
+        optimizer=torch.optim.SGD(model.parameters(), lr=0.1),
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=2
+    )
+
+    weight = model.weight.detach().clone()
+    weights = [torch.zeros_like(weight) for _ in range(2)]
+    dist.all_gather(weights, weight)
+    assert torch.allclose(weights[0], weights[1])
+
+
+def test_distributed_gloo(tmpdir):
+    logdir = str(tmpdir)
+    distributed.launch(
+        _check_distributed, world_size=2, backend="gloo", args=(logdir, )
+    )
+    assert sorted(os.listdir(f"{logdir}/checkpoints")) == \
+        ["best.pth", "last.pth", "train.0.pth", "train.1.pth"]
+    assert not distributed.is_distributed()
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+import weakref
+
+import torch
+from torch.utils.data import TensorDataset
+
+from ..experiments import ConfigExperiment
+
+
+class _Experiment(ConfigExperiment):
+    def get_datasets(self, stage: str, **kwargs):
+        dataset = TensorDataset(torch.arange(8).float())
+        return OrderedDict(train=dataset, valid=dataset)
+
+
+def _get_config(logdir, **data_params):
+    return {
+        "args": {"logdir": logdir},
+        "stages": {
+            "data_params": {"batch_size": 4, "num_workers": 1, **data_params},
+            "stage1": {},
+            "stage2": {},
+            "stage3": {"data_params": {"drop_last": True}},
+        }
+    }
+
+
+def test_persistent_loaders(tmpdir):
+    experiment = _Experiment(_get_config(str(tmpdir)))
+    # workers are not persistent by default
+    assert not experiment.get_loaders("stage1")["train"].persistent_workers
+    assert experiment.get_loaders("stage1") is not \
+        experiment.get_loaders("stage1")
+
+    experiment = _Experiment(
+        _get_config(str(tmpdir), persistent_workers=True)
+    )
+    loaders = experiment.get_loaders("stage1")
+    assert experiment.get_loaders("stage1") is loaders
+    # datasets can depend on the stage, loaders are not shared by default
+    assert experiment.get_loaders("stage2") is not loaders
+
+    experiment.close()
+    experiment = _Experiment(
+        _get_config(
+            str(tmpdir), persistent_workers=True, reuse_loaders=True
+        )
+    )
+    loaders = experiment.get_loaders("stage1")
+    assert experiment.get_loaders("stage2") is loaders
+    assert experiment.get_loaders("stage3") is not loaders
+
+    loader = loaders["train"]
+    assert loader.persistent_workers
+    for _ in range(2):
+        assert sum(len(batch[0]) for batch in loader) == 8
+    iterator = weakref.ref(loader._iterator)
+    list(loader)
+    assert loader._iterator is iterator()
+
+    experiment.close()
+    assert loader._iterator is None
+    assert iterator() is None
@@ -0,0 +1,181 @@
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from ..callbacks import Callback, InferCallback, InferMaskCallback
+from ..experiments import EnsembleRunner, SupervisedRunner
+from ..utils import UtilsFactory
+
+
+class _Interrupt(Callback):
+    def __init__(self, num_batches):
+        self.num_batches = num_batches
+        self.counter = 0
+
+    def on_batch_end(self, state):
+        self.counter += 1
+        if self.counter == self.num_batches:
+            raise KeyboardInterrupt()
+
+
+def test_infer_memmap_resume(tmpdir):
+    torch.manual_seed(42)
+    model = torch.nn.Linear(4, 3)
+    features = torch.randn(45, 4)
+    loaders = OrderedDict(
+        infer=DataLoader(
+            TensorDataset(features, torch.zeros(45)), batch_size=4
+        )
+    )
+    out_prefix = str(tmpdir) + "/{suffix}"
+    expected = model(features).detach().numpy()
+
+    callback = InferCallback(
+        out_prefix=out_prefix, memmap=True, flush_every=3
+    )
+    with pytest.raises(KeyboardInterrupt):
+        SupervisedRunner().infer(
+            model=model, loaders=loaders, callbacks=[callback, _Interrupt(7)]
+        )
+
+    resumed = _Interrupt(0)
+    callback = InferCallback(
+        out_prefix=out_prefix, memmap=True, flush_every=3, resume=True
+    )
+    SupervisedRunner().infer(
+        model=model, loaders=loaders, callbacks=[callback, resumed]
+    )
+
+    # 6 batches were flushed before the interruption
+    assert resumed.counter == 12 - 6
+    predictions = np.load(f"{tmpdir}/infer.logits.npy")
+    assert predictions.shape == (45, 3)
+    assert np.allclose(predictions, expected, atol=1e-6)
+    assert np.allclose(callback.predictions["logits"], expected, atol=1e-6)
+    assert not tmpdir.join("infer.progress.json").exists()
+
+
+def test_infer_mask(tmpdir):
+    model = torch.nn.Conv2d(3, 2, kernel_size=1)
+    loaders = OrderedDict(
+        infer=DataLoader(
+            TensorDataset(torch.randn(5, 3, 16, 16), torch.zeros(5)),
+            batch_size=2
+        )
+    )
+    callback = InferMaskCallback(
+        out_prefix=str(tmpdir) + "/masks",
+        input_key="features",
+        output_key="logits",
+        threshold=0.5,
+        dump_mask=True,
+        num_workers=2,
+        max_pending=1
+    )
+    SupervisedRunner().infer(
+        model=model, loaders=loaders, callbacks=[callback]
+    )
+
+    files = sorted(x.basename for x in tmpdir.join("masks/infer").listdir())
+    assert len(files) == 5 * 3
+    assert files[:3] == ["000000.jpg", "000000_0.jpg", "000000_1.jpg"]
+
+
+@pytest.mark.parametrize("jit", ["trace", "script"])
+def test_infer_jit(tmpdir, jit):
+    torch.manual_seed(42)
+    model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.ReLU())
+    features = torch.randn(10, 4)
+    loaders = OrderedDict(
+        infer=DataLoader(
+            TensorDataset(features, torch.zeros(10)), batch_size=4
+        )
+    )
+    callback = InferCallback()
+    SupervisedRunner().infer(
+        model=model, loaders=loaders, callbacks=[callback], jit=jit
+    )
+    expected = model(features).detach().numpy()
+    assert np.allclose(callback.predictions["logits"], expected, atol=1e-6)
+
+
+def test_infer_jit_cache_weights(tmpdir):
+    model = torch.nn.Linear(4, 3)
+    checkpoint_path = UtilsFactory.save_checkpoint(
+        logdir=str(tmpdir),
+        checkpoint={"model_state_dict": model.state_dict()},
+        suffix="best"
+    )
+    features = torch.randn(10, 4)
+    dataset = TensorDataset(features, torch.zeros(10))
+    loaders = OrderedDict(infer=DataLoader(dataset, batch_size=4))
+
+    for i in range(3):
+        # weights change, the checkpoint stays the same
+        with torch.no_grad():
+            model.weight.fill_(i % 2)
+        callback = InferCallback()
+        SupervisedRunner().infer(
+            model=model,
+            loaders=loaders,
+            callbacks=[callback],
+            state_kwargs={"resume": checkpoint_path},
+            jit="trace"
+        )
+        expected = model(features).detach().numpy()
+        assert np.allclose(callback.predictions["logits"], expected)
+
+    # only the model compiled for the last weights is kept
+    assert len(tmpdir.listdir("best.*.trace.cpu.pt")) == 1
+
+
+class _CountingDataset(TensorDataset):
+    def __init__(self, *tensors):
+        super().__init__(*tensors)
+        self.num_reads = 0
+
+    def __getitem__(self, index):
+        self.num_reads += 1
+        return super().__getitem__(index)
+
+
+def test_ensemble_infer(tmpdir):
+    torch.manual_seed(42)
+    model = torch.nn.Linear(4, 3)
+    checkpoints = []
+    for i in range(3):
+        fold = torch.nn.Linear(4, 3)
+        checkpoints.append(str(tmpdir.join(f"fold{i}.pth")))
+        UtilsFactory.save_checkpoint(
+            logdir=str(tmpdir),
+            checkpoint={"model_state_dict": fold.state_dict()},
+            suffix=f"fold{i}"
+        )
+    features = torch.randn(10, 4)
+    dataset = _CountingDataset(features, torch.zeros(10))
+    loaders = OrderedDict(infer=DataLoader(dataset, batch_size=4))
+
+    callback = InferCallback()
+    EnsembleRunner().infer(
+        model=model,
+        loaders=loaders,
+        callbacks=[callback],
+        checkpoints=checkpoints
+    )
+
+    assert dataset.num_reads == 10
+    expected = []
+    for i, filepath in enumerate(checkpoints):
+        UtilsFactory.unpack_checkpoint(
+            UtilsFactory.load_checkpoint(filepath), model=model
+        )
+        expected.append(model(features).detach().numpy())
+        assert np.allclose(
+            callback.predictions[f"logits_{i}"], expected[-1], atol=1e-6
+        )
+    assert np.allclose(
+        callback.predictions["logits"], np.mean(expected, axis=0), atol=1e-6
+    )
@@ -1,4 +1,5 @@
 import numpy as np
+import torch
 
 from ..metric_manager import MetricManager
 
@@ -89,3 +90,45 @@ def test_best():
 
     assert not metrics.is_best
     assert metrics.best_main_metric_value == 1
+
+
+def test_deferred_sync():
+    values = [0.5, 1.5, 2.0, 4.0, 7.25]
+    means = []
+    for sync_interval in [1, 2, 10]:
+        metrics = MetricManager("valid", "test", True, sync_interval)
+
+        metrics.begin_epoch()
+        metrics.begin_loader("valid")
+        for i, value in enumerate(values):
+            metrics.begin_batch()
+            metrics.add_batch_value(
+                metrics_dict={"test": torch.tensor(value), "const": 1}
+            )
+            if i == 1:
+                assert metrics.batch_values["test"] == value
+            metrics.end_batch()
+        metrics.end_loader()
+
+        means.append(metrics.epoch_values["valid"]["test"])
+        assert metrics.epoch_values["valid"]["const"] == 1
+
+    assert means == [np.mean(values)] * 3
+
+
+def test_window_means():
+    metrics = MetricManager("valid", "test", True, sync_interval=4)
+    metrics.begin_epoch()
+    metrics.begin_loader("valid")
+    for value in [1.0, 2.0, 6.0, 3.0, 5.0]:
+        metrics.begin_batch()
+        metrics.add_batch_value("test", torch.tensor(value))
+        metrics.end_batch()
+        if value == 6.0:
+            # the first window is synced before the sync interval
+            assert metrics.pop_window_means() == {"test": 3.0}
+    metrics.end_loader()
+
+    assert metrics.pop_window_means() == {"test": 4.0}
+    assert metrics.pop_window_means() == {}
+    assert metrics.epoch_values["valid"]["test"] == 3.4
@@ -0,0 +1,64 @@
+import pytest
+import torch
+
+from ..callbacks import OptimizerCallback
+from ..fp16 import autocast, create_grad_scaler, get_autocast_dtype
+
+
+def test_grad_step_weight_decay():
+    first, second = torch.nn.Parameter(torch.ones(3)), \
+        torch.nn.Parameter(torch.ones(3))
+    optimizer = torch.optim.SGD(
+        [
+            {"params": [first], "weight_decay": 0.1},
+            {"params": [second], "weight_decay": 0.0},
+        ],
+        lr=0.5
+    )
+    for param in [first, second]:
+        param.grad = torch.zeros(3)
+    optimizer_wd = []
+    for group in optimizer.param_groups:
+        optimizer_wd.append(group["weight_decay"])
+        group["weight_decay"] = 0.0
+
+    OptimizerCallback.grad_step(optimizer=optimizer, optimizer_wd=optimizer_wd)
+
+    assert torch.allclose(first.data, torch.full((3, ), 0.95))
+    assert torch.allclose(second.data, torch.ones(3))
+
+
+@pytest.mark.skipif(
+    not hasattr(torch.amp, "GradScaler"), reason="no device agnostic scaler"
+)
+def test_grad_step_skipped_weight_decay():
+    param = torch.nn.Parameter(torch.ones(3))
+    optimizer = torch.optim.SGD([param], lr=0.5)
+    grad_scaler = torch.amp.GradScaler("cpu")
+    loss = (param * torch.tensor([1.0, float("inf"), 1.0])).sum()
+    grad_scaler.scale(loss).backward()
+
+    OptimizerCallback.grad_step(
+        optimizer=optimizer, optimizer_wd=0.1, grad_scaler=grad_scaler
+    )
+
+    assert torch.equal(param.data, torch.ones(3))
+
+
+def test_mixed_precision_cpu():
+    dtype = get_autocast_dtype(True, "cpu")
+    assert dtype == torch.bfloat16
+    assert create_grad_scaler("cpu", dtype) is None
+    assert get_autocast_dtype(False, "cpu") is None
+    with autocast("cpu", None):
+        assert not torch.is_autocast_enabled("cpu")
+
+    model = torch.nn.Linear(4, 2)
+    with autocast("cpu", dtype):
+        output = model(torch.randn(8, 4))
+        loss = torch.nn.functional.cross_entropy(
+            output, torch.zeros(8, dtype=torch.long)
+        )
+    assert output.dtype == torch.bfloat16
+    loss.backward()
+    assert model.weight.grad.dtype == torch.float32
@@ -0,0 +1,32 @@
+import pytest
+
+from ..experiments.runner import BatchPrefetcher
+
+
+def test_prefetcher_order():
+    prefetcher = BatchPrefetcher(
+        list(range(10)), batch_fn=lambda x: x * 2, num_batches=3
+    )
+
+    assert len(prefetcher) == 10
+    assert list(prefetcher) == [x * 2 for x in range(10)]
+
+
+def test_prefetcher_early_stop():
+    prefetcher = BatchPrefetcher(range(100), num_batches=2)
+
+    for i, batch in enumerate(prefetcher):
+        if i == 3:
+            break
+    assert batch == 3
+
+
+def test_prefetcher_error():
+    def batch_fn(x):
+        if x == 2:
+            raise ValueError("bad batch")
+        return x
+
+    prefetcher = BatchPrefetcher(range(5), batch_fn=batch_fn)
+    with pytest.raises(ValueError):
+        list(prefetcher)
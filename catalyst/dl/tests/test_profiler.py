@@ -0,0 +1,35 @@
+import json
+
+from ..profiler import Profiler, profile_span
+
+
+def test_profiler_spans(tmpdir):
+    profiler = Profiler(max_events=3)
+
+    for _ in range(2):
+        with profiler.span("batch", "loader"):
+            with profile_span(profiler, "forward"):
+                pass
+    profiler.start("loader")
+    profiler.start("batch")
+    profiler.start("data")
+    profiler.cancel("batch")
+    profiler.stop()
+
+    summary = {row["name"]: row for row in profiler.summary()}
+    assert summary["batch"]["count"] == 2
+    assert summary["forward"]["count"] == 2
+    assert "data" not in summary
+    assert summary["loader"]["count"] == 1
+    assert summary["batch"]["total_ms"] >= summary["forward"]["total_ms"]
+
+    filename = str(tmpdir / "trace.json")
+    profiler.export_chrome_trace(filename)
+    with open(filename) as fin:
+        events = json.load(fin)["traceEvents"]
+    assert len(events) == 3
+    assert "loader" not in [event["name"] for event in events]
+    assert all(event["ph"] == "X" for event in events)
+
+    with profile_span(None, "forward"):
+        pass
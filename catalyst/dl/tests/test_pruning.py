@@ -0,0 +1,119 @@
+from collections import OrderedDict
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from ..callbacks import PruningCallback
+from ..experiments import SupervisedExperiment, SupervisedRunner
+from ..pruning import TrialCoordinator
+
+
+def test_median_rule(tmpdir):
+    coordinator = TrialCoordinator(
+        storage=str(tmpdir.join("study.db")), min_trials=2
+    )
+    for epoch in range(1, 3):
+        for trial, value in enumerate([1.0, 2.0, 3.0]):
+            coordinator.report(str(trial), epoch, value / epoch)
+
+    # warmup epoch
+    assert not coordinator.should_prune("2", 1)
+    assert not coordinator.should_prune("0", 2)
+    assert not coordinator.should_prune("1", 2)
+    assert coordinator.should_prune("2", 2)
+
+
+def test_halving_rule(tmpdir):
+    coordinator = TrialCoordinator(
+        storage=str(tmpdir.join("study.db")),
+        rule="halving",
+        minimize=False,
+        reduction_factor=2
+    )
+    for trial, value in enumerate([0.1, 0.4, 0.3, 0.2]):
+        coordinator.report(str(trial), 1, value)
+        coordinator.report(str(trial), 3, value)
+
+    pruned = [coordinator.should_prune(str(i), 1) for i in range(4)]
+    assert pruned == [True, False, False, True]
+    # epoch 3 is not a rung for reduction factor 2
+    assert not coordinator.should_prune("0", 3)
+
+
+def test_pruning_callback(tmpdir):
+    storage = str(tmpdir.join("study.db"))
+    coordinator = TrialCoordinator(storage=storage)
+    for trial in range(4):
+        for epoch in range(1, 6):
+            coordinator.report(f"other_{trial}", epoch, 0.0, stage="train")
+
+    model = torch.nn.Linear(4, 1)
+    dataset = TensorDataset(torch.randn(8, 4), torch.randn(8, 1))
+    loaders = OrderedDict(
+        train=DataLoader(dataset, batch_size=4),
+        valid=DataLoader(dataset, batch_size=4)
+    )
+    SupervisedRunner().train(
+        model=model,
+        criterion=torch.nn.MSELoss(),
+        optimizer=torch.optim.SGD(model.parameters(), lr=0.0),
+        loaders=loaders,
+        logdir=str(tmpdir.join("logs")),
+        num_epochs=5,
+        callbacks=[PruningCallback(storage=storage, trial="trial")]
+    )
+
+    epochs = coordinator._query(
+        "SELECT epoch FROM trial_values WHERE trial = ?", ("trial", )
+    )
+    assert len(epochs) == 2
+
+
+class _TwoStageExperiment(SupervisedExperiment):
+    @property
+    def stages(self):
+        return ["stage1", "stage2"]
+
+
+def _run_two_stages(logdir, storage):
+    model = torch.nn.Linear(4, 1)
+    dataset = TensorDataset(torch.randn(8, 4), torch.randn(8, 1))
+    loaders = OrderedDict(
+        train=DataLoader(dataset, batch_size=4),
+        valid=DataLoader(dataset, batch_size=4)
+    )
+    experiment = _TwoStageExperiment(
+        model=model,
+        loaders=loaders,
+        callbacks=[PruningCallback(storage=storage, trial="trial")],
+        logdir=logdir,
+        criterion=torch.nn.MSELoss(),
+        optimizer=torch.optim.SGD(model.parameters(), lr=0.0),
+        num_epochs=3
+    )
+    SupervisedRunner().run_experiment(experiment)
+
+
+def test_pruning_stages(tmpdir):
+    storage = str(tmpdir.join("study.db"))
+    coordinator = TrialCoordinator(storage=storage)
+    query = "SELECT stage, epoch FROM trial_values WHERE trial = ?"
+
+    # epochs of every stage are reported separately
+    _run_two_stages(str(tmpdir.join("logs")), storage)
+    assert sorted(coordinator._query(query, ("trial", ))) == [
+        (stage, epoch) for stage in ["stage1", "stage2"]
+        for epoch in range(1, 4)
+    ]
+
+    storage = str(tmpdir.join("pruned.db"))
+    coordinator = TrialCoordinator(storage=storage)
+    for trial in range(4):
+        for epoch in range(1, 4):
+            coordinator.report(f"other_{trial}", epoch, 0.0, stage="stage1")
+
+    # the trial is pruned in the first stage, the second one is skipped
+    _run_two_stages(str(tmpdir.join("pruned")), storage)
+    assert sorted(coordinator._query(query, ("trial", ))) == [
+        ("stage1", 1), ("stage1", 2)
+    ]
@@ -0,0 +1,29 @@
+from ..callbacks import Callback
+from ..experiments import SupervisedRunner
+from ..state import RunnerState
+
+
+class BatchCounter(Callback):
+    def __init__(self):
+        self.batches = 0
+
+    def on_batch_end(self, state):
+        self.batches += 1
+
+
+def test_event_handlers():
+    runner = SupervisedRunner()
+    runner.state = RunnerState(profile_callbacks=True)
+    runner.callbacks = [Callback(), BatchCounter(), BatchCounter()]
+    runner._prepare_event_handlers()
+
+    _, handlers, _ = runner._event_handlers["batch_start"]
+    assert handlers == []
+
+    _, handlers, _ = runner._event_handlers["batch_end"]
+    assert [name for name, _ in handlers] == \
+        ["BatchCounter_0", "BatchCounter_1"]
+
+    for _, handler in handlers:
+        handler(runner.state)
+    assert all(callback.batches == 1 for callback in runner.callbacks[1:])
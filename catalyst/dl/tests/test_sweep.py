@@ -0,0 +1,34 @@
+import os
+import sys
+
+from ..scripts.sweep import expand_grid, get_core_groups, params_to_args, \
+    run_trial
+
+
+def test_expand_grid():
+    trials = expand_grid({
+        "stages/optimizer_params/lr": [0.1, 0.01],
+        "stages/data_params/batch_size": [16, 32, 64],
+        "model_params/arch": "resnet18",
+    })
+    assert len(trials) == 6
+    assert params_to_args(trials[0]) == [
+        "--stages/optimizer_params/lr=0.1:float",
+        "--stages/data_params/batch_size=16:int",
+        "--model_params/arch=resnet18:str",
+    ]
+
+
+def test_run_trial(tmpdir):
+    cores = get_core_groups(num_parallel=2)[1]
+    logfile = str(tmpdir.join("trial.log"))
+    command = [
+        sys.executable, "-c",
+        "import os; print(sorted(os.sched_getaffinity(0)), "
+        "os.environ['OMP_NUM_THREADS'])"
+    ]
+    assert run_trial(command, cores, logfile) == 0
+    with open(logfile) as fin:
+        output = fin.read()
+    if hasattr(os, "sched_setaffinity"):
+        assert output.strip() == f"{cores} {len(cores)}"
@@ -0,0 +1,118 @@
+import argparse
+import textwrap
+
+import yaml
+
+from .. import __main__ as main
+from ..experiments import ConfigExperiment
+from ..scripts import tune_loader
+from ..scripts.tune_loader import get_rss_mb, select_best
+from ...utils.config import parse_args_uargs
+
+_EXPERIMENT = """
+from collections import OrderedDict
+import torch
+from torch.utils.data import TensorDataset
+from catalyst.dl.experiments import ConfigExperiment, \\
+    SupervisedRunner as Runner
+
+
+class Experiment(ConfigExperiment):
+    def get_model(self, stage):
+        return torch.nn.Linear(4, 2)
+
+    def get_datasets(self, stage, **kwargs):
+        dataset = TensorDataset(
+            torch.randn(64, 4), torch.randint(0, 2, (64, ))
+        )
+        return OrderedDict(train=dataset, valid=dataset)
+"""
+
+_CONFIG = """
+model_params: {}
+stages:
+  # comments are kept
+  data_params:
+    batch_size: 16
+    num_workers: 0
+  criterion_params:
+    criterion: CrossEntropyLoss
+  optimizer_params:
+    optimizer: Adam
+  state_params:
+    num_epochs: 1
+  stage1:
+    data_params:
+      batch_size: 8
+    callbacks_params:
+      loss:
+        callback: LossCallback
+      optimizer:
+        callback: OptimizerCallback
+"""
+
+
+def test_arg_parser():
+    parser = main.build_parser()
+    args, _ = parser.parse_known_args([
+        "tune-loader",
+        "--config", "test.yml",
+        "--expdir", "exp",
+        "--batch-sizes", "32,64",
+    ])
+    assert args.command == "tune-loader"
+    assert args.batch_sizes == "32,64"
+
+
+def test_select_best():
+    results = [
+        {"samples_per_sec": 1000, "peak_rss_mb": 3000},
+        {"samples_per_sec": 980, "peak_rss_mb": 1000},
+        {"samples_per_sec": 900, "peak_rss_mb": 500},
+    ]
+    assert select_best(results, tolerance=0.05) is results[1]
+    assert select_best(results, tolerance=0.0) is results[0]
+
+
+def test_rss():
+    assert get_rss_mb() > 0
+
+
+def test_tune_loader(tmpdir):
+    expdir = tmpdir.mkdir("tune_exp")
+    expdir.join("__init__.py").write(_EXPERIMENT)
+    config_path = str(tmpdir.join("config.yml"))
+    with open(config_path, "w") as fout:
+        fout.write(textwrap.dedent(_CONFIG))
+
+    parser = argparse.ArgumentParser()
+    tune_loader.build_args(parser)
+    args = parser.parse_args([
+        "--config", config_path,
+        "--expdir", str(expdir),
+        "--batch-sizes", "4",
+        "--num-workers", "0",
+        "--num-batches", "2",
+        "--num-warmup-batches", "1",
+    ])
+    tune_loader.main(args, [])
+
+    with open(str(tmpdir.join("config.loader.yml"))) as fin:
+        override = yaml.safe_load(fin)
+    assert override == {
+        "stages": {"data_params": {"batch_size": 4, "num_workers": 0}}
+    }
+    with open(config_path) as fin:
+        assert "# comments are kept" in fin.read()
+
+    # the override wins over the stage data params
+    _, config = parse_args_uargs(
+        argparse.Namespace(
+            config=f"{config_path},{tmpdir.join('config.loader.yml')}",
+            logdir=str(tmpdir)
+        ), []
+    )
+    experiment = ConfigExperiment(config)
+    assert experiment.stages_config["stage1"]["data_params"] == {
+        "batch_size": 4, "num_workers": 0
+    }
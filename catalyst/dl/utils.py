@@ -2,6 +2,7 @@ from typing import List, Tuple
 
 import os
 import shutil
+import hashlib
 
 from collections import OrderedDict
 from tensorboardX import SummaryWriter
@@ -11,7 +12,9 @@ import torch.backends.cudnn as cudnn
 from torch.utils.data.dataloader import default_collate as default_collate_fn
 
 from catalyst.data.dataset import ListDataset
+from catalyst.utils.tensorboard import AsyncSummaryWriter
 from catalyst.dl.fp16 import Fp16Wrap
+from catalyst.dl.distributed import is_distributed
 
 
 class UtilsFactory:
@@ -21,6 +24,10 @@ class UtilsFactory:
         open_fn,
         dict_transform=None,
         dataset_cache_prob=-1,
+        dataset_cache_mode="local",
+        dataset_cache_size=None,
+        dataset_cache_spill_path=None,
+        dataset_cache_spill_size=None,
         sampler=None,
         collate_fn=default_collate_fn,
         batch_size=32,
@@ -32,7 +39,11 @@ class UtilsFactory:
             data_source,
             open_fn=open_fn,
             dict_transform=dict_transform,
-            cache_prob=dataset_cache_prob
+            cache_prob=dataset_cache_prob,
+            cache_mode=dataset_cache_mode,
+            cache_size=dataset_cache_size,
+            cache_spill_path=dataset_cache_spill_path,
+            cache_spill_size=dataset_cache_spill_size
         )
         loader = torch.utils.data.DataLoader(
             dataset=dataset,
@@ -47,9 +58,28 @@ class UtilsFactory:
         return loader
 
     @staticmethod
-    def create_tflogger(logdir: str, name: str) -> SummaryWriter:
+    def create_tflogger(
+        logdir: str,
+        name: str,
+        asynchronous: bool = False,
+        max_queue_size: int = 1000
+    ) -> SummaryWriter:
+        """
+        Creates tensorboard writer for ``{logdir}/{name}_log``
+
+        Args:
+            logdir (str): logs directory
+            name (str): writer name, e.g. loader name
+            asynchronous (bool): if True, returns ``AsyncSummaryWriter``
+                that writes events in a background thread
+            max_queue_size (int): maximum number of not written events
+                for the asynchronous writer
+        """
         log_dir = os.path.join(logdir, f"{name}_log")
-        logger = SummaryWriter(log_dir)
+        if asynchronous:
+            logger = AsyncSummaryWriter(log_dir, max_queue_size=max_queue_size)
+        else:
+            logger = SummaryWriter(log_dir)
         return logger
 
     @staticmethod
@@ -69,6 +99,8 @@ class UtilsFactory:
 
     @staticmethod
     def prepare_device() -> torch.device:
+        if is_distributed() and torch.cuda.is_available():
+            return torch.device("cuda", torch.cuda.current_device())
         return torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
     @staticmethod
@@ -78,13 +110,104 @@ class UtilsFactory:
         if torch.cuda.is_available():
             cudnn.benchmark = True
 
-        if torch.cuda.device_count() > 1 and not isinstance(model, Fp16Wrap):
+        if is_distributed():
+            model = nn.parallel.DistributedDataParallel(
+                model.to(device),
+                device_ids=[device.index] if device.type == "cuda" else None
+            )
+        elif torch.cuda.device_count() > 1 \
+                and not isinstance(model, Fp16Wrap):
             model = torch.nn.DataParallel(model).to(device)
         else:
             model = model.to(device)
 
         return model, device
 
+    @staticmethod
+    def compile_model(
+        model: nn.Module, example_input=None, mode: str = "trace"
+    ) -> torch.jit.ScriptModule:
+        """
+        Compiles model to TorchScript for inference
+        and freezes it (if ``torch.jit.freeze`` is available)
+
+        Args:
+            model (nn.Module): model to compile
+            example_input: model input for tracing
+            mode (str): "trace" or "script"
+
+        Returns:
+            torch.jit.ScriptModule: compiled model in eval mode
+        """
+        assert mode in ["trace", "script"], f"unknown jit mode: {mode}"
+        if isinstance(
+            model, (nn.DataParallel, nn.parallel.DistributedDataParallel)
+        ):
+            model = model.module
+
+        training = model.training
+        model.eval()
+        with torch.no_grad():
+            if mode == "trace":
+                jit_model = torch.jit.trace(model, example_input)
+            else:
+                jit_model = torch.jit.script(model)
+        model.train(training)
+
+        if hasattr(torch.jit, "freeze"):
+            jit_model = torch.jit.freeze(jit_model)
+        return jit_model
+
+    @staticmethod
+    def get_model_hash(model: nn.Module) -> str:
+        """
+        Returns digest of the model weights and buffers,
+        e.g. to find out which weights were actually loaded
+        """
+        if isinstance(
+            model, (nn.DataParallel, nn.parallel.DistributedDataParallel)
+        ):
+            model = model.module
+        digest = hashlib.sha1()
+        for key, value in model.state_dict().items():
+            value = value.detach().cpu().contiguous()
+            digest.update(f"{key}:{value.dtype}:{tuple(value.shape)}".encode())
+            digest.update(value.reshape(-1).view(torch.uint8).numpy())
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_jit_model(
+        model: nn.Module,
+        example_input=None,
+        mode: str = "trace",
+        cache_path: str = None,
+        device=None
+    ) -> torch.jit.ScriptModule:
+        """
+        Returns compiled and optimized for inference model,
+        compiled model is cached in ``cache_path``,
+        so the path should identify the model weights
+
+        Args:
+            model (nn.Module): model to compile
+            example_input: model input for tracing
+            mode (str): "trace" or "script"
+            cache_path (str): path to cache compiled model
+            device: device to load cached model to
+        """
+        if cache_path is not None and os.path.isfile(cache_path):
+            jit_model = torch.jit.load(cache_path, map_location=device)
+        else:
+            jit_model = UtilsFactory.compile_model(model, example_input, mode)
+            if cache_path is not None:
+                torch.jit.save(jit_model, f"{cache_path}.tmp")
+                os.replace(f"{cache_path}.tmp", cache_path)
+
+        # optimized graph can't be saved, so it is applied after loading
+        if hasattr(torch.jit, "optimize_for_inference"):
+            jit_model = torch.jit.optimize_for_inference(jit_model)
+        return jit_model
+
     @staticmethod
     def pack_checkpoint(
         model=None, criterion=None, optimizer=None, scheduler=None, **kwargs
@@ -95,7 +218,10 @@ class UtilsFactory:
             raise NotImplementedError()
         else:
             model_ = model
-            if isinstance(model_, nn.DataParallel):
+            if isinstance(
+                model_,
+                (nn.DataParallel, nn.parallel.DistributedDataParallel)
+            ):
                 model_ = model_.module
             if isinstance(model_, Fp16Wrap):
                 model_ = model_.network
@@ -126,7 +252,10 @@ class UtilsFactory:
         checkpoint, model=None, criterion=None, optimizer=None, scheduler=None
     ):
         if model is not None:
-            if isinstance(model, torch.nn.DataParallel):
+            if isinstance(
+                model,
+                (nn.DataParallel, nn.parallel.DistributedDataParallel)
+            ):
                 model = model.module
             if isinstance(model, Fp16Wrap):
                 model.network.load_state_dict(checkpoint["model_state_dict"])
@@ -149,17 +278,52 @@ class UtilsFactory:
                 name2load = f"{name2load}_state_dict"
                 dict2load.load_state_dict(checkpoint[name2load])
 
+    @staticmethod
+    def checkpoint_to_cpu(checkpoint):
+        """
+        Copies all tensors of the checkpoint to cpu,
+        so the checkpoint can be saved while the training goes on
+        """
+        if torch.is_tensor(checkpoint):
+            return checkpoint.detach().to("cpu", copy=True)
+        elif isinstance(checkpoint, dict):
+            return type(checkpoint)(
+                (key, UtilsFactory.checkpoint_to_cpu(value))
+                for key, value in checkpoint.items()
+            )
+        elif isinstance(checkpoint, (list, tuple)):
+            return type(checkpoint)(
+                UtilsFactory.checkpoint_to_cpu(value) for value in checkpoint
+            )
+        return checkpoint
+
+    @staticmethod
+    def link_checkpoint(src, dst):
+        """
+        Atomically replaces ``dst`` with a hardlink to ``src``,
+        falls back to copy if hardlinks are not supported
+        """
+        tmp = f"{dst}.tmp"
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+
     @staticmethod
     def save_checkpoint(
         logdir, checkpoint, suffix="", is_best=False, is_last=False
     ):
         os.makedirs(logdir, exist_ok=True)
         filename = f"{logdir}/{suffix}.pth"
-        torch.save(checkpoint, filename)
+        torch.save(checkpoint, f"{filename}.tmp")
+        os.replace(f"{filename}.tmp", filename)
         if is_best:
-            shutil.copyfile(filename, f"{logdir}/best.pth")
+            UtilsFactory.link_checkpoint(filename, f"{logdir}/best.pth")
         if is_last:
-            shutil.copyfile(filename, f"{logdir}/last.pth")
+            UtilsFactory.link_checkpoint(filename, f"{logdir}/last.pth")
         return filename
 
     @staticmethod
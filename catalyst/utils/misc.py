@@ -2,7 +2,7 @@ from typing import Iterable, Any, Optional
 
 import copy
 import random
-import collections
+import collections.abc
 import numpy as np
 import importlib.util
 from itertools import tee
@@ -51,7 +51,7 @@ def merge_dicts(*dicts: dict) -> dict:
         for k, v in merge_dict.items():
             if (
                 k in dict_ and isinstance(dict_[k], dict)
-                and isinstance(merge_dict[k], collections.Mapping)
+                and isinstance(merge_dict[k], collections.abc.Mapping)
             ):
                 dict_[k] = merge_dicts(dict_[k], merge_dict[k])
             else:
@@ -84,6 +84,48 @@ def set_global_seeds(seed: int) -> None:
     np.random.seed(seed)
 
 
+def get_rng_states() -> dict:
+    """
+    Returns states of PyTorch (cpu and cuda), Numpy and Random generators,
+    that can be saved to a checkpoint
+
+    Returns:
+        dict: generators states
+    """
+    import torch
+
+    np_state = np.random.get_state()
+    states = {
+        "python": random.getstate(),
+        # numpy arrays can't be loaded with ``torch.load(weights_only=True)``
+        "numpy": (np_state[0], np_state[1].tolist()) + tuple(np_state[2:]),
+        "torch": torch.get_rng_state(),
+    }
+    if torch.cuda.is_available():
+        states["torch_cuda"] = torch.cuda.get_rng_state_all()
+    return states
+
+
+def set_rng_states(states: dict) -> None:
+    """
+    Restores generators states, returned by ``get_rng_states``
+
+    Args:
+        states (dict): generators states
+    """
+    import torch
+
+    random.setstate(states["python"])
+    np_state = states["numpy"]
+    np.random.set_state(
+        (np_state[0], np.array(np_state[1], dtype=np.uint32))
+        + tuple(np_state[2:])
+    )
+    torch.set_rng_state(states["torch"])
+    if "torch_cuda" in states and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(states["torch_cuda"])
+
+
 def import_module(name: str, path: str):
     """
     Imports module by filepath
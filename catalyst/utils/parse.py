@@ -1,6 +1,7 @@
 from typing import List, Dict, Optional, Tuple, Union
 import pandas as pd
 
+from catalyst.data.columnar import ColumnarList
 from catalyst.utils.data import default_fold_split, stratified_fold_split
 from catalyst.utils.misc import args_are_not_none
 
@@ -21,6 +22,21 @@ def dataframe_to_list(dataframe: pd.DataFrame) -> List[dict]:
     return result
 
 
+def dataframe_to_columnar(dataframe: pd.DataFrame) -> ColumnarList:
+    """
+    Converts dataframe to a columnar list of rows (without indexes).
+    Unlike ``dataframe_to_list``, keeps data in a few numpy buffers,
+    shared read-only by all dataloader workers
+
+    Args:
+        dataframe (DataFrame): input dataframe
+    Returns:
+        (ColumnarList): list-like object with row dicts
+    """
+    result = ColumnarList.from_dataframe(dataframe)
+    return result
+
+
 def folds_to_list(folds: Union[list, str, pd.Series]) -> List[int]:
     """
     This function formats string or either list of numbers
@@ -218,6 +234,7 @@ def read_csv_data(
     tag2class: Optional[Dict[str, int]] = None,
     class_column: str = None,
     tag_column: str = None,
+    columnar: bool = False,
 ) -> Tuple[pd.DataFrame, List[dict], List[dict], List[dict]]:
     """
     From giving path ``in_csv`` reads a dataframe
@@ -253,6 +270,10 @@ def read_csv_data(
         tag_column (str): column with label names
         class_column (str): column to use for split
 
+        columnar (bool): if True, returns folds
+            as :class:`catalyst.data.columnar.ColumnarList`
+            instead of lists of dicts
+
     Returns:
         (Tuple[pd.DataFrame, List[dict], List[dict], List[dict]]):
             tuple with 4 elements
@@ -299,9 +320,10 @@ def read_csv_data(
         if "fold" in data.columns:
             del data["fold"]
 
+    to_list_fn = dataframe_to_columnar if columnar else dataframe_to_list
     result = (
-        dataframe, dataframe_to_list(df_train), dataframe_to_list(df_valid),
-        dataframe_to_list(df_infer)
+        dataframe, to_list_fn(df_train), to_list_fn(df_valid),
+        to_list_fn(df_infer)
     )
 
     return result
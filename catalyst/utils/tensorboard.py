@@ -0,0 +1,93 @@
+import queue
+import threading
+import time
+
+from tensorboardX import SummaryWriter
+
+
+class AsyncSummaryWriter:
+    """
+    Drop-in replacement for ``tensorboardX.SummaryWriter``,
+    that writes events in a background thread.
+
+    Calls of ``add_*`` methods are put to a bounded queue
+    and return immediately (if the queue is full, the caller waits),
+    ``flush`` and ``close`` wait until all queued events are written.
+    """
+
+    def __init__(
+        self, log_dir: str = None, max_queue_size: int = 1000, **kwargs
+    ):
+        """
+        Args:
+            log_dir (str): directory for the event files
+            max_queue_size (int): maximum number of not written events
+            **kwargs: ``SummaryWriter`` params
+        """
+        self.writer = SummaryWriter(log_dir, **kwargs)
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                method, args, kwargs = item
+                getattr(self.writer, method)(*args, **kwargs)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _put(self, method: str, args, kwargs):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        assert not self._closed, "writer is closed"
+        self._queue.put((method, args, kwargs))
+
+    def add_scalar(
+        self, tag, scalar_value, global_step=None, walltime=None, **kwargs
+    ):
+        walltime = walltime if walltime is not None else time.time()
+        self._put(
+            "add_scalar", (tag, scalar_value, global_step, walltime), kwargs
+        )
+
+    def __getattr__(self, name):
+        if name == "writer":
+            raise AttributeError(name)
+        attr = getattr(self.writer, name)
+        if not (callable(attr) and name.startswith("add_")):
+            return attr
+
+        def method(*args, **kwargs):
+            self._put(name, args, kwargs)
+
+        return method
+
+    def flush(self):
+        """Waits until all queued events are written to the disk"""
+        self._queue.join()
+        if hasattr(self.writer, "flush"):
+            self.writer.flush()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self.writer.close()
+
+
+__all__ = ["AsyncSummaryWriter"]
@@ -1,4 +1,7 @@
 import pytest
+import numpy as np
+import pandas as pd
+
 from catalyst.utils import parse
 
 
@@ -9,3 +12,23 @@ def test_folds_to_list():
 
     with pytest.raises(ValueError):
         parse.folds_to_list([1, "True", 3.0, None, 2, 1])
+
+
+def test_dataframe_to_columnar():
+    dataframe = pd.DataFrame({
+        "filepath": ["a.jpg", "b.jpg", None, "ы.jpg"],
+        "label": [0, 1, 2, 3],
+        "score": [0.5, 1.5, 2.5, float("nan")],
+    })
+    rows = parse.dataframe_to_list(dataframe)
+    columnar = parse.dataframe_to_columnar(dataframe)
+
+    assert len(columnar) == len(rows)
+    for row, columnar_row in zip(rows, columnar):
+        assert row.keys() == columnar_row.keys()
+        for key, value in row.items():
+            if isinstance(value, float) and np.isnan(value):
+                assert np.isnan(columnar_row[key])
+            else:
+                assert value == columnar_row[key]
+                assert type(value) is type(columnar_row[key])
@@ -0,0 +1,41 @@
+import os
+
+from ..tensorboard import AsyncSummaryWriter
+
+
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def add_scalar(self, tag, value, step=None, walltime=None):
+        self.calls.append((tag, value, step))
+
+    def add_text(self, tag, text, step=None):
+        self.calls.append((tag, text, step))
+
+    def close(self):
+        pass
+
+
+def test_async_summary_writer(tmpdir):
+    writer = AsyncSummaryWriter(str(tmpdir), max_queue_size=2)
+    writer.writer.close()
+    writer.writer = _Recorder()
+
+    for i in range(10):
+        writer.add_scalar("loss", float(i), i)
+    writer.add_text("note", "done", 10)
+    writer.flush()
+
+    assert writer.writer.calls[:10] == \
+        [("loss", float(i), i) for i in range(10)]
+    assert writer.writer.calls[-1] == ("note", "done", 10)
+    writer.close()
+
+
+def test_async_summary_writer_files(tmpdir):
+    writer = AsyncSummaryWriter(str(tmpdir))
+    writer.add_scalar("loss", 1.0, 0)
+    writer.close()
+
+    assert len(os.listdir(str(tmpdir))) == 1